@@ -16,13 +16,20 @@ This application does NOT:
 """
 
 import json
-from typing import Dict, Any
+import math
+from typing import Dict, Any, Optional
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; exports fall back to stdlib json
+    orjson = None
+
 from cura_frame import (
     CuraFrame,
     Candidate,
     EvaluationStatus,
+    Modifier,
     Severity,
 )
 from cura_frame.constraints_library import (
@@ -76,24 +83,141 @@ BUNDLES = {
     },
 }
 
+# Sidebar bundle descriptions, rendered once at import
+_BUNDLE_INFO_MD = {
+    name: (
+        f"**Description:** {info['description']}\n\n"
+        f"**Use for:** {info['targets']}"
+    )
+    for name, info in BUNDLES.items()
+}
+
+# Result display styling
+STATUS_COLOR = {
+    EvaluationStatus.ACCEPTED: "success",
+    EvaluationStatus.REJECTED: "error",
+    EvaluationStatus.INDETERMINATE: "warning"
+}
+
+STATUS_ICON = {
+    EvaluationStatus.ACCEPTED: "✅",
+    EvaluationStatus.REJECTED: "❌",
+    EvaluationStatus.INDETERMINATE: "⚠️"
+}
+
+SEVERITY_COLOR = {
+    Severity.CRITICAL: "🔴",
+    Severity.SEVERE: "🟠",
+    Severity.WARNING: "🟡"
+}
+
 # Population modifiers (examples)
+#
+# Modifiers are data (Modifier) rather than lambdas, so they can be
+# displayed and compared as well as applied.
 POPULATION_MODIFIERS = {
     "elderly": {
-        "hERG_IC50": lambda c: c.threshold * 1.5,
+        "hERG_IC50": Modifier("scale", 1.5),
         "description": "More conservative hERG threshold (QT risk increases with age)"
     },
     "asthmatic": {
-        "beta1_selectivity": lambda c: c.threshold * 2.0,
+        "beta1_selectivity": Modifier("scale", 2.0),
         "description": "Requires 200x β₁/β₂ selectivity (bronchoconstriction risk)"
     },
     "pediatric": {
-        "hERG_IC50": lambda c: c.threshold * 1.3,
-        "molecular_weight": lambda c: (c.threshold[0], c.threshold[1] * 0.9),
+        "hERG_IC50": Modifier("scale", 1.3),
+        "molecular_weight": Modifier("scale", 0.9, bound="upper"),
         "description": "Conservative safety margins for children"
     }
 }
 
 
+# -----------------------------
+# Framework construction
+# -----------------------------
+#
+# Bundle constraints are memoized by the constraint library, so building
+# a CuraFrame is cheap. A fresh framework per evaluation keeps each
+# session's evaluation history private, rather than accumulating every
+# user's candidates in one process-wide object.
+
+def _population_modifiers(population: str) -> Dict[str, Modifier]:
+    """Modifiers for one tabulated population (without its description)."""
+    return {
+        k: modifier
+        for k, modifier in POPULATION_MODIFIERS[population].items()
+        if k != "description"
+    }
+
+
+def _build_cura(bundle_name: str, population: Optional[str] = None) -> CuraFrame:
+    """Build a bundle framework, optionally with one population registered."""
+    fn = BUNDLES[bundle_name]["fn"]
+    cura = CuraFrame(fn(), name=f"CuraFrame::{bundle_name}")
+    if population:
+        cura.add_population(population, _population_modifiers(population))
+    return cura
+
+
+# -----------------------------
+# Cached export serialization
+# -----------------------------
+
+def _all_finite(obj: Any) -> bool:
+    """True if no float nested in obj is NaN or infinite."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    return True
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Indented JSON text, encoded with orjson when it is installed.
+
+    orjson writes NaN/Infinity as null and rejects integers beyond 64
+    bits, so those payloads go through the standard library instead.
+    """
+    if orjson is not None and _all_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# Export text is small but keyed by every distinct result a session
+# produces; keep a bounded, expiring set of the recent ones
+_EXPORT_CACHE = {"max_entries": 64, "ttl": 3600}
+
+
+@st.cache_data(**_EXPORT_CACHE)
+def _dump_result(payload: Dict[str, Any]) -> str:
+    """Serialize an evaluation export payload (memoized by content)."""
+    return _dumps(payload)
+
+
+@st.cache_data(**_EXPORT_CACHE)
+def _dump_constraints(bundle_name: str, population: Optional[str]) -> str:
+    """Serialize the constraint metadata of a bundle (memoized by bundle)."""
+    return _build_cura(bundle_name, population).export_constraints_json(indent=True)
+
+
+@st.cache_data(max_entries=8, ttl=3600)
+def _read_upload(file_id: str, _uploaded) -> str:
+    """
+    Decode an uploaded candidate file once per upload.
+
+    Keyed by the uploader's file_id; the file object itself is excluded
+    from hashing (leading underscore) so reruns do not rehash its bytes.
+    Only the few most recent uploads are kept, for at most an hour.
+    """
+    return _uploaded.getvalue().decode("utf-8")
+
+
 # -----------------------------
 # Header
 # -----------------------------
@@ -122,11 +246,7 @@ with st.sidebar:
     )
     
     # Show bundle description
-    bundle_info = BUNDLES[bundle_name]
-    st.info(
-        f"**Description:** {bundle_info['description']}\n\n"
-        f"**Use for:** {bundle_info['targets']}"
-    )
+    st.info(_BUNDLE_INFO_MD[bundle_name])
     
     st.markdown("---")
     
@@ -211,6 +331,10 @@ EXAMPLES = {
     }
 }
 
+# Pre-serialized example text (looked up on rerun, never re-encoded)
+_EXAMPLES_JSON = {name: _dumps(example) for name, example in EXAMPLES.items()}
+_DEFAULT_EXAMPLE_JSON = _EXAMPLES_JSON["Safe (passes core safety)"]
+
 
 # -----------------------------
 # Main interface: Input
@@ -229,27 +353,24 @@ with col_example:
     )
     
     if st.button("Load Example"):
-        st.session_state['candidate_json'] = json.dumps(
-            EXAMPLES[example_choice],
-            indent=2
-        )
+        st.session_state['candidate_json'] = _EXAMPLES_JSON[example_choice]
 
 with col_input:
     # Check if uploaded file exists
     if uploaded is not None:
         try:
-            candidate_text = uploaded.read().decode("utf-8")
+            candidate_text = _read_upload(uploaded.file_id, uploaded)
             st.success(f"Loaded: {uploaded.name}")
         except Exception as e:
             st.error(f"Could not read uploaded file: {e}")
             candidate_text = st.session_state.get(
                 'candidate_json',
-                json.dumps(EXAMPLES["Safe (passes core safety)"], indent=2)
+                _DEFAULT_EXAMPLE_JSON
             )
     else:
         candidate_text = st.session_state.get(
             'candidate_json',
-            json.dumps(EXAMPLES["Safe (passes core safety)"], indent=2)
+            _DEFAULT_EXAMPLE_JSON
         )
     
     candidate_text = st.text_area(
@@ -299,17 +420,12 @@ if evaluate_button:
             provenance=raw.get("provenance")
         )
         
-        # Build framework
-        constraints = bundle_info["fn"]()
-        cura = CuraFrame(constraints, name=f"CuraFrame::{bundle_name}")
-        
-        # Register population modifiers
+        # Build framework (fresh per evaluation; history stays per session)
         if use_population and population and population in POPULATION_MODIFIERS:
-            pop_mods = {
-                k: v for k, v in POPULATION_MODIFIERS[population].items()
-                if k != "description"
-            }
-            cura.add_population(population, pop_mods)
+            registered_population = population
+        else:
+            registered_population = None
+        cura = _build_cura(bundle_name, registered_population)
         
         # Evaluate
         pop_arg = population if use_population else None
@@ -320,20 +436,8 @@ if evaluate_button:
         st.header("📊 Evaluation Results")
         
         # Status banner
-        status_color = {
-            EvaluationStatus.ACCEPTED: "success",
-            EvaluationStatus.REJECTED: "error",
-            EvaluationStatus.INDETERMINATE: "warning"
-        }
-        
-        status_icon = {
-            EvaluationStatus.ACCEPTED: "✅",
-            EvaluationStatus.REJECTED: "❌",
-            EvaluationStatus.INDETERMINATE: "⚠️"
-        }
-        
         st.markdown(
-            f"### {status_icon[result.status]} Status: "
+            f"### {STATUS_ICON[result.status]} Status: "
             f"`{result.status.value.upper()}`"
         )
         
@@ -378,7 +482,7 @@ if evaluate_button:
             
             st.download_button(
                 "Download Results (JSON)",
-                data=json.dumps(export_data, indent=2),
+                data=_dump_result(export_data),
                 file_name=f"curaframe_result_{cand.name}.json",
                 mime="application/json",
                 use_container_width=True
@@ -387,7 +491,7 @@ if evaluate_button:
             # Export constraint metadata
             st.download_button(
                 "Download Constraints (JSON)",
-                data=json.dumps(cura.export_constraints(), indent=2),
+                data=_dump_constraints(bundle_name, registered_population),
                 file_name=f"curaframe_constraints_{bundle_name}.json",
                 mime="application/json",
                 use_container_width=True
@@ -399,14 +503,8 @@ if evaluate_button:
             st.subheader("🔴 Constraint Violations")
             
             for i, violation in enumerate(result.violations, 1):
-                severity_color = {
-                    Severity.CRITICAL: "🔴",
-                    Severity.SEVERE: "🟠",
-                    Severity.WARNING: "🟡"
-                }
-                
                 with st.expander(
-                    f"{severity_color[violation.severity]} "
+                    f"{SEVERITY_COLOR[violation.severity]} "
                     f"**{violation.constraint}** — "
                     f"{violation.severity.value.upper()}",
                     expanded=(i <= 3)  # Auto-expand first 3
@@ -509,54 +607,3 @@ st.caption(
     "Inspired by Krüger & Feeney (2025) — CardiAnx-1 Dual-Domain Concept | "
     "See `PHILOSOPHY.md` for framework principles"
 )
-```
-
-## Key Enhancements
-
-### 1. **Better UX**
-- Example candidates (safe, unsafe, CardiAnx-1 template)
-- Load examples with one click
-- Visual status indicators (✅❌⚠️)
-- Expandable violation details
-- Downloadable results and constraints
-
-### 2. **Population Modifiers**
-- Pre-defined population adjustments (elderly, asthmatic, pediatric)
-- Descriptions explain why modifiers are applied
-- Optional toggle to enable/disable
-
-### 3. **Enhanced Results Display**
-- Color-coded status banners
-- Detailed violation breakdowns with metrics
-- Severity icons (🔴🟠🟡)
-- Warnings section
-- Full constraint metadata viewer
-
-### 4. **Export Functionality**
-- Download evaluation results as JSON
-- Download constraint definitions for reproducibility
-- Timestamped filenames
-
-### 5. **Educational Content**
-- Philosophy panel explains CuraFrame principles
-- Usage guide for new users
-- Bundle descriptions with use cases
-- Inline help text throughout
-
-### 6. **Better Error Handling**
-- Graceful JSON parsing errors
-- File upload error handling
-- Exception display for debugging
-
-### 7. **Session State**
-- Preserves candidate JSON between runs
-- Allows iterative refinement
-
-## Usage Flow
-```
-1. User selects "CardiAnx Dual-Domain" bundle
-2. Clicks "Load Example" → "CardiAnx-1 Template"
-3. Optionally selects "asthmatic" population
-4. Clicks "Run Evaluation"
-5. Views violations with full context
-6. Downloads results for documentation
@@ -16,38 +16,62 @@ from .core import (
     Constraint,
     Provenance,
     Candidate,
+    CandidateTable,
     EvaluationResult,
     EvaluationStatus,
+    Modifier,
     Severity,
     Violation,
 )
 
 # Constraint library (explicit, opt-in usage)
-from .constraints_library import (
+#
+# Library symbols are resolved lazily (PEP 562) so that importing the
+# core engine does not also import every constraint factory.
+_LAZY_CONSTRAINTS_LIBRARY = frozenset({
     # Individual constraints
-    logP_max,
-    logP_range,
-    molecular_weight_range,
-    polar_surface_area_max,
-    hydrogen_bond_donors_max,
-    hydrogen_bond_acceptors_max,
-    hERG_ic50_min,
-    qtc_prolongation_risk_low,
-    beta1_over_beta2_selectivity_min,
-    serotonin_5ht1a_affinity_range,
-    off_target_5ht2a_avoidance,
-    dopamine_d2_avoidance,
-    plasma_half_life_range,
-    oral_bioavailability_min,
-    hepatic_clearance_max,
+    "logP_max",
+    "logP_range",
+    "molecular_weight_range",
+    "polar_surface_area_max",
+    "hydrogen_bond_donors_max",
+    "hydrogen_bond_acceptors_max",
+    "hERG_ic50_min",
+    "qtc_prolongation_risk_low",
+    "beta1_over_beta2_selectivity_min",
+    "serotonin_5ht1a_affinity_range",
+    "off_target_5ht2a_avoidance",
+    "dopamine_d2_avoidance",
+    "plasma_half_life_range",
+    "oral_bioavailability_min",
+    "hepatic_clearance_max",
 
     # Constraint bundles
-    core_safety_constraints,
-    lipinski_rule_of_five,
-    cns_drug_constraints,
-    cardiology_oriented_constraints,
-    cardiAnx_dual_domain_constraints,
-)
+    "core_safety_constraints",
+    "lipinski_rule_of_five",
+    "cns_drug_constraints",
+    "cardiology_oriented_constraints",
+    "cardiAnx_dual_domain_constraints",
+
+    # Opcode tables (require NumPy)
+    "lipinski_rule_of_five_soa",
+    "cns_drug_constraints_soa",
+    "cardiAnx_dual_domain_constraints_soa",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_CONSTRAINTS_LIBRARY:
+        from . import constraints_library
+        value = getattr(constraints_library, name)
+        globals()[name] = value  # Cache: later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_CONSTRAINTS_LIBRARY)
+
 
 __all__ = [
     # Core engine & primitives
@@ -55,8 +79,10 @@ __all__ = [
     "Constraint",
     "Provenance",
     "Candidate",
+    "CandidateTable",
     "EvaluationResult",
     "EvaluationStatus",
+    "Modifier",
     "Severity",
     "Violation",
 
@@ -83,4 +109,9 @@ __all__ = [
     "cns_drug_constraints",
     "cardiology_oriented_constraints",
     "cardiAnx_dual_domain_constraints",
+
+    # Opcode tables
+    "lipinski_rule_of_five_soa",
+    "cns_drug_constraints_soa",
+    "cardiAnx_dual_domain_constraints_soa",
 ]
@@ -0,0 +1,28 @@
+"""
+CuraFrame optional dependencies
+
+The core engine is pure Python. NumPy is only needed by the vectorized
+(batch) evaluation paths, and is imported on first use so that
+`import cura_frame` never pays for it.
+"""
+
+import functools
+import importlib
+from types import ModuleType
+
+
+@functools.lru_cache(maxsize=None)
+def require_numpy() -> ModuleType:
+    """
+    Return the numpy module, importing it on first use.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for vectorized evaluation.\n"
+            "Install it with: pip install numpy"
+        ) from e
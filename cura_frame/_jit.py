@@ -0,0 +1,46 @@
+"""
+CuraFrame JIT shim
+
+Numba is an optional accelerator for the numeric batch kernels in
+cura_frame._kernels. When it is installed, `njit` and `prange` are
+Numba's; otherwise `njit` is a no-op decorator, `prange` is `range`,
+and the kernels run as ordinary Python loops with identical results
+(a RuntimeWarning says so once, the first time a kernel runs).
+"""
+
+import functools
+import warnings
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional
+    HAS_NUMBA = False
+    prange = range
+    _warned = False
+
+    def _warn_once() -> None:
+        global _warned
+        if not _warned:
+            _warned = True
+            warnings.warn(
+                "Numba is not installed; CuraFrame kernels run as pure Python. "
+                "Install it with: pip install numba",
+                RuntimeWarning,
+                stacklevel=3
+            )
+
+    def _interpreted(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            _warn_once()
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return _interpreted(args[0])
+
+        return _interpreted
@@ -0,0 +1,109 @@
+"""
+CuraFrame numeric kernels
+
+Loop kernels behind the batch comparators. They take contiguous float64
+arrays, write into a caller-provided output buffer, and are compiled
+with Numba when it is available (see cura_frame._jit).
+
+Kernel semantics must match the scalar comparators exactly; the scalar
+functions in cura_frame.comparators remain the reference definition.
+
+This module imports NumPy-dependent tooling and is only imported lazily
+by the batch entrypoints.
+"""
+
+from ._jit import njit, prange
+from .comparators import OP_LE, OP_GE, OP_RANGE, OP_RATIO_GT, OP_LT, OP_GT
+
+
+@njit(
+    "b1[:](f8[:, :], f8[:], f8, b1[:])",
+    cache=True,
+    parallel=True,
+    nogil=True,
+)
+def probabilistic_satisfaction_rows(rows, thresholds, confidence_level, out):
+    """Row-wise probabilistic_satisfaction over (nominal, lower, upper) rows."""
+    for i in prange(rows.shape[0]):
+        lower = rows[i, 1]
+        upper = rows[i, 2]
+        threshold = thresholds[i]
+        if upper <= threshold:
+            out[i] = True
+        elif lower > threshold:
+            out[i] = False
+        else:
+            out[i] = (threshold - lower) / (upper - lower) >= confidence_level
+    return out
+
+
+@njit("b1[:](f8[:, :], f8[:], b1[:])", cache=True, parallel=True, nogil=True)
+def conservative_upper_bound_rows(rows, thresholds, out):
+    """Row-wise conservative_upper_bound; non-finite upper bounds fail."""
+    for i in prange(rows.shape[0]):
+        upper = rows[i, 2]
+        out[i] = abs(upper) < float("inf") and upper <= thresholds[i]
+    return out
+
+
+@njit("b1[:](f8[:, :], f8[:], b1[:])", cache=True, parallel=True, nogil=True)
+def conservative_lower_bound_rows(rows, thresholds, out):
+    """Row-wise conservative_lower_bound; non-finite lower bounds fail."""
+    for i in prange(rows.shape[0]):
+        lower = rows[i, 1]
+        out[i] = abs(lower) < float("inf") and lower >= thresholds[i]
+    return out
+
+
+@njit("b1[:](f8[:], f8, f8, b1[:])", cache=True, parallel=True, nogil=True)
+def within_tolerance_values(values, target, actual_tolerance, out):
+    """Element-wise within_tolerance against a resolved absolute tolerance."""
+    for i in prange(values.shape[0]):
+        out[i] = abs(values[i] - target) <= actual_tolerance
+    return out
+
+
+@njit("b1[:](f8[:], f8, f8, b1[:])", cache=True, parallel=True, nogil=True)
+def approximately_equal_values(values, target, epsilon, out):
+    """Element-wise approximately_equal_to_scalar."""
+    for i in prange(values.shape[0]):
+        out[i] = abs(values[i] - target) < epsilon
+    return out
+
+
+@njit(
+    "b1[:](f8[:], i8, f8, f8, b1[:])",
+    cache=True,
+    parallel=True,
+    nogil=True,
+    error_model="numpy",
+)
+def threshold_values(values, opcode, lo, hi, out):
+    """
+    Element-wise comparison selected by opcode (see comparators.OPCODES).
+
+    lo/hi are the bounds from comparators.opcode_bounds(). Each opcode
+    runs its own loop so the branch stays outside the hot path.
+    """
+    n = values.shape[0]
+    if out.shape[0] != n:
+        raise ValueError("out must have the same length as values")
+    if opcode == OP_LE:
+        for i in prange(n):
+            out[i] = values[i] <= hi
+    elif opcode == OP_GE:
+        for i in prange(n):
+            out[i] = values[i] >= lo
+    elif opcode == OP_LT:
+        for i in prange(n):
+            out[i] = values[i] < hi
+    elif opcode == OP_GT:
+        for i in prange(n):
+            out[i] = values[i] > lo
+    elif opcode == OP_RANGE:
+        for i in prange(n):
+            out[i] = lo <= values[i] <= hi
+    elif opcode == OP_RATIO_GT:
+        for i in prange(n):
+            out[i] = abs(values[i]) < float("inf") and values[i] > lo
+    return out
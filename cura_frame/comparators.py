@@ -14,9 +14,15 @@ All functions in this module are:
 - Domain-agnostic (usable for any constraint type)
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass
 from typing import Any, Tuple, Callable, Union
+import functools
 import math
 
+from ._compat import require_numpy
+
 
 # -----------------------------
 # Basic scalar comparators
@@ -88,6 +94,48 @@ def not_equal_to(value: Any, threshold: Any) -> bool:
 # -----------------------------
 # Floating-point aware comparators
 # -----------------------------
+#
+# Each comparator below accepts either a bare threshold or a
+# (threshold, epsilon) tuple. The *_scalar functions are the underlying
+# kernels with epsilon as an explicit argument; callers that already
+# know both numbers can bind to them and skip the per-call dispatch.
+
+def approximately_equal_to_scalar(
+    value: float,
+    target: float,
+    epsilon: float = 1e-9
+) -> bool:
+    """True if |value - target| < epsilon."""
+    return math.fabs(value - target) < epsilon
+
+
+def significantly_greater_than_scalar(
+    value: float,
+    limit: float,
+    epsilon: float = 1e-9
+) -> bool:
+    """True if value > limit + epsilon."""
+    return value > (limit + epsilon)
+
+
+def significantly_less_than_scalar(
+    value: float,
+    limit: float,
+    epsilon: float = 1e-9
+) -> bool:
+    """True if value < limit - epsilon."""
+    return value < (limit - epsilon)
+
+
+def significantly_greater_than_prebaked(value: float, adjusted: float) -> bool:
+    """significantly_greater_than with adjusted = limit + epsilon precomputed."""
+    return value > adjusted
+
+
+def significantly_less_than_prebaked(value: float, adjusted: float) -> bool:
+    """significantly_less_than with adjusted = limit - epsilon precomputed."""
+    return value < adjusted
+
 
 def approximately_equal_to(
     value: float,
@@ -110,12 +158,8 @@ def approximately_equal_to(
         False
     """
     if isinstance(threshold, tuple):
-        target, epsilon = threshold
-    else:
-        target = threshold
-        epsilon = 1e-9  # Default tolerance
-    
-    return abs(value - target) < epsilon
+        return approximately_equal_to_scalar(value, *threshold)
+    return approximately_equal_to_scalar(value, threshold)
 
 
 def significantly_greater_than(
@@ -133,12 +177,8 @@ def significantly_greater_than(
         True if value significantly exceeds threshold
     """
     if isinstance(threshold, tuple):
-        limit, epsilon = threshold
-    else:
-        limit = threshold
-        epsilon = 1e-9
-    
-    return value > (limit + epsilon)
+        return significantly_greater_than_scalar(value, *threshold)
+    return significantly_greater_than_scalar(value, threshold)
 
 
 def significantly_less_than(
@@ -156,18 +196,34 @@ def significantly_less_than(
         True if value significantly below threshold
     """
     if isinstance(threshold, tuple):
-        limit, epsilon = threshold
-    else:
-        limit = threshold
-        epsilon = 1e-9
-    
-    return value < (limit - epsilon)
+        return significantly_less_than_scalar(value, *threshold)
+    return significantly_less_than_scalar(value, threshold)
 
 
 # -----------------------------
 # Range-based comparators
 # -----------------------------
 
+def validate_bounds(bounds: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Check that (min_value, max_value) bounds are ordered.
+
+    Intended to be called once, when a range constraint is built.
+
+    Returns:
+        The bounds, unchanged
+
+    Raises:
+        ValueError: If bounds are invalid (min > max)
+    """
+    lower, upper = bounds
+
+    if lower > upper:
+        raise ValueError(f"Invalid bounds: lower ({lower}) > upper ({upper})")
+
+    return bounds
+
+
 def within_range(
     value: float,
     bounds: Tuple[float, float],
@@ -184,8 +240,14 @@ def within_range(
     Returns:
         True if value lies within bounds
     
-    Raises:
-        ValueError: If bounds are invalid (min > max)
+    Notes:
+        NaN values fail (IEEE-754 comparisons with NaN are False), and so
+        does every value when min > max: inverted bounds reject silently
+        rather than raising ValueError as earlier versions did. Bounds are
+        not re-validated on each call, so when building
+        Constraint(..., comparator=within_range) by hand, pass the bounds
+        through validate_bounds() once to catch mistakes early (the
+        library's range factories already do).
     
     Examples:
         >>> within_range(5.0, (1.0, 10.0))
@@ -195,12 +257,6 @@ def within_range(
     """
     lower, upper = bounds
     
-    if lower > upper:
-        raise ValueError(f"Invalid bounds: lower ({lower}) > upper ({upper})")
-    
-    if math.isnan(value):
-        return False
-    
     if inclusive:
         return lower <= value <= upper
     return lower < value < upper
@@ -224,12 +280,20 @@ def outside_range(
     Returns:
         True if value lies outside bounds
     
+    Raises:
+        ValueError: If bounds are invalid (min > max)
+    
+    Notes:
+        Unlike within_range, bounds are validated on every call: with
+        inverted bounds every value would otherwise count as "outside".
+    
     Examples:
         >>> outside_range(15.0, (1.0, 10.0))
         True
         >>> outside_range(5.0, (1.0, 10.0))
         False
     """
+    validate_bounds(bounds)
     return not within_range(value, bounds, inclusive=inclusive)
 
 
@@ -258,16 +322,64 @@ def within_tolerance(
         False
     """
     if relative:
-        actual_tolerance = abs(target * tolerance)
+        actual_tolerance = math.fabs(target * tolerance)
     else:
         actual_tolerance = tolerance
     
-    return abs(value - target) <= actual_tolerance
+    return math.fabs(value - target) <= actual_tolerance
+
+
+def within_tolerance_prebaked(
+    value: float,
+    target: float,
+    actual_tolerance: float
+) -> bool:
+    """
+    within_tolerance with the absolute tolerance already resolved
+    (abs(target * tolerance) for relative tolerances).
+    """
+    return math.fabs(value - target) <= actual_tolerance
 
 
 # -----------------------------
 # Ratio and selectivity
 # -----------------------------
+#
+# As above, the *_scalar kernels take epsilon explicitly.
+
+def ratio_greater_than_scalar(
+    ratio: float,
+    required_ratio: float,
+    epsilon: float = 0.0
+) -> bool:
+    """True if ratio is finite and ratio > required_ratio + epsilon."""
+    if not math.isfinite(ratio):
+        return False
+
+    return ratio > (required_ratio + epsilon)
+
+
+def ratio_less_than_scalar(
+    ratio: float,
+    max_ratio: float,
+    epsilon: float = 0.0
+) -> bool:
+    """True if ratio is finite and ratio < max_ratio - epsilon."""
+    if not math.isfinite(ratio):
+        return False
+
+    return ratio < (max_ratio - epsilon)
+
+
+def ratio_greater_than_prebaked(ratio: float, adjusted: float) -> bool:
+    """ratio_greater_than with adjusted = required_ratio + epsilon precomputed."""
+    return math.isfinite(ratio) and ratio > adjusted
+
+
+def ratio_less_than_prebaked(ratio: float, adjusted: float) -> bool:
+    """ratio_less_than with adjusted = max_ratio - epsilon precomputed."""
+    return math.isfinite(ratio) and ratio < adjusted
+
 
 def ratio_greater_than(
     ratio: float,
@@ -295,15 +407,8 @@ def ratio_greater_than(
         False
     """
     if isinstance(threshold, tuple):
-        required_ratio, epsilon = threshold
-    else:
-        required_ratio = threshold
-        epsilon = 0.0
-    
-    if math.isnan(ratio) or math.isinf(ratio):
-        return False
-    
-    return ratio > (required_ratio + epsilon)
+        return ratio_greater_than_scalar(ratio, *threshold)
+    return ratio_greater_than_scalar(ratio, threshold)
 
 
 def ratio_less_than(
@@ -325,17 +430,91 @@ def ratio_less_than(
         True
     """
     if isinstance(threshold, tuple):
-        max_ratio, epsilon = threshold
+        return ratio_less_than_scalar(ratio, *threshold)
+    return ratio_less_than_scalar(ratio, threshold)
+
+
+def prebake(
+    comparator: Callable[[Any, Any], bool],
+    threshold: Any
+) -> Tuple[Callable[[Any, Any], bool], Any]:
+    """
+    Resolve an epsilon-adjusted threshold once, at constraint-build time.
+
+    For ratio_greater_than, ratio_less_than, significantly_greater_than
+    and significantly_less_than this returns the matching *_prebaked
+    kernel together with the adjusted threshold, so that
+    kernel(value, adjusted) == comparator(value, threshold). Any other
+    comparator is returned unchanged with its threshold.
+
+    Examples:
+        >>> kernel, adjusted = prebake(ratio_greater_than, (100.0, 0.5))
+        >>> adjusted
+        100.5
+    """
+    entry = _PREBAKED.get(comparator)
+    if entry is None:
+        return comparator, threshold
+
+    kernel, sign, default_epsilon = entry
+    if isinstance(threshold, tuple):
+        limit, epsilon = threshold
     else:
-        max_ratio = threshold
-        epsilon = 0.0
-    
-    if math.isnan(ratio) or math.isinf(ratio):
-        return False
-    
-    return ratio < (max_ratio - epsilon)
+        limit, epsilon = threshold, default_epsilon
+    return kernel, limit + sign * epsilon
 
 
+# comparator -> (prebaked kernel, epsilon sign, default epsilon)
+_PREBAKED = {
+    ratio_greater_than: (ratio_greater_than_prebaked, 1, 0.0),
+    ratio_less_than: (ratio_less_than_prebaked, -1, 0.0),
+    significantly_greater_than: (significantly_greater_than_prebaked, 1, 1e-9),
+    significantly_less_than: (significantly_less_than_prebaked, -1, 1e-9),
+}
+
+
+def make_ratio_greater_than(
+    threshold: Union[float, Tuple[float, float]]
+) -> Callable[[float], bool]:
+    """
+    Bind a ratio_greater_than threshold once, returning a 1-arg predicate.
+
+    The threshold form is resolved and required_ratio + epsilon is
+    computed here (see prebake), so each call is a finiteness check and
+    one compare.
+
+    Examples:
+        >>> at_least_100x = make_ratio_greater_than((100.0, 0.1))
+        >>> at_least_100x(150.0)
+        True
+    """
+    _, cutoff = prebake(ratio_greater_than, threshold)
+
+    def _ratio_greater_than(ratio: float) -> bool:
+        return math.isfinite(ratio) and ratio > cutoff
+
+    _ratio_greater_than.__name__ = f"ratio_greater_than({threshold!r})"
+    return _ratio_greater_than
+
+
+def make_ratio_less_than(
+    threshold: Union[float, Tuple[float, float]]
+) -> Callable[[float], bool]:
+    """
+    Bind a ratio_less_than threshold once, returning a 1-arg predicate.
+
+    See make_ratio_greater_than.
+    """
+    _, cutoff = prebake(ratio_less_than, threshold)
+
+    def _ratio_less_than(ratio: float) -> bool:
+        return math.isfinite(ratio) and ratio < cutoff
+
+    _ratio_less_than.__name__ = f"ratio_less_than({threshold!r})"
+    return _ratio_less_than
+
+
+@functools.lru_cache(maxsize=4096)
 def selectivity_satisfied(
     Kd_ontarget: float,
     Kd_offtarget: float,
@@ -355,11 +534,14 @@ def selectivity_satisfied(
     Notes:
         For pharmacology: higher Kd = weaker binding.
         A 100x selective drug has Kd_offtarget = 100 × Kd_ontarget.
+        Results are memoized: ranking runs re-check the same
+        (Kd_ontarget, Kd_offtarget, min_selectivity) triples many times.
+        Invalid inputs are not cached and raise on every call.
     
     Examples:
-        >>> selectivity_satisfied(1e-9, 100e-9, 100.0)  # 100x selective
+        >>> selectivity_satisfied(1.0, 100.0, 100.0)  # 100x selective
         True
-        >>> selectivity_satisfied(1e-9, 50e-9, 100.0)   # Only 50x, fails
+        >>> selectivity_satisfied(1.0, 50.0, 100.0)   # Only 50x, fails
         False
     """
     if Kd_ontarget <= 0 or Kd_offtarget <= 0:
@@ -402,7 +584,7 @@ def conservative_upper_bound(
     """
     _, _, upper = value_with_uncertainty
     
-    if math.isnan(upper) or math.isinf(upper):
+    if not math.isfinite(upper):
         return False
     
     return upper <= threshold
@@ -437,7 +619,7 @@ def conservative_lower_bound(
     """
     _, lower, _ = value_with_uncertainty
     
-    if math.isnan(lower) or math.isinf(lower):
+    if not math.isfinite(lower):
         return False
     
     return lower >= threshold
@@ -508,16 +690,219 @@ def probabilistic_satisfaction(
     return prob_satisfied >= confidence_level
 
 
+# Batch kernels (compiled with Numba when available; see cura_frame._kernels)
+
+def _uncertainty_rows(values_with_uncertainty: Any):
+    np = require_numpy()
+    rows = np.ascontiguousarray(values_with_uncertainty, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != 3:
+        raise ValueError(
+            f"Expected an (N, 3) array of (nominal, lower, upper), got shape {rows.shape}"
+        )
+    return rows
+
+
+def _per_row(thresholds: Any, n: int):
+    np = require_numpy()
+    return np.ascontiguousarray(
+        np.broadcast_to(np.asarray(thresholds, dtype=np.float64), (n,))
+    )
+
+
+def _bool_out(out: Any, n: int):
+    """
+    Allocate, or validate, the bool output buffer for a batch kernel.
+
+    The compiled kernels write out[i] for every row without bounds
+    checks, so a caller-supplied buffer must match exactly.
+    """
+    np = require_numpy()
+    if out is None:
+        return np.empty(n, dtype=bool)
+    if not isinstance(out, np.ndarray) or out.dtype != np.bool_ or out.shape != (n,):
+        raise ValueError(
+            f"Expected a bool out array of shape ({n},), got "
+            f"{getattr(out, 'dtype', type(out).__name__)} with shape "
+            f"{getattr(out, 'shape', None)}"
+        )
+    return out
+
+
+def conservative_upper_bound_batch(
+    values_with_uncertainty: Any,
+    thresholds: Any,
+    out: Any = None
+):
+    """
+    Row-wise conservative_upper_bound over an (N, 3) array of
+    (nominal, lower, upper) rows. Requires NumPy.
+    """
+    from ._kernels import conservative_upper_bound_rows
+
+    rows = _uncertainty_rows(values_with_uncertainty)
+    n = rows.shape[0]
+    return conservative_upper_bound_rows(rows, _per_row(thresholds, n), _bool_out(out, n))
+
+
+def conservative_lower_bound_batch(
+    values_with_uncertainty: Any,
+    thresholds: Any,
+    out: Any = None
+):
+    """
+    Row-wise conservative_lower_bound over an (N, 3) array of
+    (nominal, lower, upper) rows. Requires NumPy.
+    """
+    from ._kernels import conservative_lower_bound_rows
+
+    rows = _uncertainty_rows(values_with_uncertainty)
+    n = rows.shape[0]
+    return conservative_lower_bound_rows(rows, _per_row(thresholds, n), _bool_out(out, n))
+
+
+def probabilistic_satisfaction_batch(
+    values_with_uncertainty: Any,
+    thresholds: Any,
+    confidence_level: float = 0.95,
+    out: Any = None
+):
+    """
+    Row-wise probabilistic_satisfaction for many candidates at once.
+
+    Runs a compiled loop kernel when Numba is installed, and the same
+    loop in Python otherwise. Requires NumPy.
+
+    Args:
+        values_with_uncertainty: (N, 3) array of (nominal, lower, upper) rows
+        thresholds: Maximum allowed value, scalar or one per row
+        confidence_level: Required probability of satisfaction (0-1)
+        out: Optional preallocated bool array of length N
+
+    Returns:
+        Bool ndarray; element i equals
+        probabilistic_satisfaction(row_i, threshold_i, confidence_level)
+    """
+    from ._kernels import probabilistic_satisfaction_rows
+
+    rows = _uncertainty_rows(values_with_uncertainty)
+    n = rows.shape[0]
+    return probabilistic_satisfaction_rows(
+        rows, _per_row(thresholds, n), float(confidence_level), _bool_out(out, n)
+    )
+
+
+def approximately_equal_to_batch(
+    values: Any,
+    threshold: Union[float, Tuple[float, float]],
+    out: Any = None
+):
+    """
+    Element-wise approximately_equal_to as a single fused loop.
+
+    The compiled kernel releases the GIL, so threads may run it
+    concurrently on separate arrays. Requires NumPy.
+    """
+    from ._kernels import approximately_equal_values
+
+    np = require_numpy()
+    values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+    if isinstance(threshold, tuple):
+        target, epsilon = threshold
+    else:
+        target, epsilon = threshold, 1e-9
+    return approximately_equal_values(
+        values, float(target), float(epsilon), _bool_out(out, values.shape[0])
+    )
+
+
+def within_tolerance_batch(
+    values: Any,
+    target: float,
+    tolerance: float,
+    relative: bool = False,
+    out: Any = None
+):
+    """
+    Element-wise within_tolerance as a single fused loop. Requires NumPy.
+    """
+    from ._kernels import within_tolerance_values
+
+    np = require_numpy()
+    values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+    actual_tolerance = math.fabs(target * tolerance) if relative else tolerance
+    return within_tolerance_values(
+        values, float(target), float(actual_tolerance), _bool_out(out, values.shape[0])
+    )
+
+
 # -----------------------------
 # Logical combinators
 # -----------------------------
+#
+# Combinator factories are memoized on their (hashable) arguments:
+# combining the same comparators again returns the same function object,
+# so constraints built in a loop share one closure and compare equal.
+# Unhashable comparators (e.g. callables with __hash__ = None) are
+# combined uncached.
+
+
+def _memoized_factory(factory: Callable[..., Any]) -> Callable[..., Any]:
+    """Bounded lru_cache for a combinator factory, bypassed for unhashable args."""
+    cached = functools.lru_cache(maxsize=256)(factory)
+
+    @functools.wraps(factory)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return factory(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+def _combinator_name(kind: str, comparators: Tuple[Callable, ...]) -> str:
+    """Descriptive __name__ for a combined comparator, e.g. 'all_of(a, b)'."""
+    names = (getattr(c, "__name__", type(c).__name__) for c in comparators)
+    return f"{kind}({', '.join(names)})"
+
+
+def _memoize_results(
+    combined: Callable[[Any, Any], bool],
+    cache_size: int
+) -> Callable[[Any, Any], bool]:
+    """
+    Bounded LRU memo of a combinator's results, for sweeps that re-test
+    the same (value, threshold) pairs. Unhashable inputs bypass the memo.
+    """
+    cached = functools.lru_cache(maxsize=cache_size, typed=True)(combined)
+
+    def _memoized(value: Any, threshold: Any) -> bool:
+        try:
+            hash((value, threshold))
+        except TypeError:
+            return combined(value, threshold)
+        return cached(value, threshold)
 
-def all_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    _memoized.__name__ = combined.__name__
+    _memoized.cache_info = cached.cache_info
+    _memoized.cache_clear = cached.cache_clear
+    return _memoized
+
+
+@_memoized_factory
+def all_of(
+    *comparators: Callable[[Any, Any], bool],
+    cache_size: int = 0
+) -> Callable[[Any, Any], bool]:
     """
     Combine multiple comparator functions using logical AND.
     
     Args:
         *comparators: Variable number of comparator functions
+        cache_size: If > 0, memoize up to this many (value, threshold)
+            results (see _memoize_results)
     
     Returns:
         A comparator that returns True only if ALL comparators pass.
@@ -530,19 +915,41 @@ def all_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], boo
     Notes:
         Short-circuits on first False (efficient for expensive checks).
     """
-    def _combined(value: Any, threshold: Any) -> bool:
-        return all(comp(value, threshold) for comp in comparators)
+    # Common arities get straight-line closures (no generator per call)
+    if len(comparators) == 2:
+        c0, c1 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return True if c0(value, threshold) and c1(value, threshold) else False
+    elif len(comparators) == 3:
+        c0, c1, c2 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return True if (
+                c0(value, threshold) and c1(value, threshold) and c2(value, threshold)
+            ) else False
+    else:
+        def _combined(value: Any, threshold: Any) -> bool:
+            return all(comp(value, threshold) for comp in comparators)
     
-    _combined.__name__ = f"all_of({', '.join(c.__name__ for c in comparators)})"
+    _combined.__name__ = _combinator_name("all_of", comparators)
+    if cache_size:
+        return _memoize_results(_combined, cache_size)
     return _combined
 
 
-def any_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+@_memoized_factory
+def any_of(
+    *comparators: Callable[[Any, Any], bool],
+    cache_size: int = 0
+) -> Callable[[Any, Any], bool]:
     """
     Combine multiple comparator functions using logical OR.
     
     Args:
         *comparators: Variable number of comparator functions
+        cache_size: If > 0, memoize up to this many (value, threshold)
+            results (see _memoize_results)
     
     Returns:
         A comparator that returns True if ANY comparator passes.
@@ -555,19 +962,41 @@ def any_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], boo
     Notes:
         Short-circuits on first True.
     """
-    def _combined(value: Any, threshold: Any) -> bool:
-        return any(comp(value, threshold) for comp in comparators)
+    # Common arities get straight-line closures (no generator per call)
+    if len(comparators) == 2:
+        c0, c1 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return True if c0(value, threshold) or c1(value, threshold) else False
+    elif len(comparators) == 3:
+        c0, c1, c2 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return True if (
+                c0(value, threshold) or c1(value, threshold) or c2(value, threshold)
+            ) else False
+    else:
+        def _combined(value: Any, threshold: Any) -> bool:
+            return any(comp(value, threshold) for comp in comparators)
     
-    _combined.__name__ = f"any_of({', '.join(c.__name__ for c in comparators)})"
+    _combined.__name__ = _combinator_name("any_of", comparators)
+    if cache_size:
+        return _memoize_results(_combined, cache_size)
     return _combined
 
 
-def none_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+@_memoized_factory
+def none_of(
+    *comparators: Callable[[Any, Any], bool],
+    cache_size: int = 0
+) -> Callable[[Any, Any], bool]:
     """
     Combine multiple comparator functions using logical NOR.
     
     Args:
         *comparators: Variable number of comparator functions
+        cache_size: If > 0, memoize up to this many (value, threshold)
+            results (see _memoize_results)
     
     Returns:
         A comparator that returns True only if NO comparators pass.
@@ -577,17 +1006,87 @@ def none_of(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bo
         >>> combined(15, (10, 20))  # Within [10, 20], so neither < 10 nor > 20
         False
     """
-    def _combined(value: Any, threshold: Any) -> bool:
-        return not any(comp(value, threshold) for comp in comparators)
+    # Common arities get straight-line closures (no generator per call)
+    if len(comparators) == 2:
+        c0, c1 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return not (c0(value, threshold) or c1(value, threshold))
+    elif len(comparators) == 3:
+        c0, c1, c2 = comparators
+
+        def _combined(value: Any, threshold: Any) -> bool:
+            return not (
+                c0(value, threshold) or c1(value, threshold) or c2(value, threshold)
+            )
+    else:
+        def _combined(value: Any, threshold: Any) -> bool:
+            return not any(comp(value, threshold) for comp in comparators)
     
-    _combined.__name__ = f"none_of({', '.join(c.__name__ for c in comparators)})"
+    _combined.__name__ = _combinator_name("none_of", comparators)
+    if cache_size:
+        return _memoize_results(_combined, cache_size)
+    return _combined
+
+
+# Operator comparators whose body can be inlined into generated code.
+# Everything else is called by reference from the generated function.
+_INLINE_EXPRESSIONS = {
+    less_than: "value < threshold",
+    less_than_or_equal: "value <= threshold",
+    greater_than: "value > threshold",
+    greater_than_or_equal: "value >= threshold",
+    equal_to: "value == threshold",
+    not_equal_to: "value != threshold",
+}
+
+
+@_memoized_factory
+def all_of_compiled(*comparators: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    """
+    Logical AND of comparators, fused into one generated function.
+
+    Equivalent to all_of(*comparators), but the basic operator
+    comparators (less_than, greater_than, ...) are inlined as
+    expressions, so a chain evaluates in a single Python frame. Other
+    comparators are called from that frame unchanged.
+
+    Examples:
+        >>> combined = all_of_compiled(greater_than, less_than_or_equal)
+        >>> combined(5, 4)  # 5 > 4 but not 5 <= 4
+        False
+    """
+    namespace = {}
+    terms = []
+    for i, comp in enumerate(comparators):
+        try:
+            expression = _INLINE_EXPRESSIONS.get(comp)
+        except TypeError:  # unhashable callable: call it by reference
+            expression = None
+        if expression is None:
+            namespace[f"_c{i}"] = comp
+            expression = f"_c{i}(value, threshold)"
+        terms.append(f"({expression})")
+
+    body = " and ".join(terms) if terms else "True"
+    source = (
+        "def _combined(value, threshold):\n"
+        f"    return True if {body} else False\n"
+    )
+    exec(compile(source, "<cura_frame.comparators.all_of_compiled>", "exec"), namespace)
+
+    _combined = namespace["_combined"]
+    _combined.__name__ = _combinator_name("all_of_compiled", comparators)
     return _combined
 
 
 # -----------------------------
 # Null-safe wrappers
 # -----------------------------
+#
+# Memoized like the combinators above.
 
+@_memoized_factory
 def null_safe(
     comparator: Callable[[Any, Any], bool],
     default: bool = False
@@ -609,29 +1108,400 @@ def null_safe(
         >>> safe_gt(15, 10)
         True
     """
-    def _null_safe(value: Any, threshold: Any) -> bool:
-        if value is None:
-            return default
-        return comparator(value, threshold)
+    # comparator/default are bound as defaults: fast locals, not cell reads
+    def _null_safe(value: Any, threshold: Any, _c=comparator, _d=default) -> bool:
+        return _d if value is None else _c(value, threshold)
     
-    _null_safe.__name__ = f"null_safe({comparator.__name__})"
+    _null_safe.__name__ = _combinator_name("null_safe", (comparator,))
     return _null_safe
 
 
+# -----------------------------
+# Vectorized comparators (NumPy)
+# -----------------------------
+#
+# Array counterparts of the scalar comparators above, for evaluating one
+# constraint across many candidates in a single pass. Each accepts an
+# array-like of values (coerced to float64) plus the same threshold
+# forms as its scalar counterpart, and returns a bool ndarray whose
+# elements match the scalar result. An optional `out` bool array is
+# filled in place and returned, as with NumPy ufuncs. NumPy is imported
+# on first use.
+
+def _as_float_array(values: Any):
+    return require_numpy().asarray(values, dtype=float)
+
+
+def less_than_vec(values: Any, threshold: Any, out: Any = None):
+    """Element-wise less_than."""
+    np = require_numpy()
+    return np.less(_as_float_array(values), threshold, out=out)
+
+
+def less_than_or_equal_vec(values: Any, threshold: Any, out: Any = None):
+    """Element-wise less_than_or_equal."""
+    np = require_numpy()
+    return np.less_equal(_as_float_array(values), threshold, out=out)
+
+
+def greater_than_vec(values: Any, threshold: Any, out: Any = None):
+    """Element-wise greater_than."""
+    np = require_numpy()
+    return np.greater(_as_float_array(values), threshold, out=out)
+
+
+def greater_than_or_equal_vec(values: Any, threshold: Any, out: Any = None):
+    """Element-wise greater_than_or_equal."""
+    np = require_numpy()
+    return np.greater_equal(_as_float_array(values), threshold, out=out)
+
+
+def approximately_equal_to_vec(
+    values: Any,
+    threshold: Union[float, Tuple[float, float]],
+    out: Any = None
+):
+    """Element-wise approximately_equal_to."""
+    np = require_numpy()
+    if isinstance(threshold, tuple):
+        target, epsilon = threshold
+    else:
+        target = threshold
+        epsilon = 1e-9
+    return np.less(np.abs(_as_float_array(values) - target), epsilon, out=out)
+
+
+def within_range_vec(
+    values: Any,
+    bounds: Tuple[float, float],
+    inclusive: bool = True,
+    out: Any = None
+):
+    """
+    Element-wise within_range.
+
+    NaN values compare False against both bounds, so they are reported
+    as outside the range without a separate isnan pass. As in the scalar
+    version, inverted bounds (min > max) reject every value.
+    """
+    lower, upper = bounds
+
+    np = require_numpy()
+    arr = _as_float_array(values)
+    if inclusive:
+        out = np.greater_equal(arr, lower, out=out)
+        return np.logical_and(out, arr <= upper, out=out)
+    out = np.greater(arr, lower, out=out)
+    return np.logical_and(out, arr < upper, out=out)
+
+
+def within_tolerance_vec(
+    values: Any,
+    target: float,
+    tolerance: float,
+    relative: bool = False,
+    out: Any = None
+):
+    """Element-wise within_tolerance."""
+    np = require_numpy()
+    actual_tolerance = abs(target * tolerance) if relative else tolerance
+    return np.less_equal(
+        np.abs(_as_float_array(values) - target), actual_tolerance, out=out
+    )
+
+
+def ratio_greater_than_vec(
+    ratios: Any,
+    threshold: Union[float, Tuple[float, float]],
+    out: Any = None
+):
+    """Element-wise ratio_greater_than (NaN/Inf ratios fail)."""
+    np = require_numpy()
+    if isinstance(threshold, tuple):
+        required_ratio, epsilon = threshold
+    else:
+        required_ratio = threshold
+        epsilon = 0.0
+    arr = _as_float_array(ratios)
+    out = np.isfinite(arr, out=out)
+    return np.logical_and(out, arr > (required_ratio + epsilon), out=out)
+
+
+def ratio_less_than_vec(
+    ratios: Any,
+    threshold: Union[float, Tuple[float, float]],
+    out: Any = None
+):
+    """Element-wise ratio_less_than (NaN/Inf ratios fail)."""
+    np = require_numpy()
+    if isinstance(threshold, tuple):
+        max_ratio, epsilon = threshold
+    else:
+        max_ratio = threshold
+        epsilon = 0.0
+    arr = _as_float_array(ratios)
+    out = np.isfinite(arr, out=out)
+    return np.logical_and(out, arr < (max_ratio - epsilon), out=out)
+
+
+# Scalar comparator -> element-wise counterpart, for bulk evaluation
+VECTORIZED = {
+    less_than: less_than_vec,
+    less_than_or_equal: less_than_or_equal_vec,
+    greater_than: greater_than_vec,
+    greater_than_or_equal: greater_than_or_equal_vec,
+    approximately_equal_to: approximately_equal_to_vec,
+    within_range: within_range_vec,
+    ratio_greater_than: ratio_greater_than_vec,
+    ratio_less_than: ratio_less_than_vec,
+}
+
+# Comparators whose threshold may be a pair: (lower, upper) bounds or
+# (value, epsilon). Any other comparator given a tuple threshold raises
+# in scalar form, so bulk paths must not broadcast the tuple instead.
+PAIR_THRESHOLDS = frozenset({
+    approximately_equal_to,
+    within_range,
+    ratio_greater_than,
+    ratio_less_than,
+})
+
+
+def evaluate_all(values: Any, constraints: Any):
+    """
+    Evaluate M constraints across N candidates, one constraint at a time.
+
+    Args:
+        values: (M, N) array-like; row i holds the observed values of
+            constraints[i]'s property for each of the N candidates
+        constraints: M objects with `comparator` and `threshold`
+            attributes (e.g. cura_frame.Constraint)
+
+    Returns:
+        (M, N) bool ndarray where [i, j] equals
+        constraints[i].comparator(values[i, j], constraints[i].threshold).
+        mask.all(axis=0) gives pass/fail per candidate.
+
+    Notes:
+        Comparators listed in VECTORIZED run as one array operation per
+        constraint. Any other comparator falls back to a Python loop over
+        that row, so arbitrary comparators remain supported.
+    """
+    np = require_numpy()
+    values = _as_float_array(values)
+    if values.ndim != 2 or values.shape[0] != len(constraints):
+        raise ValueError(
+            f"Expected a ({len(constraints)}, N) array of values, got shape {values.shape}"
+        )
+
+    mask = np.empty(values.shape, dtype=bool)
+    for i, constraint in enumerate(constraints):
+        comparator = constraint.comparator
+        threshold = constraint.threshold
+        vec = VECTORIZED.get(comparator)
+        if vec is not None:
+            vec(values[i], threshold, out=mask[i])
+        else:
+            mask[i] = [comparator(v, threshold) for v in values[i].tolist()]
+    return mask
+
+
+# Opcode tables (structure-of-arrays constraint bundles)
+#
+# A bundle of threshold constraints flattens into parallel lo/hi arrays
+# plus one int8 opcode per constraint, so an (N_mol, N_constraints)
+# matrix of observed values is screened with a handful of array
+# operations instead of N_mol x N_constraints comparator calls.
+
+OP_LE = 0
+OP_GE = 1
+OP_RANGE = 2
+OP_RATIO_GT = 3
+OP_LT = 4
+OP_GT = 5
+
+OPCODES = {
+    less_than_or_equal: OP_LE,
+    greater_than_or_equal: OP_GE,
+    within_range: OP_RANGE,
+    ratio_greater_than: OP_RATIO_GT,
+    less_than: OP_LT,
+    greater_than: OP_GT,
+}
+
+
+def opcode_bounds(comparator: Callable, threshold: Any) -> Tuple[int, float, float]:
+    """
+    Encode a (comparator, threshold) pair as (opcode, lo, hi).
+
+    One-sided constraints use an infinite bound on the open side. OP_LT,
+    OP_GT and OP_RATIO_GT test strictly; for OP_RATIO_GT, lo holds
+    required_ratio + epsilon.
+
+    Raises:
+        ValueError: If the comparator has no opcode
+    """
+    opcode = OPCODES.get(comparator)
+    if opcode is None:
+        raise ValueError(
+            f"No opcode for comparator {getattr(comparator, '__name__', comparator)!r}"
+        )
+    if opcode == OP_LE or opcode == OP_LT:
+        return opcode, -math.inf, float(threshold)
+    if opcode == OP_GE or opcode == OP_GT:
+        return opcode, float(threshold), math.inf
+    if opcode == OP_RANGE:
+        lower, upper = threshold
+        return opcode, float(lower), float(upper)
+    if isinstance(threshold, tuple):
+        required_ratio, epsilon = threshold
+    else:
+        required_ratio, epsilon = threshold, 0.0
+    return opcode, float(required_ratio + epsilon), math.inf
+
+
+def evaluate_soa(values: Any, table: Any, out: Any = None):
+    """
+    Evaluate an opcode table across N candidates.
+
+    Args:
+        values: (N, M) array-like; column j holds the observed values of
+            constraint j for each of the N candidates
+        table: Mapping with "lo", "hi" and "opcode" arrays of length M
+            (e.g. cura_frame.constraints_library.cns_drug_constraints_soa())
+        out: Optional (N, M) bool array to write into
+
+    Returns:
+        (N, M) bool ndarray matching the scalar comparators element-wise.
+        mask.all(axis=1) gives pass/fail per candidate.
+    """
+    np = require_numpy()
+    values = _as_float_array(values)
+    lo = table["lo"]
+    hi = table["hi"]
+    opcode = table["opcode"]
+    if values.ndim != 2 or values.shape[1] != len(opcode):
+        raise ValueError(
+            f"Expected a (N, {len(opcode)}) array of values, got shape {values.shape}"
+        )
+
+    out = np.greater_equal(values, lo, out=out)
+    np.logical_and(out, values <= hi, out=out)
+    ratio = opcode == OP_RATIO_GT
+    if ratio.any():
+        columns = values[:, ratio]
+        out[:, ratio] = np.isfinite(columns) & (columns > lo[ratio])
+    strict_upper = opcode == OP_LT
+    if strict_upper.any():
+        out[:, strict_upper] = values[:, strict_upper] < hi[strict_upper]
+    strict_lower = opcode == OP_GT
+    if strict_lower.any():
+        out[:, strict_lower] = values[:, strict_lower] > lo[strict_lower]
+    return out
+
+
+# Columnar (structure-of-arrays) uncertainty
+#
+# The scalar uncertainty comparators take one (nominal, lower, upper)
+# tuple per call. UncertainArray holds the same information for many
+# candidates as three parallel float64 arrays, so each comparator below
+# is a single pass over the one column it actually needs.
+
+@dataclass(frozen=True)
+class UncertainArray:
+    """
+    Parallel nominal / lower / upper arrays for N uncertain values.
+
+    Element i corresponds to the scalar tuple
+    (nominal[i], lower[i], upper[i]).
+    """
+    nominal: Any
+    lower: Any
+    upper: Any
+
+    def __post_init__(self):
+        np = require_numpy()
+        for field_name in ("nominal", "lower", "upper"):
+            object.__setattr__(
+                self, field_name, np.asarray(getattr(self, field_name), dtype=np.float64)
+            )
+        if not (self.nominal.shape == self.lower.shape == self.upper.shape):
+            raise ValueError(
+                "nominal, lower and upper must have the same shape, got "
+                f"{self.nominal.shape}, {self.lower.shape}, {self.upper.shape}"
+            )
+
+    @classmethod
+    def from_tuples(cls, values_with_uncertainty: Any) -> "UncertainArray":
+        """Build from a sequence of (nominal, lower, upper) tuples or an (N, 3) array."""
+        np = require_numpy()
+        rows = np.asarray(values_with_uncertainty, dtype=np.float64).reshape(-1, 3)
+        return cls(rows[:, 0], rows[:, 1], rows[:, 2])
+
+    def __len__(self) -> int:
+        return len(self.nominal)
+
+
+def conservative_upper_bound_soa(ua: UncertainArray, threshold: Any):
+    """Element-wise conservative_upper_bound (non-finite upper bounds fail)."""
+    np = require_numpy()
+    return np.isfinite(ua.upper) & (ua.upper <= threshold)
+
+
+def conservative_lower_bound_soa(ua: UncertainArray, threshold: Any):
+    """Element-wise conservative_lower_bound (non-finite lower bounds fail)."""
+    np = require_numpy()
+    return np.isfinite(ua.lower) & (ua.lower >= threshold)
+
+
+def optimistic_nominal_soa(
+    ua: UncertainArray,
+    threshold: Any,
+    comparison: Callable[[Any, Any], Any]
+):
+    """
+    Element-wise optimistic_nominal.
+
+    `comparison` must accept an array of nominals, e.g. greater_than_vec.
+    """
+    return comparison(ua.nominal, threshold)
+
+
+def probabilistic_satisfaction_soa(
+    ua: UncertainArray,
+    threshold: Any,
+    confidence_level: float = 0.95
+):
+    """Element-wise probabilistic_satisfaction (uniform over [lower, upper])."""
+    np = require_numpy()
+    lower, upper = ua.lower, ua.upper
+    # The fraction is only selected where lower <= threshold < upper, so
+    # division warnings from the other lanes are irrelevant.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prob_satisfied = (threshold - lower) / (upper - lower)
+    return np.where(
+        upper <= threshold,
+        True,
+        np.where(lower > threshold, False, prob_satisfied >= confidence_level),
+    )
+
+
 # -----------------------------
 # Validation helpers
 # -----------------------------
 
-def is_finite(value: float) -> bool:
-    """Check if value is finite (not NaN or Inf)."""
-    return not (math.isnan(value) or math.isinf(value))
+# Check if value is finite (not NaN or Inf). A direct alias of the C
+# builtin, so calls skip a Python frame.
+is_finite = math.isfinite
+
+_isfinite = math.isfinite
 
 
 def is_positive(value: float) -> bool:
     """Check if value is strictly positive."""
-    return is_finite(value) and value > 0
+    return _isfinite(value) and value > 0
 
 
 def is_non_negative(value: float) -> bool:
     """Check if value is non-negative."""
-    return is_finite(value) and value >= 0
+    return _isfinite(value) and value >= 0
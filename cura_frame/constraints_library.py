@@ -12,6 +12,11 @@ This module contains:
 This module contains NO evaluation logic.
 All constraints must be evaluated through CuraFrame core.
 
+Constraint factories are memoized: calling one again with the same
+arguments returns the same Constraint instance. Treat returned
+constraints as shared and read-only; use Constraint.copy() to derive
+a modified one.
+
 Philosophy:
     Constraints encode known limits.
     They are not suggestions, targets, or optimizations.
@@ -19,15 +24,269 @@ Philosophy:
     Tightening is safer than loosening.
 """
 
-from typing import List, Tuple
+import functools
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
 
+from ._compat import require_numpy
 from .core import Constraint, Severity, Provenance
 from .comparators import (
     less_than_or_equal,
     greater_than_or_equal,
     within_range,
+    validate_bounds,
     ratio_greater_than,
-    selectivity_satisfied,
+    opcode_bounds,
+)
+
+
+__all__ = [
+    # Individual constraints
+    "logP_max",
+    "logP_range",
+    "molecular_weight_range",
+    "polar_surface_area_max",
+    "hydrogen_bond_donors_max",
+    "hydrogen_bond_acceptors_max",
+    "cns_mpo_logP",
+    "cns_psa_range",
+    "bbb_penetration_logP_psa",
+    "hERG_ic50_min",
+    "qtc_prolongation_risk_low",
+    "beta1_over_beta2_selectivity_min",
+    "serotonin_5ht1a_affinity_range",
+    "off_target_5ht2a_avoidance",
+    "dopamine_d2_avoidance",
+    "plasma_half_life_range",
+    "oral_bioavailability_min",
+    "hepatic_clearance_max",
+
+    # Constraint bundles
+    "core_safety_constraints",
+    "lipinski_rule_of_five",
+    "cns_drug_constraints",
+    "cardiology_oriented_constraints",
+    "cardiAnx_dual_domain_constraints",
+
+    # Opcode tables (require NumPy)
+    "lipinski_rule_of_five_soa",
+    "cns_drug_constraints_soa",
+    "cardiAnx_dual_domain_constraints_soa",
+]
+
+
+# Severity members bound once as module globals
+_SEV_CRIT, _SEV_SEV, _SEV_WARN = Severity.CRITICAL, Severity.SEVERE, Severity.WARNING
+
+# Flyweight registry: equal constraints built by this module are shared,
+# including across factories and call forms. It is an LRU bounded like
+# the factory caches, so arbitrary threshold sweeps cannot grow it
+# without limit; bundle tuples keep their own constraints alive.
+_REGISTRY_SIZE = 1024
+_CONSTRAINT_REGISTRY: "OrderedDict[tuple, Constraint]" = OrderedDict()
+
+
+def _threshold_key(threshold: Any) -> tuple:
+    # Type-tagged, so that e.g. 5 and 5.0 (equal, but exported
+    # differently) do not share an entry
+    if isinstance(threshold, tuple):
+        return (tuple, tuple((type(t), t) for t in threshold))
+    return (type(threshold), threshold)
+
+
+def _C(
+    name: str,
+    threshold: Any,
+    comparator: Callable[[Any, Any], bool],
+    rationale: str,
+    severity: Severity,
+    provenance: Provenance
+) -> Constraint:
+    """Positional Constraint builder, in Constraint's field order."""
+    key = (
+        name, _threshold_key(threshold), comparator, rationale, severity, provenance
+    )
+    try:
+        constraint = _CONSTRAINT_REGISTRY.get(key)
+    except TypeError:
+        # Unhashable threshold (e.g. a list of bounds): build it unshared
+        return Constraint(name, threshold, comparator, rationale, severity, provenance)
+    if constraint is None:
+        constraint = Constraint(name, threshold, comparator, rationale, severity, provenance)
+        _CONSTRAINT_REGISTRY[key] = constraint
+        if len(_CONSTRAINT_REGISTRY) > _REGISTRY_SIZE:
+            _CONSTRAINT_REGISTRY.popitem(last=False)
+    else:
+        _CONSTRAINT_REGISTRY.move_to_end(key)
+    return constraint
+
+
+def _memoized(factory: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    lru_cache(maxsize=128, typed=True) for a factory. Calls with
+    unhashable arguments (e.g. bounds given as a list) build uncached.
+    """
+    cached = functools.lru_cache(maxsize=128, typed=True)(factory)
+
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return factory(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+# ---------------------------------------------------------------------
+# Constraint names
+# ---------------------------------------------------------------------
+#
+# Property names are interned once so that every constraint (and every
+# lookup keyed by these names) shares a single string object.
+
+_NAME_LOGP = sys.intern("logP")
+_NAME_MOLECULAR_WEIGHT = sys.intern("molecular_weight")
+_NAME_POLAR_SURFACE_AREA = sys.intern("polar_surface_area")
+_NAME_HYDROGEN_BOND_DONORS = sys.intern("hydrogen_bond_donors")
+_NAME_HYDROGEN_BOND_ACCEPTORS = sys.intern("hydrogen_bond_acceptors")
+_NAME_HERG_IC50 = sys.intern("hERG_IC50")
+_NAME_DELTA_QTC_MS = sys.intern("delta_QTc_ms")
+_NAME_BETA1_SELECTIVITY = sys.intern("beta1_selectivity")
+_NAME_KD_5HT1A = sys.intern("Kd_5HT1A")
+_NAME_KD_5HT2A = sys.intern("Kd_5HT2A")
+_NAME_KD_D2 = sys.intern("Kd_D2")
+_NAME_PLASMA_HALF_LIFE = sys.intern("plasma_half_life")
+_NAME_ORAL_BIOAVAILABILITY = sys.intern("oral_bioavailability")
+_NAME_HEPATIC_CLEARANCE = sys.intern("hepatic_clearance")
+
+
+# ---------------------------------------------------------------------
+# Shared provenance
+# ---------------------------------------------------------------------
+#
+# Provenance is immutable, so each distinct source/confidence/reference
+# payload is built once here and shared by every factory that cites it.
+
+_PROV_LOGP_MAX = Provenance(
+    source_type=sys.intern("medicinal_chemistry_guideline"),
+    confidence=0.9,
+    references=(
+        "doi:10.1016/S0169-409X(96)00423-1",  # Lipinski
+        "doi:10.1517/17460441.2010.533654"    # Waring
+    )
+)
+
+_PROV_MEDCHEM_LIPINSKI = Provenance(
+    source_type=sys.intern("medicinal_chemistry_guideline"),
+    confidence=0.85,
+    references=("doi:10.1016/S0169-409X(96)00423-1",)
+)
+
+_PROV_LIPINSKI_VEBER = Provenance(
+    source_type=sys.intern("drug_likeness_guideline"),
+    confidence=0.85,
+    references=(
+        "doi:10.1016/S0169-409X(96)00423-1",
+        "doi:10.1021/jm020017n"
+    )
+)
+
+_PROV_CNS_PSA = Provenance(
+    source_type=sys.intern("cns_drug_design_guideline"),
+    confidence=0.85,
+    references=(
+        "doi:10.1602/neurorx.2.4.541",
+        "doi:10.1021/cn100007x"
+    )
+)
+
+_PROV_LIPINSKI = Provenance(
+    source_type=sys.intern("drug_likeness_guideline"),
+    confidence=0.85,
+    references=("doi:10.1016/S0169-409X(96)00423-1",)
+)
+
+_PROV_CNS_MPO = Provenance(
+    source_type=sys.intern("cns_drug_design_guideline"),
+    confidence=0.85,
+    references=("doi:10.1021/cn100007x",)
+)
+
+_PROV_CNS_PSA_RANGE = Provenance(
+    source_type=sys.intern("cns_drug_design_guideline"),
+    confidence=0.80,
+    references=(
+        "doi:10.1021/cn100007x",
+        "doi:10.1016/S1474-4422(24)00476-9"
+    )
+)
+
+_PROV_BBB = Provenance(
+    source_type=sys.intern("bbb_permeability_study"),
+    confidence=0.80,
+    references=("doi:10.1016/S1474-4422(24)00476-9",)
+)
+
+_PROV_HERG = Provenance(
+    source_type=sys.intern("in_vitro_safety_pharmacology"),
+    confidence=0.9,
+    references=(
+        "doi:10.1093/cvr/58.1.32",
+        "ICH_S7B"
+    )
+)
+
+_PROV_QTC = Provenance(
+    source_type=sys.intern("clinical_cardiology"),
+    confidence=0.95,
+    references=(
+        "ICH_E14",
+        "doi:10.1093/eurheartj/ehad708"
+    )
+)
+
+_PROV_BETA_SELECTIVITY = Provenance(
+    source_type=sys.intern("clinical_pharmacology"),
+    confidence=0.8,
+    references=(
+        "doi:10.1111/j.1476-5381.2005.00048.x",
+        "doi:10.1093/eurheartj/ehad708"
+    )
+)
+
+_PROV_5HT1A = Provenance(
+    source_type=sys.intern("pharmacology_literature"),
+    confidence=0.75,
+    references=("doi:10.1186/s13041-017-0306-y",)
+)
+
+_PROV_5HT2A = Provenance(
+    source_type=sys.intern("pharmacology_literature"),
+    confidence=0.80,
+    references=("doi:10.1186/s13041-017-0306-y",)
+)
+
+_PROV_D2 = Provenance(
+    source_type=sys.intern("pharmacology_literature"),
+    confidence=0.85,
+    references=("PMID:12629530",)
+)
+
+_PROV_PK_TEXTBOOK = Provenance(
+    source_type=sys.intern("pharmacokinetics"),
+    confidence=0.70,
+    references=("pharmacokinetics_textbook",)
+)
+
+_PROV_PK_BIOAVAILABILITY = Provenance(
+    source_type=sys.intern("pharmacokinetics"),
+    confidence=0.65,
+    references=("pharmacokinetics_textbook",)
 )
 
 
@@ -35,6 +294,7 @@ from .comparators import (
 # Physicochemical constraints (ADMET predictors)
 # ---------------------------------------------------------------------
 
+@_memoized
 def logP_max(max_logP: float = 4.0) -> Constraint:
     """
     Maximum allowable lipophilicity (logP).
@@ -54,23 +314,17 @@ def logP_max(max_logP: float = 4.0) -> Constraint:
         Lipinski et al. (1997) - Rule of Five
         Waring (2010) - Lipophilicity in drug discovery
     """
-    return Constraint(
-        name="logP",
-        threshold=max_logP,
-        comparator=less_than_or_equal,
-        rationale="Excessive lipophilicity increases off-target and cardiac risk",
-        severity=Severity.CRITICAL,
-        provenance=Provenance(
-            source_type="medicinal_chemistry_guideline",
-            confidence=0.9,
-            references=[
-                "doi:10.1016/S0169-409X(96)00423-1",  # Lipinski
-                "doi:10.1517/17460441.2010.533654"    # Waring
-            ]
-        )
+    return _C(
+        _NAME_LOGP,
+        max_logP,
+        less_than_or_equal,
+        "Excessive lipophilicity increases off-target and cardiac risk",
+        _SEV_CRIT,
+        _PROV_LOGP_MAX
     )
 
 
+@_memoized
 def logP_range(min_logP: float = 1.0, max_logP: float = 4.0) -> Constraint:
     """
     Acceptable lipophilicity range.
@@ -82,20 +336,17 @@ def logP_range(min_logP: float = 1.0, max_logP: float = 4.0) -> Constraint:
     Use this for compounds requiring oral bioavailability
     with moderate CNS exposure.
     """
-    return Constraint(
-        name="logP",
-        threshold=(min_logP, max_logP),
-        comparator=within_range,
-        rationale="logP outside this range reduces bioavailability or increases risk",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="medicinal_chemistry_guideline",
-            confidence=0.85,
-            references=["doi:10.1016/S0169-409X(96)00423-1"]
-        )
+    return _C(
+        _NAME_LOGP,
+        validate_bounds((min_logP, max_logP)),
+        within_range,
+        "logP outside this range reduces bioavailability or increases risk",
+        _SEV_SEV,
+        _PROV_MEDCHEM_LIPINSKI
     )
 
 
+@_memoized
 def molecular_weight_range(
     min_mw: float = 150.0,
     max_mw: float = 500.0
@@ -114,23 +365,17 @@ def molecular_weight_range(
         Lipinski et al. (1997)
         Veber et al. (2002) - oral bioavailability
     """
-    return Constraint(
-        name="molecular_weight",
-        threshold=(min_mw, max_mw),
-        comparator=within_range,
-        rationale="Molecular weight outside this range reduces drug-like behavior",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="drug_likeness_guideline",
-            confidence=0.85,
-            references=[
-                "doi:10.1016/S0169-409X(96)00423-1",
-                "doi:10.1021/jm020017n"
-            ]
-        )
+    return _C(
+        _NAME_MOLECULAR_WEIGHT,
+        validate_bounds((min_mw, max_mw)),
+        within_range,
+        "Molecular weight outside this range reduces drug-like behavior",
+        _SEV_SEV,
+        _PROV_LIPINSKI_VEBER
     )
 
 
+@_memoized
 def polar_surface_area_max(max_psa: float = 90.0) -> Constraint:
     """
     Maximum polar surface area (PSA, Ų).
@@ -146,23 +391,17 @@ def polar_surface_area_max(max_psa: float = 90.0) -> Constraint:
         Pajouhesh & Lenz (2005) - CNS drug design
         Wager et al. (2010) - CNS MPO
     """
-    return Constraint(
-        name="polar_surface_area",
-        threshold=max_psa,
-        comparator=less_than_or_equal,
-        rationale="High polar surface area reduces membrane permeability",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="cns_drug_design_guideline",
-            confidence=0.85,
-            references=[
-                "doi:10.1602/neurorx.2.4.541",
-                "doi:10.1021/cn100007x"
-            ]
-        )
+    return _C(
+        _NAME_POLAR_SURFACE_AREA,
+        max_psa,
+        less_than_or_equal,
+        "High polar surface area reduces membrane permeability",
+        _SEV_SEV,
+        _PROV_CNS_PSA
     )
 
 
+@_memoized
 def hydrogen_bond_donors_max(max_hbd: int = 5) -> Constraint:
     """
     Maximum number of hydrogen bond donors (NH, OH).
@@ -173,20 +412,17 @@ def hydrogen_bond_donors_max(max_hbd: int = 5) -> Constraint:
 
     For CNS drugs, consider max_hbd = 2.
     """
-    return Constraint(
-        name="hydrogen_bond_donors",
-        threshold=max_hbd,
-        comparator=less_than_or_equal,
-        rationale="Excessive hydrogen bond donors reduce permeability",
-        severity=Severity.WARNING,
-        provenance=Provenance(
-            source_type="drug_likeness_guideline",
-            confidence=0.85,
-            references=["doi:10.1016/S0169-409X(96)00423-1"]
-        )
+    return _C(
+        _NAME_HYDROGEN_BOND_DONORS,
+        max_hbd,
+        less_than_or_equal,
+        "Excessive hydrogen bond donors reduce permeability",
+        _SEV_WARN,
+        _PROV_LIPINSKI
     )
 
 
+@_memoized
 def hydrogen_bond_acceptors_max(max_hba: int = 10) -> Constraint:
     """
     Maximum number of hydrogen bond acceptors (N, O).
@@ -197,17 +433,13 @@ def hydrogen_bond_acceptors_max(max_hba: int = 10) -> Constraint:
 
     For CNS drugs, consider max_hba = 7.
     """
-    return Constraint(
-        name="hydrogen_bond_acceptors",
-        threshold=max_hba,
-        comparator=less_than_or_equal,
-        rationale="Excessive hydrogen bond acceptors reduce permeability",
-        severity=Severity.WARNING,
-        provenance=Provenance(
-            source_type="drug_likeness_guideline",
-            confidence=0.85,
-            references=["doi:10.1016/S0169-409X(96)00423-1"]
-        )
+    return _C(
+        _NAME_HYDROGEN_BOND_ACCEPTORS,
+        max_hba,
+        less_than_or_equal,
+        "Excessive hydrogen bond acceptors reduce permeability",
+        _SEV_WARN,
+        _PROV_LIPINSKI
     )
 
 
@@ -215,6 +447,7 @@ def hydrogen_bond_acceptors_max(max_hba: int = 10) -> Constraint:
 # CNS exposure constraints
 # ---------------------------------------------------------------------
 
+@_memoized
 def cns_mpo_logP(max_logP: float = 3.8) -> Constraint:
     """
     CNS multiparameter optimization (MPO) - logP component.
@@ -227,20 +460,17 @@ def cns_mpo_logP(max_logP: float = 3.8) -> Constraint:
     References:
         Wager et al. (2010) - CNS MPO score
     """
-    return Constraint(
-        name="logP",
-        threshold=max_logP,
-        comparator=less_than_or_equal,
-        rationale="CNS drugs require lower logP for safety and selectivity",
-        severity=Severity.CRITICAL,
-        provenance=Provenance(
-            source_type="cns_drug_design_guideline",
-            confidence=0.85,
-            references=["doi:10.1021/cn100007x"]
-        )
+    return _C(
+        _NAME_LOGP,
+        max_logP,
+        less_than_or_equal,
+        "CNS drugs require lower logP for safety and selectivity",
+        _SEV_CRIT,
+        _PROV_CNS_MPO
     )
 
 
+@_memoized
 def cns_psa_range(min_psa: float = 40.0, max_psa: float = 80.0) -> Constraint:
     """
     CNS-optimized polar surface area range.
@@ -251,27 +481,21 @@ def cns_psa_range(min_psa: float = 40.0, max_psa: float = 80.0) -> Constraint:
 
     This range balances efficacy and safety for centrally acting drugs.
     """
-    return Constraint(
-        name="polar_surface_area",
-        threshold=(min_psa, max_psa),
-        comparator=within_range,
-        rationale="CNS drugs require balanced PSA for BBB penetration and safety",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="cns_drug_design_guideline",
-            confidence=0.80,
-            references=[
-                "doi:10.1021/cn100007x",
-                "doi:10.1016/S1474-4422(24)00476-9"
-            ]
-        )
+    return _C(
+        _NAME_POLAR_SURFACE_AREA,
+        validate_bounds((min_psa, max_psa)),
+        within_range,
+        "CNS drugs require balanced PSA for BBB penetration and safety",
+        _SEV_SEV,
+        _PROV_CNS_PSA_RANGE
     )
 
 
+@_memoized
 def bbb_penetration_logP_psa(
     logP_range_: Tuple[float, float] = (2.0, 4.0),
     psa_max_: float = 90.0
-) -> List[Constraint]:
+) -> Tuple[Constraint, ...]:
     """
     Combined BBB penetration criteria.
 
@@ -280,38 +504,31 @@ def bbb_penetration_logP_psa(
 
     Use for: CNS-active therapeutics requiring brain exposure.
     """
-    return [
-        Constraint(
-            name="logP",
-            threshold=logP_range_,
-            comparator=within_range,
-            rationale="BBB penetration requires moderate lipophilicity",
-            severity=Severity.SEVERE,
-            provenance=Provenance(
-                source_type="bbb_permeability_study",
-                confidence=0.80,
-                references=["doi:10.1016/S1474-4422(24)00476-9"]
-            )
+    return (
+        _C(
+            _NAME_LOGP,
+            validate_bounds(logP_range_),
+            within_range,
+            "BBB penetration requires moderate lipophilicity",
+            _SEV_SEV,
+            _PROV_BBB
         ),
-        Constraint(
-            name="polar_surface_area",
-            threshold=psa_max_,
-            comparator=less_than_or_equal,
-            rationale="High PSA blocks BBB penetration",
-            severity=Severity.SEVERE,
-            provenance=Provenance(
-                source_type="bbb_permeability_study",
-                confidence=0.80,
-                references=["doi:10.1016/S1474-4422(24)00476-9"]
-            )
-        )
-    ]
+        _C(
+            _NAME_POLAR_SURFACE_AREA,
+            psa_max_,
+            less_than_or_equal,
+            "High PSA blocks BBB penetration",
+            _SEV_SEV,
+            _PROV_BBB
+        ),
+    )
 
 
 # ---------------------------------------------------------------------
 # Cardiac safety constraints
 # ---------------------------------------------------------------------
 
+@_memoized
 def hERG_ic50_min(min_ic50_uM: float = 10.0) -> Constraint:
     """
     Minimum acceptable hERG IC50 (μM).
@@ -332,23 +549,17 @@ def hERG_ic50_min(min_ic50_uM: float = 10.0) -> Constraint:
         Redfern et al. (2003) - hERG and QT
         ICH S7B Guidelines
     """
-    return Constraint(
-        name="hERG_IC50",
-        threshold=min_ic50_uM,
-        comparator=greater_than_or_equal,
-        rationale="Low hERG IC50 increases QT prolongation and sudden cardiac death risk",
-        severity=Severity.CRITICAL,
-        provenance=Provenance(
-            source_type="in_vitro_safety_pharmacology",
-            confidence=0.9,
-            references=[
-                "doi:10.1093/cvr/58.1.32",
-                "ICH_S7B"
-            ]
-        )
+    return _C(
+        _NAME_HERG_IC50,
+        min_ic50_uM,
+        greater_than_or_equal,
+        "Low hERG IC50 increases QT prolongation and sudden cardiac death risk",
+        _SEV_CRIT,
+        _PROV_HERG
     )
 
 
+@_memoized
 def qtc_prolongation_risk_low() -> Constraint:
     """
     Constraint for clinical QTc prolongation risk.
@@ -360,20 +571,13 @@ def qtc_prolongation_risk_low() -> Constraint:
     Use when clinical QTc data is available.
     For preclinical, use hERG_ic50_min instead.
     """
-    return Constraint(
-        name="delta_QTc_ms",
-        threshold=20.0,
-        comparator=less_than_or_equal,
-        rationale="QTc prolongation >20ms increases arrhythmia risk",
-        severity=Severity.CRITICAL,
-        provenance=Provenance(
-            source_type="clinical_cardiology",
-            confidence=0.95,
-            references=[
-                "ICH_E14",
-                "doi:10.1093/eurheartj/ehad708"
-            ]
-        )
+    return _C(
+        _NAME_DELTA_QTC_MS,
+        20.0,
+        less_than_or_equal,
+        "QTc prolongation >20ms increases arrhythmia risk",
+        _SEV_CRIT,
+        _PROV_QTC
     )
 
 
@@ -381,6 +585,7 @@ def qtc_prolongation_risk_low() -> Constraint:
 # Receptor selectivity constraints
 # ---------------------------------------------------------------------
 
+@_memoized
 def beta1_over_beta2_selectivity_min(
     min_selectivity: float = 100.0
 ) -> Constraint:
@@ -404,23 +609,17 @@ def beta1_over_beta2_selectivity_min(
         Baker (2005) - β-adrenoceptor selectivity
         Bangalore & Steg (2024) - modern β-blocker use
     """
-    return Constraint(
-        name="beta1_selectivity",
-        threshold=min_selectivity,
-        comparator=ratio_greater_than,
-        rationale="Insufficient β₁/β₂ selectivity increases bronchospasm risk",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="clinical_pharmacology",
-            confidence=0.8,
-            references=[
-                "doi:10.1111/j.1476-5381.2005.00048.x",
-                "doi:10.1093/eurheartj/ehad708"
-            ]
-        )
+    return _C(
+        _NAME_BETA1_SELECTIVITY,
+        min_selectivity,
+        ratio_greater_than,
+        "Insufficient β₁/β₂ selectivity increases bronchospasm risk",
+        _SEV_SEV,
+        _PROV_BETA_SELECTIVITY
     )
 
 
+@_memoized
 def serotonin_5ht1a_affinity_range(
     min_Kd_nM: float = 5.0,
     max_Kd_nM: float = 20.0
@@ -438,20 +637,17 @@ def serotonin_5ht1a_affinity_range(
     References:
         Yohn et al. (2017) - 5-HT receptors in depression
     """
-    return Constraint(
-        name="Kd_5HT1A",
-        threshold=(min_Kd_nM, max_Kd_nM),
-        comparator=within_range,
-        rationale="5-HT₁ₐ affinity must balance efficacy and side effects",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="pharmacology_literature",
-            confidence=0.75,
-            references=["doi:10.1186/s13041-017-0306-y"]
-        )
+    return _C(
+        _NAME_KD_5HT1A,
+        validate_bounds((min_Kd_nM, max_Kd_nM)),
+        within_range,
+        "5-HT₁ₐ affinity must balance efficacy and side effects",
+        _SEV_SEV,
+        _PROV_5HT1A
     )
 
 
+@_memoized
 def off_target_5ht2a_avoidance(max_affinity_nM: float = 500.0) -> Constraint:
     """
     Maximum acceptable 5-HT₂ₐ affinity (higher Kd = weaker binding).
@@ -466,20 +662,17 @@ def off_target_5ht2a_avoidance(max_affinity_nM: float = 500.0) -> Constraint:
 
     Use for: Serotonergic agents where 5-HT₂ₐ is not the target.
     """
-    return Constraint(
-        name="Kd_5HT2A",
-        threshold=max_affinity_nM,
-        comparator=greater_than_or_equal,
-        rationale="Strong 5-HT₂ₐ binding increases psychotomimetic risk",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="pharmacology_literature",
-            confidence=0.80,
-            references=["doi:10.1186/s13041-017-0306-y"]
-        )
+    return _C(
+        _NAME_KD_5HT2A,
+        max_affinity_nM,
+        greater_than_or_equal,
+        "Strong 5-HT₂ₐ binding increases psychotomimetic risk",
+        _SEV_SEV,
+        _PROV_5HT2A
     )
 
 
+@_memoized
 def dopamine_d2_avoidance(max_affinity_nM: float = 1000.0) -> Constraint:
     """
     Maximum acceptable D₂ dopamine receptor affinity.
@@ -495,17 +688,13 @@ def dopamine_d2_avoidance(max_affinity_nM: float = 1000.0) -> Constraint:
 
     Use for: Non-antipsychotic CNS agents.
     """
-    return Constraint(
-        name="Kd_D2",
-        threshold=max_affinity_nM,
-        comparator=greater_than_or_equal,
-        rationale="D₂ antagonism increases extrapyramidal side effects",
-        severity=Severity.SEVERE,
-        provenance=Provenance(
-            source_type="pharmacology_literature",
-            confidence=0.85,
-            references=["PMID:12629530"]
-        )
+    return _C(
+        _NAME_KD_D2,
+        max_affinity_nM,
+        greater_than_or_equal,
+        "D₂ antagonism increases extrapyramidal side effects",
+        _SEV_SEV,
+        _PROV_D2
     )
 
 
@@ -513,6 +702,7 @@ def dopamine_d2_avoidance(max_affinity_nM: float = 1000.0) -> Constraint:
 # Pharmacokinetic constraints
 # ---------------------------------------------------------------------
 
+@_memoized
 def plasma_half_life_range(
     min_t_half_hours: float = 4.0,
     max_t_half_hours: float = 24.0
@@ -530,20 +720,17 @@ def plasma_half_life_range(
     References:
         General PK principles
     """
-    return Constraint(
-        name="plasma_half_life",
-        threshold=(min_t_half_hours, max_t_half_hours),
-        comparator=within_range,
-        rationale="Half-life outside this range complicates dosing or increases risk",
-        severity=Severity.WARNING,
-        provenance=Provenance(
-            source_type="pharmacokinetics",
-            confidence=0.70,
-            references=["pharmacokinetics_textbook"]
-        )
+    return _C(
+        _NAME_PLASMA_HALF_LIFE,
+        validate_bounds((min_t_half_hours, max_t_half_hours)),
+        within_range,
+        "Half-life outside this range complicates dosing or increases risk",
+        _SEV_WARN,
+        _PROV_PK_TEXTBOOK
     )
 
 
+@_memoized
 def oral_bioavailability_min(min_F_percent: float = 30.0) -> Constraint:
     """
     Minimum acceptable oral bioavailability (%).
@@ -557,17 +744,13 @@ def oral_bioavailability_min(min_F_percent: float = 30.0) -> Constraint:
 
     Use for: Oral drug candidates only.
     """
-    return Constraint(
-        name="oral_bioavailability",
-        threshold=min_F_percent,
-        comparator=greater_than_or_equal,
-        rationale="Low bioavailability complicates dosing and increases variability",
-        severity=Severity.WARNING,
-        provenance=Provenance(
-            source_type="pharmacokinetics",
-            confidence=0.65,
-            references=["pharmacokinetics_textbook"]
-        )
+    return _C(
+        _NAME_ORAL_BIOAVAILABILITY,
+        min_F_percent,
+        greater_than_or_equal,
+        "Low bioavailability complicates dosing and increases variability",
+        _SEV_WARN,
+        _PROV_PK_BIOAVAILABILITY
     )
 
 
@@ -575,6 +758,7 @@ def oral_bioavailability_min(min_F_percent: float = 30.0) -> Constraint:
 # Metabolic stability constraints
 # ---------------------------------------------------------------------
 
+@_memoized
 def hepatic_clearance_max(max_CL_mL_min_kg: float = 50.0) -> Constraint:
     """
     Maximum acceptable hepatic clearance rate (mL/min/kg).
@@ -585,25 +769,32 @@ def hepatic_clearance_max(max_CL_mL_min_kg: float = 50.0) -> Constraint:
 
     Use when: In vivo clearance data is available.
     """
-    return Constraint(
-        name="hepatic_clearance",
-        threshold=max_CL_mL_min_kg,
-        comparator=less_than_or_equal,
-        rationale="High hepatic clearance reduces half-life and requires frequent dosing",
-        severity=Severity.WARNING,
-        provenance=Provenance(
-            source_type="pharmacokinetics",
-            confidence=0.70,
-            references=["pharmacokinetics_textbook"]
-        )
+    return _C(
+        _NAME_HEPATIC_CLEARANCE,
+        max_CL_mL_min_kg,
+        less_than_or_equal,
+        "High hepatic clearance reduces half-life and requires frequent dosing",
+        _SEV_WARN,
+        _PROV_PK_TEXTBOOK
     )
 
 
 # ---------------------------------------------------------------------
 # Convenience constraint bundles
 # ---------------------------------------------------------------------
+#
+# Bundles are built once at import time. Each function returns the same
+# immutable tuple of (frozen) constraints on every call; build a list
+# from it to compose a custom set.
+
+_CORE_SAFETY: Tuple[Constraint, ...] = (
+    logP_max(),
+    hERG_ic50_min(),
+    beta1_over_beta2_selectivity_min(),
+)
 
-def core_safety_constraints() -> List[Constraint]:
+
+def core_safety_constraints() -> Tuple[Constraint, ...]:
     """
     Standard baseline safety constraint set.
 
@@ -620,14 +811,18 @@ def core_safety_constraints() -> List[Constraint]:
         - hERG IC50 ≥ 10 μM
         - β₁/β₂ selectivity ≥ 100x
     """
-    return [
-        logP_max(),
-        hERG_ic50_min(),
-        beta1_over_beta2_selectivity_min(),
-    ]
+    return _CORE_SAFETY
+
 
+_LIPINSKI_RULE_OF_FIVE: Tuple[Constraint, ...] = (
+    molecular_weight_range(min_mw=150.0, max_mw=500.0),
+    logP_max(max_logP=5.0),
+    hydrogen_bond_donors_max(max_hbd=5),
+    hydrogen_bond_acceptors_max(max_hba=10),
+)
 
-def lipinski_rule_of_five() -> List[Constraint]:
+
+def lipinski_rule_of_five() -> Tuple[Constraint, ...]:
     """
     Lipinski's Rule of Five for oral drug-likeness.
 
@@ -640,15 +835,19 @@ def lipinski_rule_of_five() -> List[Constraint]:
     Note: CuraFrame defaults are more conservative than Ro5.
     Use this bundle when applying classic medicinal chemistry filters.
     """
-    return [
-        molecular_weight_range(min_mw=150.0, max_mw=500.0),
-        logP_max(max_logP=5.0),
-        hydrogen_bond_donors_max(max_hbd=5),
-        hydrogen_bond_acceptors_max(max_hba=10),
-    ]
+    return _LIPINSKI_RULE_OF_FIVE
+
 
+_CNS_DRUG: Tuple[Constraint, ...] = (
+    logP_range(min_logP=2.0, max_logP=3.8),
+    cns_psa_range(min_psa=40.0, max_psa=80.0),
+    molecular_weight_range(min_mw=150.0, max_mw=450.0),
+    hydrogen_bond_donors_max(max_hbd=2),
+    hydrogen_bond_acceptors_max(max_hba=7),
+)
 
-def cns_drug_constraints() -> List[Constraint]:
+
+def cns_drug_constraints() -> Tuple[Constraint, ...]:
     """
     Constraint set for CNS-active drugs.
 
@@ -661,16 +860,18 @@ def cns_drug_constraints() -> List[Constraint]:
 
     Use for: Brain-penetrant therapeutics.
     """
-    return [
-        logP_range(min_logP=2.0, max_logP=3.8),
-        cns_psa_range(min_psa=40.0, max_psa=80.0),
-        molecular_weight_range(min_mw=150.0, max_mw=450.0),
-        hydrogen_bond_donors_max(max_hbd=2),
-        hydrogen_bond_acceptors_max(max_hba=7),
-    ]
+    return _CNS_DRUG
+
+
+_CARDIOLOGY_ORIENTED: Tuple[Constraint, ...] = (
+    logP_max(),
+    hERG_ic50_min(min_ic50_uM=15.0),  # More conservative for cardiology
+    beta1_over_beta2_selectivity_min(),
+    molecular_weight_range(),
+)
 
 
-def cardiology_oriented_constraints() -> List[Constraint]:
+def cardiology_oriented_constraints() -> Tuple[Constraint, ...]:
     """
     Constraint set emphasizing cardiovascular safety.
 
@@ -681,15 +882,32 @@ def cardiology_oriented_constraints() -> List[Constraint]:
 
     Use for: Cardiovascular therapeutics or drugs with cardiac risk.
     """
-    return [
-        logP_max(),
-        hERG_ic50_min(min_ic50_uM=15.0),  # More conservative for cardiology
-        beta1_over_beta2_selectivity_min(),
-        molecular_weight_range(),
-    ]
+    return _CARDIOLOGY_ORIENTED
+
+
+_CARDIANX_DUAL_DOMAIN: Tuple[Constraint, ...] = (
+    # Physicochemical (BBB + cardiac distribution)
+    logP_range(min_logP=2.5, max_logP=3.8),
+    polar_surface_area_max(max_psa=80.0),
+    molecular_weight_range(min_mw=450.0, max_mw=520.0),
+    hydrogen_bond_donors_max(max_hbd=2),
+    hydrogen_bond_acceptors_max(max_hba=7),
+    
+    # Cardiac safety
+    hERG_ic50_min(min_ic50_uM=10.0),
+    beta1_over_beta2_selectivity_min(min_selectivity=100.0),
+    
+    # Target profile
+    serotonin_5ht1a_affinity_range(min_Kd_nM=5.0, max_Kd_nM=20.0),
+    off_target_5ht2a_avoidance(max_affinity_nM=500.0),
+    dopamine_d2_avoidance(max_affinity_nM=1000.0),
+    
+    # Pharmacokinetics
+    plasma_half_life_range(min_t_half_hours=8.0, max_t_half_hours=16.0),
+)
 
 
-def cardiAnx_dual_domain_constraints() -> List[Constraint]:
+def cardiAnx_dual_domain_constraints() -> Tuple[Constraint, ...]:
     """
     Constraint set for CardiAnx-1 dual-domain concept.
 
@@ -716,23 +934,97 @@ def cardiAnx_dual_domain_constraints() -> List[Constraint]:
     Safety:
         - hERG IC50 > 10 μM
     """
-    return [
-        # Physicochemical (BBB + cardiac distribution)
-        logP_range(min_logP=2.5, max_logP=3.8),
-        polar_surface_area_max(max_psa=80.0),
-        molecular_weight_range(min_mw=450.0, max_mw=520.0),
-        hydrogen_bond_donors_max(max_hbd=2),
-        hydrogen_bond_acceptors_max(max_hba=7),
-        
-        # Cardiac safety
-        hERG_ic50_min(min_ic50_uM=10.0),
-        beta1_over_beta2_selectivity_min(min_selectivity=100.0),
-        
-        # Target profile
-        serotonin_5ht1a_affinity_range(min_Kd_nM=5.0, max_Kd_nM=20.0),
-        off_target_5ht2a_avoidance(max_affinity_nM=500.0),
-        dopamine_d2_avoidance(max_affinity_nM=1000.0),
-        
-        # Pharmacokinetics
-        plasma_half_life_range(min_t_half_hours=8.0, max_t_half_hours=16.0),
-    ]
+    return _CARDIANX_DUAL_DOMAIN
+
+
+# =============================================================================
+# OPCODE TABLES (structure-of-arrays bundles for batch screening)
+# =============================================================================
+
+def _soa_table(constraints: Tuple[Constraint, ...], dtype: Any = None) -> Dict[str, Any]:
+    """Flatten a bundle into read-only names/lo/hi/opcode arrays."""
+    np = require_numpy()
+    return _soa_table_cached(constraints, np.dtype(np.float64 if dtype is None else dtype))
+
+
+@functools.lru_cache(maxsize=None)
+def _soa_table_cached(constraints: Tuple[Constraint, ...], dtype: Any) -> Dict[str, Any]:
+    np = require_numpy()
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"Opcode tables need a floating dtype, got {dtype}")
+
+    encoded = [opcode_bounds(c.comparator, c.threshold) for c in constraints]
+    lo = np.array([lo for _, lo, _ in encoded], dtype=np.float64)
+    hi = np.array([hi for _, _, hi in encoded], dtype=np.float64)
+    lo_cast = lo.astype(dtype)
+    hi_cast = hi.astype(dtype)
+    # Round outward so a narrower table never rejects a passing value
+    lo_cast = np.where(lo_cast > lo, np.nextafter(lo_cast, dtype.type(-np.inf)), lo_cast)
+    hi_cast = np.where(hi_cast < hi, np.nextafter(hi_cast, dtype.type(np.inf)), hi_cast)
+
+    table = {
+        "names": np.array([c.name for c in constraints], dtype=object),
+        "lo": lo_cast,
+        "hi": hi_cast,
+        "opcode": np.array([op for op, _, _ in encoded], dtype=np.int8),
+    }
+    for array in table.values():
+        array.flags.writeable = False
+    return table
+
+
+def lipinski_rule_of_five_soa(dtype: Any = None) -> Dict[str, Any]:
+    """
+    lipinski_rule_of_five() as an opcode table.
+
+    Args:
+        dtype: Floating dtype for lo/hi (default: float64, exact)
+
+    Returns:
+        {"names", "lo", "hi", "opcode"} arrays in bundle order, for use
+        with cura_frame.comparators.evaluate_soa(). Requires NumPy.
+
+    Notes:
+        Narrower dtypes (float32, float16) round bounds outward, so the
+        table is a conservative prefilter: it never rejects a candidate
+        the exact table accepts, but survivors must be re-checked.
+    """
+    return dict(_soa_table(_LIPINSKI_RULE_OF_FIVE, dtype))
+
+
+def cns_drug_constraints_soa(dtype: Any = None) -> Dict[str, Any]:
+    """
+    cns_drug_constraints() as an opcode table.
+
+    Args:
+        dtype: Floating dtype for lo/hi (default: float64, exact)
+
+    Returns:
+        {"names", "lo", "hi", "opcode"} arrays in bundle order, for use
+        with cura_frame.comparators.evaluate_soa(). Requires NumPy.
+
+    Notes:
+        Narrower dtypes (float32, float16) round bounds outward, so the
+        table is a conservative prefilter: it never rejects a candidate
+        the exact table accepts, but survivors must be re-checked.
+    """
+    return dict(_soa_table(_CNS_DRUG, dtype))
+
+
+def cardiAnx_dual_domain_constraints_soa(dtype: Any = None) -> Dict[str, Any]:
+    """
+    cardiAnx_dual_domain_constraints() as an opcode table.
+
+    Args:
+        dtype: Floating dtype for lo/hi (default: float64, exact)
+
+    Returns:
+        {"names", "lo", "hi", "opcode"} arrays in bundle order, for use
+        with cura_frame.comparators.evaluate_soa(). Requires NumPy.
+
+    Notes:
+        Narrower dtypes (float32, float16) round bounds outward, so the
+        table is a conservative prefilter: it never rejects a candidate
+        the exact table accepts, but survivors must be re-checked.
+    """
+    return dict(_soa_table(_CARDIANX_DUAL_DOMAIN, dtype))
@@ -6,8 +6,19 @@ safety-critical constraints on hypothetical therapeutic candidates.
 It is NOT a drug discovery tool, molecule generator, or optimizer.
 """
 
-from dataclasses import dataclass, field
-from typing import Callable, Any, Dict, List, Optional, Protocol, Union
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+import functools
+import hashlib
+import multiprocessing
+import os
+import sys
+from types import MappingProxyType
+from typing import (
+    Callable, Any, Deque, Dict, FrozenSet, Iterable, List, Mapping, Optional,
+    Protocol, Sequence, Tuple, Union,
+)
 from enum import Enum
 import logging
 from abc import ABC, abstractmethod
@@ -15,6 +26,10 @@ from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+; older interpreters get the same
+# classes with a per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # -----------------------------
 # Evaluation outcomes
@@ -46,29 +61,56 @@ class Severity(Enum):
     WARNING = "warning"
 
 
+# One bit per severity, for EvaluationResult.severity_mask
+_SEVERITY_BITS: Dict[Severity, int] = {
+    Severity.CRITICAL: 4,
+    Severity.SEVERE: 2,
+    Severity.WARNING: 1,
+}
+
+def _severity_mask(violations: Iterable["Violation"]) -> int:
+    mask = 0
+    for v in violations:
+        mask |= _SEVERITY_BITS[v.severity]
+    return mask
+
+
+# Upper-cased labels for summaries, computed once rather than per call
+_UPPER: Dict[Enum, str] = {
+    member: member.value.upper()
+    for enum in (EvaluationStatus, Severity)
+    for member in enum
+}
+
+
 # -----------------------------
 # Constraint primitives
 # -----------------------------
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Provenance:
     """
     Tracks the source and reliability of a constraint.
     
+    Provenance is immutable (and hashable), so a single instance can be
+    shared by many constraints.
+    
     Attributes:
         source_type: Origin of constraint (e.g., 'clinical_data', 'QSPR_model')
         confidence: Epistemic confidence [0.0, 1.0]
-        references: Citations, DOIs, or data sources
+        references: Citations, DOIs, or data sources (stored as a tuple)
         last_validated: When this constraint was last verified (optional)
     """
     source_type: str
     confidence: float
-    references: List[str] = field(default_factory=list)
+    references: Tuple[str, ...] = ()
     last_validated: Optional[str] = None
     
     def __post_init__(self):
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(f"Confidence must be in [0,1], got {self.confidence}")
+        if not isinstance(self.references, tuple):
+            object.__setattr__(self, "references", tuple(self.references))
     
     def is_well_established(self, threshold: float = 0.8) -> bool:
         """Conservative: high confidence AND multiple references."""
@@ -79,7 +121,7 @@ class Provenance:
         return self.confidence < threshold
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Constraint:
     """
     Represents a single evaluative boundary.
@@ -88,6 +130,9 @@ class Constraint:
     modified by population stratification. Each constraint carries
     provenance metadata for transparency.
     
+    Constraints are immutable: population adjustments produce new
+    Constraint objects rather than changing existing ones.
+    
     Attributes:
         name: Unique identifier for this constraint
         threshold: The limiting value (type depends on constraint)
@@ -103,6 +148,12 @@ class Constraint:
     severity: Severity = Severity.CRITICAL
     provenance: Optional[Provenance] = None
 
+    def __post_init__(self):
+        # Interned names make the per-evaluation property lookups
+        # (candidate.properties.get(name)) hit on identity
+        if type(self.name) is str:
+            object.__setattr__(self, "name", sys.intern(self.name))
+
     def evaluate(self, value: Any) -> bool:
         """
         Returns True if value satisfies constraint, False otherwise.
@@ -113,72 +164,153 @@ class Constraint:
         try:
             return self.comparator(value, self.threshold)
         except (TypeError, ValueError) as e:
-            logger.error(f"Constraint {self.name} evaluation failed: {e}")
+            logger.error("Constraint %s evaluation failed: %s", self.name, e)
             raise TypeError(
                 f"Cannot compare {type(value).__name__} to "
                 f"{type(self.threshold).__name__} in constraint '{self.name}'"
             ) from e
 
+    @property
+    def op_code(self) -> Optional[int]:
+        """
+        Opcode of a built-in threshold comparator (see
+        cura_frame.comparators.OPCODES), or None for custom comparators.
+        """
+        from .comparators import OPCODES
+        return OPCODES.get(self.comparator)
+
     def copy(self) -> "Constraint":
-        """Deep copy for population stratification."""
-        return Constraint(
-            name=self.name,
-            threshold=self.threshold,
-            comparator=self.comparator,
-            rationale=self.rationale,
-            severity=self.severity,
-            provenance=self.provenance
-        )
+        """Copy for population stratification."""
+        return replace(self)
 
-    def apply_modifier(self, modifier: Callable[["Constraint"], Any]) -> None:
+    def with_modifier(self, modifier: Callable[["Constraint"], Any]) -> "Constraint":
         """
         Apply population-specific adjustment to threshold.
         
+        Returns:
+            A new Constraint with the modified threshold.
+            This constraint is unchanged.
+        
         Example:
             >>> elderly_modifier = lambda c: c.threshold * 1.5  # More conservative
-            >>> constraint.apply_modifier(elderly_modifier)
+            >>> adjusted = constraint.with_modifier(elderly_modifier)
+        """
+        return replace(self, threshold=modifier(self))
+
+    def apply_modifier(self, modifier: Callable[["Constraint"], Any]) -> None:
         """
-        self.threshold = modifier(self)
+        Removed: constraints are immutable and cannot be adjusted in place.
+        
+        Raises:
+            FrozenInstanceError: Always; use with_modifier(), which returns
+                the adjusted constraint
+        """
+        raise FrozenInstanceError(
+            f"Constraint '{self.name}' is immutable; apply_modifier() no longer "
+            "adjusts it in place. Use with_modifier(), which returns the "
+            "adjusted constraint."
+        )
 
 
 # -----------------------------
 # Violation representation
 # -----------------------------
 
-@dataclass
+@dataclass(init=False, **_SLOTS)
 class Violation:
     """
     Records a constraint violation with full context.
     
+    The violated Constraint is held by reference (constraints are
+    immutable), and its details are read from it on demand.
+    
     Attributes:
-        constraint: Name of violated constraint
+        source: The violated constraint
         observed: Actual value from candidate
+    
+    Properties:
+        constraint: Name of violated constraint
         threshold: Required threshold
         rationale: Why this constraint exists
         severity: How serious this violation is
         confidence: Epistemic confidence in the constraint itself
+    
+    The flat form ``Violation(constraint, observed, threshold, rationale,
+    severity, confidence)`` is still accepted (positionally or by
+    keyword); it records the details on a comparator-less Constraint.
     """
-    constraint: str
+    source: Constraint
     observed: Any
-    threshold: Any
-    rationale: str
-    severity: Severity
-    confidence: float
+
+    def __init__(
+        self,
+        source: Any = None,
+        observed: Any = None,
+        threshold: Any = None,
+        rationale: str = "",
+        severity: Severity = Severity.CRITICAL,
+        confidence: float = 1.0,
+        *,
+        constraint: Optional[str] = None,
+    ):
+        if constraint is not None or not isinstance(source, Constraint):
+            source = Constraint(
+                name=source if constraint is None else constraint,
+                threshold=threshold,
+                comparator=None,
+                rationale=rationale,
+                severity=severity,
+                provenance=Provenance("recorded", confidence),
+            )
+        self.source = source
+        self.observed = observed
+
+    @property
+    def constraint(self) -> str:
+        return self.source.name
+
+    @property
+    def threshold(self) -> Any:
+        return self.source.threshold
+
+    @property
+    def rationale(self) -> str:
+        return self.source.rationale
+
+    @property
+    def severity(self) -> Severity:
+        return self.source.severity
+
+    @property
+    def confidence(self) -> float:
+        provenance = self.source.provenance
+        return provenance.confidence if provenance else 1.0
     
     def __str__(self) -> str:
         return (
-            f"[{self.severity.value.upper()}] {self.constraint}: "
+            f"[{_UPPER[self.severity]}] {self.constraint}: "
             f"observed {self.observed}, required {self.threshold}\n"
             f"  Rationale: {self.rationale}\n"
             f"  Confidence: {self.confidence:.2f}"
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat mapping of the violation details (the original asdict() layout)."""
+        return {
+            "constraint": self.constraint,
+            "observed": self.observed,
+            "threshold": self.threshold,
+            "rationale": self.rationale,
+            "severity": self.severity,
+            "confidence": self.confidence,
+        }
+
 
 # -----------------------------
 # Evaluation result
 # -----------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationResult:
     """
     Complete outcome of constraint evaluation.
@@ -189,12 +321,43 @@ class EvaluationResult:
         warnings: Non-critical issues flagged during evaluation
         notes: Additional context or explanations
         candidate_name: Name of evaluated candidate (for logging)
+    
+    Results produced by CuraFrame hold violations and warnings as
+    tuples. The severity bitmask of a tuple is computed once; a list
+    (e.g. from a hand-built result) is rescanned on each query, so
+    appending to it is always reflected.
     """
     status: EvaluationStatus
-    violations: List[Violation] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    violations: Sequence[Violation] = field(default_factory=list)
+    warnings: Sequence[str] = field(default_factory=list)
     notes: Optional[str] = None
     candidate_name: Optional[str] = None
+    _mask: int = field(default=0, init=False, repr=False, compare=False)
+    _mask_source: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if type(self.violations) is tuple:
+            self._mask = _severity_mask(self.violations)
+            self._mask_source = self.violations
+
+    @property
+    def severity_mask(self) -> int:
+        """Bitwise OR of the violations' severity bits."""
+        violations = self.violations
+        if violations is self._mask_source:
+            return self._mask
+        return _severity_mask(violations)
+
+    @classmethod
+    def accepted(cls, candidate_name: Optional[str] = None) -> "EvaluationResult":
+        """Clean ACCEPTED result: no violations, no warnings."""
+        return cls(
+            status=EvaluationStatus.ACCEPTED,
+            violations=(),
+            warnings=(),
+            notes="All constraints satisfied",
+            candidate_name=candidate_name
+        )
 
     def is_accepted(self) -> bool:
         return self.status == EvaluationStatus.ACCEPTED
@@ -206,16 +369,16 @@ class EvaluationResult:
         return self.status == EvaluationStatus.INDETERMINATE
     
     def has_critical_violations(self) -> bool:
-        return any(v.severity == Severity.CRITICAL for v in self.violations)
+        return bool(self.severity_mask & _SEVERITY_BITS[Severity.CRITICAL])
     
     def has_warnings(self) -> bool:
-        return len(self.warnings) > 0 or any(
-            v.severity == Severity.WARNING for v in self.violations
+        return len(self.warnings) > 0 or bool(
+            self.severity_mask & _SEVERITY_BITS[Severity.WARNING]
         )
     
     def summary(self) -> str:
         """Human-readable summary of evaluation."""
-        lines = [f"Evaluation: {self.status.value.upper()}"]
+        lines = [f"Evaluation: {_UPPER[self.status]}"]
         
         if self.candidate_name:
             lines.append(f"Candidate: {self.candidate_name}")
@@ -246,7 +409,7 @@ class CandidateProtocol(Protocol):
         ...
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Candidate:
     """
     Represents a hypothetical design concept.
@@ -275,6 +438,18 @@ class Candidate:
         """
         return self.properties.get(property_name, default)
     
+    def fingerprint(self) -> bytes:
+        """
+        16-byte digest of the properties (not the name), for spotting
+        duplicate designs in large screens.
+        
+        Computed on each call, since properties is a mutable dict.
+        """
+        return hashlib.blake2b(
+            repr(sorted(self.properties.items())).encode("utf-8"),
+            digest_size=16
+        ).digest()
+
     def has(self, property_name: str) -> bool:
         """Check if property exists."""
         return property_name in self.properties
@@ -299,10 +474,169 @@ class Candidate:
         return f"Candidate({self.name}: {props})"
 
 
+class CandidateTable:
+    """
+    Column-oriented (structure-of-arrays) store for many candidates.
+    
+    Each property is one float64 NumPy array, aligned with `names`, so
+    CuraFrame.evaluate_table() checks a constraint for every candidate
+    in one vectorized operation. A NaN entry means the property is
+    missing for that candidate. Requires NumPy.
+    
+    Attributes:
+        names: Candidate names, in row order
+        columns: Map of property_name -> float64 array (one entry per row)
+    """
+    __slots__ = ("names", "columns")
+
+    def __init__(self, rows: Iterable[Candidate]):
+        """
+        Build a table from candidates with numeric property values.
+        
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If a property value is not a real number
+        """
+        from ._compat import require_numpy
+        np = require_numpy()
+
+        rows = list(rows)
+        self.names: List[str] = [row.name for row in rows]
+        properties = dict.fromkeys(p for row in rows for p in row.properties)
+        self.columns: Dict[str, Any] = {}
+        for prop in properties:
+            values = [row.properties.get(prop) for row in rows]
+            if not _all_real(values):
+                raise ValueError(
+                    f"Property '{prop}' has non-numeric values; "
+                    "CandidateTable holds real numbers only"
+                )
+            self.columns[prop] = np.array(
+                [float("nan") if v is None else v for v in values],
+                dtype=np.float64
+            )
+
+    @classmethod
+    def from_array(
+        cls,
+        values: Any,
+        properties: Sequence[str],
+        names: Sequence[str]
+    ) -> "CandidateTable":
+        """
+        Wrap an (n_candidates, n_properties) array as a table.
+        
+        Column j of values holds properties[j] (NaN = missing). A float64
+        array is not copied: the table's columns are views of it, so
+        Fortran-ordered input gives contiguous columns.
+        
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the shape disagrees with properties/names, or a
+                property name repeats
+        """
+        from ._compat import require_numpy
+        np = require_numpy()
+
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape != (len(names), len(properties)):
+            raise ValueError(
+                f"Expected values of shape ({len(names)}, {len(properties)}), "
+                f"got {values.shape}"
+            )
+        if len(set(properties)) != len(properties):
+            raise ValueError("Duplicate property name in CandidateTable.from_array")
+
+        table = cls.__new__(cls)
+        table.names = list(names)
+        table.columns = {prop: values[:, j] for j, prop in enumerate(properties)}
+        return table
+
+    def row(self, index: int) -> Candidate:
+        """Row `index` as a Candidate (missing properties omitted)."""
+        properties = {}
+        for prop, column in self.columns.items():
+            value = float(column[index])
+            if value == value:  # NaN = missing
+                properties[prop] = value
+        return Candidate(name=self.names[index], properties=properties)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"CandidateTable(rows={len(self)}, properties={list(self.columns)})"
+
+
+class _TableRow:
+    """One CandidateTable row, readable through the Candidate get() protocol."""
+    __slots__ = ("name", "_columns", "_index")
+
+    def __init__(self, table: CandidateTable, index: int):
+        self.name = table.names[index]
+        self._columns = table.columns
+        self._index = index
+
+    def get(self, property_name: str) -> Optional[float]:
+        column = self._columns.get(property_name)
+        if column is None:
+            return None
+        value = float(column[self._index])
+        return None if value != value else value  # NaN = missing
+
+
 # -----------------------------
 # Population stratification
 # -----------------------------
 
+@dataclass(frozen=True, **_SLOTS)
+class Modifier:
+    """
+    A population threshold adjustment expressed as data.
+    
+    Modifiers are callables, so they can be used anywhere a
+    `lambda c: ...` modifier can; unlike lambdas they are hashable,
+    comparable, printable and picklable (e.g. for process pools).
+    
+    Attributes:
+        op: "scale" (multiply), "offset" (add) or "set" (replace)
+        value: Operand for op
+        bound: For range thresholds, "lower" or "upper" to adjust one
+            bound only (None = both bounds, or the whole threshold for "set")
+    
+    Example:
+        >>> strat.add_population("elderly", {"hERG_IC50": Modifier("scale", 1.5)})
+    """
+    op: str
+    value: Any
+    bound: Optional[str] = None
+
+    def __post_init__(self):
+        if self.op not in ("scale", "offset", "set"):
+            raise ValueError(f"Unknown modifier op: {self.op!r}")
+        if self.bound not in (None, "lower", "upper"):
+            raise ValueError(f"Modifier bound must be 'lower', 'upper' or None, got {self.bound!r}")
+
+    def _adjust(self, threshold: Any) -> Any:
+        if self.op == "scale":
+            return threshold * self.value
+        if self.op == "offset":
+            return threshold + self.value
+        return self.value
+
+    def __call__(self, constraint: Constraint) -> Any:
+        """Adjusted threshold for constraint."""
+        threshold = constraint.threshold
+        if self.bound is not None:
+            lower, upper = threshold
+            if self.bound == "lower":
+                return (self._adjust(lower), upper)
+            return (lower, self._adjust(upper))
+        if isinstance(threshold, tuple) and self.op != "set":
+            return tuple(self._adjust(t) for t in threshold)
+        return self._adjust(threshold)
+
+
 class PopulationStratification:
     """
     Applies conservative constraint modifiers for patient subgroups.
@@ -314,13 +648,18 @@ class PopulationStratification:
     Example:
         >>> strat = PopulationStratification()
         >>> strat.add_population("elderly", {
-        ...     "hERG_IC50": lambda c: c.threshold * 1.5,  # More conservative
+        ...     "hERG_IC50": Modifier("scale", 1.5),  # More conservative
         ... })
         >>> adjusted = strat.apply("elderly", base_constraints)
     """
 
     def __init__(self):
         self.populations: Dict[str, Dict[str, Callable[[Constraint], Any]]] = {}
+        # population -> (base constraints, adjusted constraints)
+        self._adjusted_cache: Dict[str, Tuple[Tuple[Constraint, ...], Tuple[Constraint, ...]]] = {}
+        # Bumped by every add_population(), so callers caching adjusted
+        # results can tell when a registration may have changed them
+        self._generation = 0
 
     def add_population(
         self, 
@@ -333,10 +672,14 @@ class PopulationStratification:
         Args:
             name: Population identifier (e.g., "elderly", "asthmatic")
             modifiers: Map of constraint_name -> modifier_function
+                (captured at registration; modifiers must be deterministic,
+                as each is applied once per base constraint set)
         """
         if name in self.populations:
-            logger.warning(f"Overwriting existing population '{name}'")
-        self.populations[name] = modifiers
+            logger.warning("Overwriting existing population '%s'", name)
+        self.populations[name] = dict(modifiers)
+        self._adjusted_cache.pop(name, None)
+        self._generation += 1
 
     def get_populations(self) -> List[str]:
         """Return list of registered population names."""
@@ -345,8 +688,8 @@ class PopulationStratification:
     def apply(
         self, 
         population: Optional[str], 
-        constraints: List[Constraint]
-    ) -> List[Constraint]:
+        constraints: Sequence[Constraint]
+    ) -> Sequence[Constraint]:
         """
         Apply population-specific modifiers to constraints.
         
@@ -355,37 +698,385 @@ class PopulationStratification:
             constraints: Base constraints to modify
         
         Returns:
-            New list of constraints with modifiers applied.
-            Original constraints are unchanged (copies are modified).
+            New sequence of constraints with modifiers applied (the base
+            sequence itself when no modifier names one of its constraints).
+            Original constraints are unchanged (modified constraints are new objects).
+            For a tuple of base constraints (as CuraFrame holds), the
+            adjusted tuple is computed once and reused until the same
+            base tuple or population changes.
         """
         if population is None:
             return constraints
         
         if population not in self.populations:
             logger.warning(
-                f"Unknown population '{population}'. "
-                f"Available: {self.get_populations()}"
+                "Unknown population '%s'. Available: %s",
+                population, self.get_populations()
             )
             return constraints
 
-        adjusted = []
+        cached = self._adjusted_cache.get(population)
+        if cached is not None and cached[0] is constraints:
+            return cached[1]
+
         modifiers = self.populations[population]
+        if not any(constraint.name in modifiers for constraint in constraints):
+            return constraints
 
+        adjusted = []
         for constraint in constraints:
             if constraint.name in modifiers:
-                c = constraint.copy()
-                c.apply_modifier(modifiers[constraint.name])
+                c = constraint.with_modifier(modifiers[constraint.name])
                 adjusted.append(c)
                 logger.debug(
-                    f"Applied {population} modifier to {constraint.name}: "
-                    f"{constraint.threshold} -> {c.threshold}"
+                    "Applied %s modifier to %s: %s -> %s",
+                    population, constraint.name, constraint.threshold, c.threshold
                 )
             else:
                 adjusted.append(constraint)
 
+        if isinstance(constraints, tuple):
+            adjusted = tuple(adjusted)
+            self._adjusted_cache[population] = (constraints, adjusted)
         return adjusted
 
 
+# -----------------------------
+# Result memoization
+# -----------------------------
+
+def _memoized_check(cache_size: int) -> Callable[[Constraint, Any], bool]:
+    """
+    Bounded LRU memo of Constraint.evaluate for custom comparators.
+    
+    Entries are keyed on (comparator, threshold, value), so constraints
+    that share a rule (including population-adjusted copies) share
+    entries without hashing whole Constraint objects. Built-in
+    comparators bypass the memo (a lookup costs more than the
+    comparison), as do unhashable thresholds or values. Errors are not
+    cached.
+    """
+    from .comparators import VECTORIZED
+
+    @functools.lru_cache(maxsize=cache_size, typed=True)
+    def cached(comparator: Callable[[Any, Any], bool], threshold: Any, value: Any) -> bool:
+        return comparator(value, threshold)
+
+    def check(constraint: Constraint, value: Any) -> bool:
+        comparator = constraint.comparator
+        if comparator in VECTORIZED:
+            return constraint.evaluate(value)
+        threshold = constraint.threshold
+        try:
+            hash((comparator, threshold, value))
+        except TypeError:
+            return constraint.evaluate(value)
+        try:
+            return cached(comparator, threshold, value)
+        except (TypeError, ValueError):
+            # Re-run through evaluate() for its logging and error message
+            return constraint.evaluate(value)
+
+    check.cache_info = cached.cache_info
+    check.cache_clear = cached.cache_clear
+    return check
+
+
+# -----------------------------
+# Batch evaluation
+# -----------------------------
+
+# Python ints beyond this magnitude do not round-trip through float64
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _is_real(value: Any) -> bool:
+    """True for values whose float64 comparison matches the Python one."""
+    if type(value) is float:
+        return True
+    return type(value) is int and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+
+
+_FLOAT_OR_NONE = frozenset({float, type(None)})
+
+
+def _all_real(values: List[Any]) -> bool:
+    """_is_real for every non-None value; all-float lists skip the per-value calls."""
+    if set(map(type, values)) <= _FLOAT_OR_NONE:
+        return True
+    return all(_is_real(v) for v in values if v is not None)
+
+
+def _batch_masks(
+    candidates: List[Any],
+    constraints: List[Constraint],
+    scalar: bool = False
+) -> List[Optional[List[bool]]]:
+    """
+    Precompute each constraint's outcome for every candidate.
+    
+    Returns one row per constraint: a list of bools (entries for missing
+    values are meaningless and never read), or None where the constraint
+    must be evaluated one candidate at a time. With scalar=True, other
+    constraints are also precomputed, by calling their comparator
+    directly (see _scalar_mask).
+    """
+    try:
+        from ._compat import require_numpy
+        np = require_numpy()
+    except ImportError:
+        np = None
+
+    masks: List[Optional[List[bool]]] = []
+    for constraint in constraints:
+        column_path = np is not None and _has_column_path(constraint)
+        if not (column_path or scalar):
+            masks.append(None)
+            continue
+
+        values = [candidate.get(constraint.name) for candidate in candidates]
+        if column_path and _all_real(values):
+            column = np.array(
+                [float("nan") if v is None else v for v in values],
+                dtype=np.float64
+            )
+            mask = _column_mask(constraint, column)
+            if mask is not None:
+                masks.append(mask.tolist())
+                continue
+        masks.append(_scalar_mask(constraint, values) if scalar else None)
+    return masks
+
+
+def _scalar_mask(constraint: Constraint, values: List[Any]) -> Optional[List[bool]]:
+    """
+    One constraint's outcome per value, with comparator and threshold
+    bound once (entries for None values are meaningless).
+    
+    Returns None if any comparison fails, so the per-candidate path
+    re-runs it and reports the error exactly as evaluate() does.
+    """
+    comparator = constraint.comparator
+    threshold = constraint.threshold
+    try:
+        return [v is not None and bool(comparator(v, threshold)) for v in values]
+    except Exception:
+        return None
+
+
+def _has_column_path(constraint: Constraint) -> bool:
+    """Whether the constraint can be checked a whole column at a time."""
+    from ._jit import HAS_NUMBA
+    from .comparators import PAIR_THRESHOLDS, VECTORIZED
+
+    threshold = constraint.threshold
+    comparator = constraint.comparator
+    if (HAS_NUMBA and constraint.op_code is not None) or comparator in VECTORIZED:
+        if isinstance(threshold, tuple):
+            return (
+                comparator in PAIR_THRESHOLDS
+                and len(threshold) == 2
+                and all(map(_is_real, threshold))
+            )
+        return _is_real(threshold)
+    return False
+
+
+def _column_mask(constraint: Constraint, column: Any) -> Optional[Any]:
+    """
+    Check a float64 column against one constraint (see _has_column_path).
+    
+    Returns a bool array (entries for NaN values are meaningless), or
+    None where the scalar comparator must decide.
+    """
+    from ._jit import HAS_NUMBA
+    from .comparators import VECTORIZED, opcode_bounds
+
+    op_code = constraint.op_code if HAS_NUMBA else None
+    try:
+        if op_code is not None:
+            from ._compat import require_numpy
+            from ._kernels import threshold_values
+            _, lo, hi = opcode_bounds(constraint.comparator, constraint.threshold)
+            return threshold_values(
+                column, op_code, lo, hi, require_numpy().empty(len(column), dtype=bool)
+            )
+        return VECTORIZED[constraint.comparator](column, constraint.threshold)
+    except (TypeError, ValueError):
+        # e.g. malformed thresholds: let the scalar comparator decide
+        return None
+
+
+# -----------------------------
+# Per-candidate evaluation
+# -----------------------------
+
+def _evaluate_candidate(
+    candidate: Union[Candidate, CandidateProtocol],
+    constraints: List[Constraint],
+    strict: bool,
+    check: Optional[Callable[[Constraint, Any], bool]] = None,
+    masks: Optional[List[Optional[List[bool]]]] = None,
+    column: int = 0,
+    fail_fast: bool = False
+) -> EvaluationResult:
+    """
+    Build the EvaluationResult for one candidate (not recorded).
+    
+    check, when given, replaces Constraint.evaluate (see _memoized_check).
+    masks, when given, holds one precomputed row of outcomes per
+    constraint (None = evaluate the constraint here); column selects
+    this candidate's entry in each row. fail_fast stops at the first
+    CRITICAL violation.
+    """
+    violations: List[Violation] = []
+    warnings: List[str] = []
+    evaluated_constraints = 0
+    candidate_name = getattr(candidate, 'name', None)
+    # Plain Candidates: read the dict directly rather than through get()
+    # (subclasses and protocol objects may override get, so keep it there)
+    get = (
+        candidate.properties.get
+        if type(candidate) is Candidate
+        else candidate.get
+    )
+
+    # Evaluate each constraint
+    for i, constraint in enumerate(constraints):
+        value = get(constraint.name)
+
+        # Handle missing data
+        if value is None:
+            if strict:
+                return EvaluationResult(
+                    status=EvaluationStatus.INDETERMINATE,
+                    notes=f"Missing required property: {constraint.name}",
+                    candidate_name=candidate_name
+                )
+            else:
+                warnings.append(
+                    f"Property '{constraint.name}' missing, constraint skipped"
+                )
+                continue
+
+        # Evaluate constraint
+        row = masks[i] if masks is not None else None
+        if row is not None:
+            satisfied = row[column]
+        else:
+            try:
+                if check is not None:
+                    satisfied = check(constraint, value)
+                else:
+                    satisfied = constraint.evaluate(value)
+            except TypeError as e:
+                logger.error("Constraint evaluation failed: %s", e)
+                return EvaluationResult(
+                    status=EvaluationStatus.INDETERMINATE,
+                    notes=f"Constraint evaluation error: {e}",
+                    candidate_name=candidate_name
+                )
+        evaluated_constraints += 1
+
+        # Record violation if constraint not satisfied
+        if not satisfied:
+            violations.append(Violation(source=constraint, observed=value))
+            
+            # Flag low-confidence violations
+            if constraint.provenance and not constraint.provenance.is_well_established():
+                warnings.append(
+                    f"Violation of '{constraint.name}' based on "
+                    f"moderate-confidence constraint "
+                    f"({constraint.provenance.confidence:.2f})"
+                )
+            if fail_fast and constraint.severity is Severity.CRITICAL:
+                break
+
+    # Determine overall status
+    if not violations and not warnings:
+        return EvaluationResult.accepted(candidate_name)
+    if violations:
+        status = EvaluationStatus.REJECTED
+        notes = f"Failed {len(violations)} constraint(s)"
+    elif warnings and evaluated_constraints == 0:
+        status = EvaluationStatus.INDETERMINATE
+        notes = "Insufficient data to evaluate any constraints"
+    else:
+        status = EvaluationStatus.ACCEPTED
+        notes = "All constraints satisfied"
+
+    return EvaluationResult(
+        status=status,
+        violations=tuple(violations),
+        warnings=tuple(warnings),
+        notes=notes,
+        candidate_name=candidate_name
+    )
+
+
+def _critical_first(constraints: Sequence[Constraint]) -> Tuple[Constraint, ...]:
+    """Constraints reordered CRITICAL first (otherwise stable), for fail_fast."""
+    return tuple(sorted(constraints, key=lambda c: c.severity is not Severity.CRITICAL))
+
+
+@dataclass(frozen=True, **_SLOTS)
+class _CompiledPlan:
+    """
+    Everything CuraFrame derives from one constraint set, built once
+    when the set is assigned and shared by every evaluation until the
+    next assignment.
+    
+    Attributes:
+        constraints: The constraints, in registration order
+        names: Their names, in the same order
+        by_name: Read-only name -> constraint index
+        name_set: The names, for set arithmetic
+        critical_first: The constraints, CRITICAL first (for fail_fast)
+    """
+    constraints: Tuple[Constraint, ...]
+    names: Tuple[str, ...]
+    by_name: Mapping[str, Constraint]
+    name_set: FrozenSet[str]
+    critical_first: Tuple[Constraint, ...]
+
+    @classmethod
+    def build(cls, constraints: Iterable[Constraint]) -> "_CompiledPlan":
+        """
+        Raises:
+            ValueError: If two constraints share a name
+        """
+        constraints = tuple(constraints)
+        by_name: Dict[str, Constraint] = {c.name: c for c in constraints}
+        if len(by_name) != len(constraints):
+            seen_names = set()
+            for constraint in constraints:
+                if constraint.name in seen_names:
+                    raise ValueError(f"Duplicate constraint name: {constraint.name}")
+                seen_names.add(constraint.name)
+        return cls(
+            constraints=constraints,
+            names=tuple(by_name),
+            by_name=MappingProxyType(by_name),
+            name_set=frozenset(by_name),
+            critical_first=_critical_first(constraints)
+        )
+
+
+def _copy_result(result: EvaluationResult, candidate_name: Optional[str]) -> EvaluationResult:
+    """Copy of a result (fresh violation/warning lists) under another name."""
+    return replace(
+        result,
+        violations=result.violations if isinstance(result.violations, tuple) else list(result.violations),
+        warnings=result.warnings if isinstance(result.warnings, tuple) else list(result.warnings),
+        candidate_name=candidate_name
+    )
+
+
+# evaluate_many() runs smaller batches inline: below this, pool startup
+# costs more than it saves
+_MIN_PARALLEL_CANDIDATES = 256
+
+
 # -----------------------------
 # CuraFrame core
 # -----------------------------
@@ -414,8 +1105,11 @@ class CuraFrame:
 
     def __init__(
         self,
-        safety_constraints: List[Constraint],
-        name: Optional[str] = None
+        safety_constraints: Sequence[Constraint],
+        name: Optional[str] = None,
+        cache_size: int = 0,
+        history_limit: Optional[int] = 10_000,
+        result_cache_size: int = 0
     ):
         """
         Initialize CuraFrame with safety constraints.
@@ -423,30 +1117,56 @@ class CuraFrame:
         Args:
             safety_constraints: List of non-negotiable safety limits
             name: Optional name for this framework instance (for logging)
+            cache_size: If > 0, memoize up to this many outcomes of costly
+                custom comparators. Only enable this when those comparators
+                are pure functions of (value, threshold).
+            history_limit: Most recent evaluations kept in history (oldest
+                are dropped first); None keeps everything
+            result_cache_size: If > 0, evaluate() remembers the results of
+                up to this many recent (properties, population, strict,
+                fail_fast) combinations and returns a copy for repeats.
+                Same purity requirement as cache_size.
         """
         self.name = name or "CuraFrame"
-        self.safety_constraints = safety_constraints
         self.population_stratifier = PopulationStratification()
-        self.evaluation_history: List[EvaluationResult] = []
+        self.evaluation_history: Deque[EvaluationResult] = deque(maxlen=history_limit)
+        self._history_by_name: Dict[Optional[str], Deque[EvaluationResult]] = {}
+        self._check = _memoized_check(cache_size) if cache_size > 0 else None
+        self._result_cache_size = result_cache_size
+        self._results: "OrderedDict[Any, EvaluationResult]" = OrderedDict()
+        # (stratifier, generation) the cached results were computed under
+        self._results_stamp: Optional[Tuple[PopulationStratification, int]] = None
+        self._export_json: Optional[Tuple[_CompiledPlan, Tuple[Any, ...], str]] = None
         
-        # Validate constraints at initialization
+        # Stores the constraints as a tuple, indexes and validates them
+        self.safety_constraints = safety_constraints
+    
+    @property
+    def safety_constraints(self) -> Tuple[Constraint, ...]:
+        """
+        The registered constraints, as an immutable tuple.
+        
+        Assign a new sequence to replace them; the compiled plan (name
+        index and orderings) is rebuilt and the new set validated.
+        """
+        return self._plan.constraints
+    
+    @safety_constraints.setter
+    def safety_constraints(self, constraints: Sequence[Constraint]) -> None:
+        self._plan = _CompiledPlan.build(constraints)
+        self._results.clear()
         self._validate_constraints()
     
     def _validate_constraints(self) -> None:
         """Ensure all constraints are properly configured."""
-        seen_names = set()
         for constraint in self.safety_constraints:
-            if constraint.name in seen_names:
-                raise ValueError(f"Duplicate constraint name: {constraint.name}")
-            seen_names.add(constraint.name)
-            
             # Warn about low-confidence critical constraints
             if constraint.severity == Severity.CRITICAL:
                 if constraint.provenance and constraint.provenance.requires_verification():
                     logger.warning(
-                        f"CRITICAL constraint '{constraint.name}' has "
-                        f"low confidence ({constraint.provenance.confidence:.2f}). "
-                        "Consider additional validation."
+                        "CRITICAL constraint '%s' has low confidence (%.2f). "
+                        "Consider additional validation.",
+                        constraint.name, constraint.provenance.confidence
                     )
 
     def add_population(
@@ -461,13 +1181,20 @@ class CuraFrame:
             name: Population identifier
             modifiers: Constraint adjustments for this population
         """
+        unknown = set(modifiers) - self._plan.name_set
+        if unknown:
+            logger.warning(
+                "Population '%s' modifies unknown constraint(s): %s",
+                name, sorted(unknown)
+            )
         self.population_stratifier.add_population(name, modifiers)
 
     def evaluate(
         self,
         candidate: Union[Candidate, CandidateProtocol],
         population: Optional[str] = None,
-        strict: bool = True
+        strict: bool = True,
+        fail_fast: bool = False
     ) -> EvaluationResult:
         """
         Evaluate a candidate against all applicable constraints.
@@ -477,6 +1204,10 @@ class CuraFrame:
             population: Patient population context (None = general)
             strict: If True, missing properties -> INDETERMINATE.
                    If False, missing properties are skipped with warning.
+            fail_fast: If True, CRITICAL constraints are checked first and
+                evaluation stops at the first CRITICAL violation: the
+                result is REJECTED with that single violation, and later
+                constraints (including missing properties) are not seen.
         
         Returns:
             EvaluationResult with status and any violations.
@@ -487,110 +1218,248 @@ class CuraFrame:
             - Missing data results in INDETERMINATE (unless strict=False).
         """
         
+        key = None
+        if self._result_cache_size > 0 and type(candidate) is Candidate:
+            # Drop results computed before a population was registered
+            # (through either add_population) or the stratifier replaced
+            stratifier = self.population_stratifier
+            stamp = (stratifier, stratifier._generation)
+            if self._results_stamp != stamp:
+                self._results.clear()
+                self._results_stamp = stamp
+            try:
+                key = (
+                    frozenset(
+                        (k, type(v), v) for k, v in candidate.properties.items()
+                    ),
+                    population, strict, fail_fast
+                )
+                cached = self._results.get(key)
+            except TypeError:  # unhashable property values
+                key = cached = None
+            if cached is not None:
+                self._results.move_to_end(key)
+                result = _copy_result(cached, candidate.name)
+                self._record((result,))
+                return result
+
         # Apply population-specific constraint adjustments
         constraints = self.population_stratifier.apply(
             population,
             self.safety_constraints
         )
+        if fail_fast:
+            constraints = (
+                self._plan.critical_first
+                if constraints is self._plan.constraints
+                else _critical_first(constraints)
+            )
 
-        violations: List[Violation] = []
-        warnings: List[str] = []
-        evaluated_constraints = 0
-        candidate_name = candidate.name if hasattr(candidate, 'name') else None
+        result = _evaluate_candidate(
+            candidate, constraints, strict, self._check, fail_fast=fail_fast
+        )
+        if key is not None:
+            self._results[key] = _copy_result(result, result.candidate_name)
+            if len(self._results) > self._result_cache_size:
+                self._results.popitem(last=False)
+        self._record((result,))
+        return result
 
-        # Evaluate each constraint
-        for constraint in constraints:
-            value = candidate.get(constraint.name)
-
-            # Handle missing data
-            if value is None:
-                if strict:
-                    result = EvaluationResult(
-                        status=EvaluationStatus.INDETERMINATE,
-                        notes=f"Missing required property: {constraint.name}",
-                        candidate_name=candidate_name
-                    )
-                    self.evaluation_history.append(result)
-                    return result
-                else:
-                    warnings.append(
-                        f"Property '{constraint.name}' missing, constraint skipped"
-                    )
-                    continue
+    def evaluate_batch(
+        self,
+        candidates: List[Union[Candidate, CandidateProtocol]],
+        population: Optional[str] = None,
+        strict: bool = True
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many candidates against the same constraints.
+        
+        Equivalent to calling evaluate() on each candidate in order (the
+        results, and the history they are recorded in, are identical),
+        but numeric constraints with a vectorized comparator are checked
+        for all candidates in one NumPy operation (one compiled kernel
+        for opcode comparators when Numba is installed). Other
+        constraints call their comparator in one tight loop over all
+        candidates (or, with cache_size set, go through the result cache
+        per candidate), so comparators should be free of side effects:
+        they may also see values of candidates whose evaluation stops
+        early. A comparison that raises is redone per candidate, where
+        it is reported as in evaluate().
+        
+        Args:
+            candidates: Hypothetical designs to evaluate
+            population: Patient population context (None = general)
+            strict: As for evaluate()
+        
+        Returns:
+            One EvaluationResult per candidate, in input order.
+        """
+        constraints = self.population_stratifier.apply(
+            population,
+            self.safety_constraints
+        )
+        masks = _batch_masks(candidates, constraints, scalar=self._check is None)
 
-            # Evaluate constraint
-            try:
-                satisfied = constraint.evaluate(value)
-            except TypeError as e:
-                logger.error(f"Constraint evaluation failed: {e}")
-                result = EvaluationResult(
-                    status=EvaluationStatus.INDETERMINATE,
-                    notes=f"Constraint evaluation error: {e}",
-                    candidate_name=candidate_name
-                )
-                self.evaluation_history.append(result)
-                return result
-            evaluated_constraints += 1
-
-            # Record violation if constraint not satisfied
-            if not satisfied:
-                confidence = (
-                    constraint.provenance.confidence 
-                    if constraint.provenance 
-                    else 1.0
-                )
-                
-                violations.append(
-                    Violation(
-                        constraint=constraint.name,
-                        observed=value,
-                        threshold=constraint.threshold,
-                        rationale=constraint.rationale,
-                        severity=constraint.severity,
-                        confidence=confidence
-                    )
-                )
-                
-                # Flag low-confidence violations
-                if constraint.provenance and not constraint.provenance.is_well_established():
-                    warnings.append(
-                        f"Violation of '{constraint.name}' based on "
-                        f"moderate-confidence constraint "
-                        f"({constraint.provenance.confidence:.2f})"
-                    )
+        results = [
+            _evaluate_candidate(candidate, constraints, strict, self._check, masks, j)
+            for j, candidate in enumerate(candidates)
+        ]
+        self._record(results)
+        return results
+
+    def evaluate_many(
+        self,
+        candidates: List[Union[Candidate, CandidateProtocol]],
+        population: Optional[str] = None,
+        strict: bool = True,
+        workers: Optional[int] = None,
+        process_pool: bool = False,
+        min_parallel: int = _MIN_PARALLEL_CANDIDATES
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many candidates concurrently.
+        
+        Results (and the history they are recorded in) are identical to
+        calling evaluate() on each candidate in order.
+        
+        Args:
+            candidates: Hypothetical designs to evaluate
+            population: Patient population context (None = general)
+            strict: As for evaluate()
+            workers: Pool size (default: os.cpu_count())
+            process_pool: Use worker processes instead of threads, for
+                CPU-bound comparators. Constraints and candidates must then
+                be picklable: use module-level comparator functions, not
+                lambdas or closures. The result cache (cache_size) is not
+                shared with worker processes.
+            min_parallel: Batches smaller than this are evaluated in the
+                calling thread, where pool startup would dominate.
+        
+        Notes:
+            Threads only help when comparators release the GIL (I/O,
+            native code); the built-in comparators do not.
+        """
+        constraints = self.population_stratifier.apply(
+            population,
+            self.safety_constraints
+        )
+        evaluate_one = functools.partial(
+            _evaluate_candidate,
+            constraints=constraints,
+            strict=strict,
+            check=None if process_pool else self._check
+        )
 
-        # Determine overall status
-        if violations:
-            status = EvaluationStatus.REJECTED
-            notes = f"Failed {len(violations)} constraint(s)"
-        elif warnings and evaluated_constraints == 0:
-            status = EvaluationStatus.INDETERMINATE
-            notes = "Insufficient data to evaluate any constraints"
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(candidates) < min_parallel:
+            results = [evaluate_one(candidate) for candidate in candidates]
+        elif process_pool:
+            chunksize = max(1, len(candidates) // (workers * 4))
+            # spawn, not fork: forking after Numba's threading layer has
+            # started (e.g. a prior evaluate_batch) deadlocks the children
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = list(executor.map(evaluate_one, candidates, chunksize=chunksize))
         else:
-            status = EvaluationStatus.ACCEPTED
-            notes = "All constraints satisfied"
-
-        result = EvaluationResult(
-            status=status,
-            violations=violations,
-            warnings=warnings,
-            notes=notes,
-            candidate_name=candidate_name
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(evaluate_one, candidates))
+
+        self._record(results)
+        return results
+
+    def evaluate_table(
+        self,
+        table: CandidateTable,
+        population: Optional[str] = None,
+        strict: bool = True
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate every row of a CandidateTable.
+        
+        Results (and the history they are recorded in) are identical to
+        calling evaluate() on each candidate in row order, with NaN
+        entries treated as missing properties. Vectorizable constraints
+        are checked once per column; other constraints fall back to the
+        scalar comparator row by row.
+        
+        Args:
+            table: Candidates in column-oriented form
+            population: Patient population context (None = general)
+            strict: As for evaluate()
+        
+        Returns:
+            One EvaluationResult per row, in table order.
+        """
+        from ._compat import require_numpy
+        np = require_numpy()
+
+        constraints = self.population_stratifier.apply(
+            population,
+            self.safety_constraints
         )
+        n = len(table)
+        masks: List[Optional[List[bool]]] = []
+        clean = np.ones(n, dtype=bool)
+        for constraint in constraints:
+            column = table.columns.get(constraint.name)
+            if column is None:
+                clean[:] = False
+                masks.append(None)
+                continue
+            mask = _column_mask(constraint, column) if _has_column_path(constraint) else None
+            if mask is not None:
+                mask = mask.tolist()
+            elif self._check is None:
+                mask = _scalar_mask(
+                    constraint, [None if v != v else v for v in column.tolist()]
+                )
+            if mask is None:
+                clean[:] = False
+                masks.append(None)
+                continue
+            clean &= np.array(mask, dtype=bool) & ~np.isnan(column)
+            masks.append(mask)
 
-        self.evaluation_history.append(result)
-        return result
+        results = [
+            EvaluationResult.accepted(table.names[j])
+            if ok
+            else _evaluate_candidate(
+                _TableRow(table, j), constraints, strict, self._check, masks, j
+            )
+            for j, ok in enumerate(clean.tolist())
+        ]
+        self._record(results)
+        return results
 
     def get_constraint(self, name: str) -> Optional[Constraint]:
         """Retrieve a constraint by name."""
-        for c in self.safety_constraints:
-            if c.name == name:
-                return c
-        return None
+        return self._plan.by_name.get(name)
 
     def list_constraints(self) -> List[str]:
         """Return names of all registered constraints."""
-        return [c.name for c in self.safety_constraints]
+        return list(self._plan.names)
+
+    def _record(self, results: Iterable[EvaluationResult]) -> None:
+        """Append results to history, keeping the per-name index in step."""
+        history = self.evaluation_history
+        if history.maxlen == 0:
+            return
+        by_name = self._history_by_name
+        for result in results:
+            if history.maxlen is not None and len(history) == history.maxlen:
+                # The evicted entry is also the oldest for its name
+                evicted = history.popleft()
+                named = by_name[evicted.candidate_name]
+                named.popleft()
+                if not named:
+                    del by_name[evicted.candidate_name]
+            history.append(result)
+            named = by_name.get(result.candidate_name)
+            if named is None:
+                named = by_name[result.candidate_name] = deque()
+            named.append(result)
 
     def get_history(self, candidate_name: Optional[str] = None) -> List[EvaluationResult]:
         """
@@ -600,15 +1469,12 @@ class CuraFrame:
             candidate_name: Filter by candidate name (None = all results)
         
         Returns:
-            List of EvaluationResults.
+            List of EvaluationResults, oldest first (at most history_limit).
         """
         if candidate_name is None:
-            return self.evaluation_history
+            return list(self.evaluation_history)
         
-        return [
-            r for r in self.evaluation_history 
-            if r.candidate_name == candidate_name
-        ]
+        return list(self._history_by_name.get(candidate_name, ()))
 
     def export_constraints(self) -> Dict[str, Any]:
         """
@@ -627,7 +1493,7 @@ class CuraFrame:
                     "provenance": {
                         "source": c.provenance.source_type,
                         "confidence": c.provenance.confidence,
-                        "references": c.provenance.references
+                        "references": list(c.provenance.references)
                     } if c.provenance else None
                 }
                 for c in self.safety_constraints
@@ -635,6 +1501,39 @@ class CuraFrame:
             "populations": self.population_stratifier.get_populations()
         }
 
+    def export_constraints_json(self, indent: bool = False) -> str:
+        """
+        export_constraints() as JSON text.
+        
+        Encoded with orjson when it is installed (falling back to the
+        standard library), and cached until the constraints, populations
+        or framework name change.
+        
+        Args:
+            indent: Indent nested structures by two spaces
+        """
+        key = (self.name, tuple(self.population_stratifier.get_populations()), indent)
+        cached = self._export_json
+        if cached is not None and cached[0] is self._plan and cached[1] == key:
+            return cached[2]
+
+        export = self.export_constraints()
+        try:
+            import orjson
+        except ImportError:  # orjson is optional
+            import json
+            text = (
+                json.dumps(export, indent=2, ensure_ascii=False)
+                if indent
+                else json.dumps(export, separators=(",", ":"), ensure_ascii=False)
+            )
+        else:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            text = orjson.dumps(export, option=option).decode("utf-8")
+
+        self._export_json = (self._plan, key, text)
+        return text
+
     def __repr__(self) -> str:
         return (
             f"CuraFrame(name='{self.name}', "
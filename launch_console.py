@@ -20,6 +20,7 @@ Philosophy:
     All logic lives in cura_frame (core) and apps/console_streamlit (UI).
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -39,17 +40,8 @@ def main():
         print(f"Expected path: {app_path.absolute()}", file=sys.stderr)
         sys.exit(1)
     
-    # Check if streamlit is available
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "streamlit", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            raise FileNotFoundError
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    # Check if streamlit is available (without starting an interpreter)
+    if importlib.util.find_spec("streamlit") is None:
         print(
             "Error: Streamlit is not installed or not accessible.\n"
             "Install it with: pip install streamlit",
@@ -0,0 +1,554 @@
+"""
+CuraFrame Comparator Tests
+
+Tests the pure comparison functions in cura_frame.comparators.
+
+Tests focus on:
+- Agreement between scalar and vectorized comparators
+- NaN / Inf handling
+- Threshold forms (scalar vs (value, epsilon) tuples)
+"""
+
+import math
+import sys
+
+import pytest
+
+from cura_frame import comparators as cmp
+
+
+VALUES = [-1.0, 0.0, 0.5, 1.0, 3.999, 4.0, 4.001, 10.0, 150.0, math.nan, math.inf]
+
+
+def _scalar(fn, values, *args):
+    return [fn(v, *args) for v in values]
+
+
+# -----------------------------
+# Vectorized comparators
+# -----------------------------
+
+class TestVectorizedComparators:
+    """Vectorized comparators must agree element-wise with scalar ones."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("scalar, vec, threshold", [
+        (cmp.less_than, cmp.less_than_vec, 4.0),
+        (cmp.less_than_or_equal, cmp.less_than_or_equal_vec, 4.0),
+        (cmp.greater_than, cmp.greater_than_vec, 4.0),
+        (cmp.greater_than_or_equal, cmp.greater_than_or_equal_vec, 4.0),
+        (cmp.approximately_equal_to, cmp.approximately_equal_to_vec, (4.0, 0.01)),
+        (cmp.approximately_equal_to, cmp.approximately_equal_to_vec, 4.0),
+        (cmp.within_range, cmp.within_range_vec, (1.0, 10.0)),
+        (cmp.ratio_greater_than, cmp.ratio_greater_than_vec, 100.0),
+        (cmp.ratio_greater_than, cmp.ratio_greater_than_vec, (100.0, 0.5)),
+        (cmp.ratio_less_than, cmp.ratio_less_than_vec, 4.0),
+    ])
+    def test_vec_matches_scalar(self, scalar, vec, threshold):
+        expected = _scalar(scalar, VALUES, threshold)
+
+        assert vec(VALUES, threshold).tolist() == expected
+
+    @pytest.mark.parametrize("vec, threshold", [
+        (cmp.less_than_vec, 4.0),
+        (cmp.greater_than_or_equal_vec, 4.0),
+        (cmp.approximately_equal_to_vec, (4.0, 0.01)),
+        (cmp.within_range_vec, (1.0, 10.0)),
+        (cmp.ratio_greater_than_vec, 100.0),
+        (cmp.ratio_less_than_vec, 4.0),
+    ])
+    def test_vec_fills_out_buffer(self, vec, threshold):
+        import numpy as np
+        out = np.ones(len(VALUES), dtype=bool)
+
+        result = vec(VALUES, threshold, out=out)
+
+        assert result is out
+        assert out.tolist() == vec(VALUES, threshold).tolist()
+
+    def test_within_range_vec_exclusive(self):
+        expected = [cmp.within_range(v, (1.0, 10.0), inclusive=False) for v in VALUES]
+
+        assert cmp.within_range_vec(VALUES, (1.0, 10.0), inclusive=False).tolist() == expected
+
+    def test_within_range_vec_inverted_bounds_match_scalar(self):
+        for inclusive in (True, False):
+            expected = [cmp.within_range(v, (10.0, 1.0), inclusive) for v in VALUES]
+            got = cmp.within_range_vec(VALUES, (10.0, 1.0), inclusive=inclusive)
+
+            assert got.tolist() == expected == [False] * len(VALUES)
+
+    def test_within_tolerance_vec_matches_scalar(self):
+        finite = [v for v in VALUES if math.isfinite(v)]
+        for relative in (False, True):
+            expected = [cmp.within_tolerance(v, 4.0, 0.25, relative) for v in finite]
+            got = cmp.within_tolerance_vec(finite, 4.0, 0.25, relative)
+
+            assert got.tolist() == expected
+
+
+# -----------------------------
+# Batch (JIT-able) kernels
+# -----------------------------
+
+class TestBatchKernels:
+    """Batch kernels must agree row-wise with their scalar reference."""
+
+    ROWS = [
+        (10.0, 8.0, 12.0),   # straddles threshold
+        (9.0, 8.0, 9.5),     # entirely below
+        (11.0, 10.5, 12.0),  # entirely above
+        (10.0, 9.9, 10.1),   # mostly below
+        (10.0, math.nan, 12.0),
+    ]
+
+    @pytest.mark.parametrize("comparator, threshold", [
+        (cmp.less_than_or_equal, 4.0),
+        (cmp.greater_than_or_equal, 10.0),
+        (cmp.less_than, 4.0),
+        (cmp.greater_than, 10.0),
+        (cmp.within_range, (2.0, 4.0)),
+        (cmp.within_range, (4.0, 2.0)),  # inverted: rejects everything
+        (cmp.ratio_greater_than, 100.0),
+        (cmp.ratio_greater_than, (100.0, 0.5)),
+    ])
+    def test_threshold_kernel_matches_scalar(self, comparator, threshold):
+        np = pytest.importorskip("numpy")
+        from cura_frame._kernels import threshold_values
+
+        values = [-math.inf, 0.0, 2.0, 3.0, 4.0, 10.0, 100.0, 100.5, 101.0, math.inf, math.nan]
+        op, lo, hi = cmp.opcode_bounds(comparator, threshold)
+        got = threshold_values(np.array(values), op, lo, hi, np.empty(len(values), dtype=bool))
+
+        assert got.tolist() == [comparator(v, threshold) for v in values]
+
+        table = {"lo": np.array([lo]), "hi": np.array([hi]), "opcode": np.array([op], dtype=np.int8)}
+        assert cmp.evaluate_soa(np.array(values)[:, None], table)[:, 0].tolist() == got.tolist()
+
+    @pytest.mark.parametrize("call", [
+        lambda np, out: cmp.conservative_upper_bound_batch(np.tile([1.0, 0.5, 2.0], (1000, 1)), 5.0, out=out),
+        lambda np, out: cmp.conservative_lower_bound_batch(np.tile([1.0, 0.5, 2.0], (1000, 1)), 5.0, out=out),
+        lambda np, out: cmp.probabilistic_satisfaction_batch(np.tile([1.0, 0.5, 2.0], (1000, 1)), 5.0, out=out),
+        lambda np, out: cmp.approximately_equal_to_batch(np.ones(1000), 1.0, out=out),
+        lambda np, out: cmp.within_tolerance_batch(np.ones(1000), 1.0, 0.1, out=out),
+    ])
+    def test_batch_rejects_mismatched_out_buffer(self, call):
+        np = pytest.importorskip("numpy")
+
+        for bad in (np.zeros(2, dtype=bool), np.zeros(1000, dtype=np.int8), [False] * 1000):
+            with pytest.raises(ValueError, match="bool out array"):
+                call(np, bad)
+        assert call(np, np.zeros(1000, dtype=bool)).shape == (1000,)
+
+    def test_threshold_kernel_rejects_short_out_buffer(self):
+        np = pytest.importorskip("numpy")
+        from cura_frame._kernels import threshold_values
+
+        with pytest.raises(ValueError):
+            threshold_values(np.ones(1000), cmp.OP_LE, -math.inf, 4.0, np.empty(2, dtype=bool))
+
+    def test_interpreted_kernels_warn_once(self, monkeypatch):
+        import importlib.util
+        import warnings
+        from cura_frame import _jit
+
+        monkeypatch.setitem(sys.modules, "numba", None)
+        spec = importlib.util.spec_from_file_location("_jit_without_numba", _jit.__file__)
+        fallback = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fallback)
+        add_one = fallback.njit("f8(f8)", cache=True)(lambda x: x + 1.0)
+
+        assert not fallback.HAS_NUMBA
+        with pytest.warns(RuntimeWarning, match="Numba is not installed"):
+            assert add_one(1.0) == 2.0
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert add_one(2.0) == 3.0
+
+    def test_probabilistic_satisfaction_batch_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        rows = np.array(self.ROWS)
+
+        for confidence in (0.4, 0.5, 0.95):
+            expected = [
+                cmp.probabilistic_satisfaction(r, 10.05, confidence) for r in self.ROWS
+            ]
+            got = cmp.probabilistic_satisfaction_batch(rows, 10.05, confidence)
+
+            assert got.tolist() == expected
+
+    @pytest.mark.parametrize("scalar, batch", [
+        (cmp.conservative_upper_bound, cmp.conservative_upper_bound_batch),
+        (cmp.conservative_lower_bound, cmp.conservative_lower_bound_batch),
+    ])
+    def test_conservative_batch_matches_scalar(self, scalar, batch):
+        np = pytest.importorskip("numpy")
+        rows = self.ROWS + [(10.0, 9.0, math.inf), (10.0, -math.inf, 11.0)]
+
+        for threshold in (8.5, 10.05, 11.5):
+            expected = [scalar(r, threshold) for r in rows]
+
+            assert batch(np.array(rows), threshold).tolist() == expected
+
+    def test_within_tolerance_batch_matches_scalar(self):
+        pytest.importorskip("numpy")
+        for relative in (False, True):
+            expected = [cmp.within_tolerance(v, 4.0, 0.25, relative) for v in VALUES]
+
+            assert cmp.within_tolerance_batch(VALUES, 4.0, 0.25, relative).tolist() == expected
+
+    @pytest.mark.parametrize("threshold", [4.0, (4.0, 0.01)])
+    def test_approximately_equal_to_batch_matches_scalar(self, threshold):
+        pytest.importorskip("numpy")
+        expected = _scalar(cmp.approximately_equal_to, VALUES, threshold)
+
+        assert cmp.approximately_equal_to_batch(VALUES, threshold).tolist() == expected
+
+    def test_probabilistic_satisfaction_batch_writes_into_out(self):
+        np = pytest.importorskip("numpy")
+        out = np.zeros(len(self.ROWS), dtype=bool)
+
+        result = cmp.probabilistic_satisfaction_batch(np.array(self.ROWS), 10.0, out=out)
+
+        assert result is out
+
+    def test_probabilistic_satisfaction_batch_rejects_bad_shape(self):
+        np = pytest.importorskip("numpy")
+
+        with pytest.raises(ValueError, match=r"\(N, 3\)"):
+            cmp.probabilistic_satisfaction_batch(np.zeros((4, 2)), 1.0)
+
+
+# -----------------------------
+# Columnar uncertainty
+# -----------------------------
+
+class TestUncertainArray:
+    """SoA comparators must agree with the scalar tuple API."""
+
+    ROWS = TestBatchKernels.ROWS + [(10.0, 9.0, math.inf), (10.0, 10.0, 10.0)]
+
+    @pytest.fixture
+    def ua(self):
+        pytest.importorskip("numpy")
+        return cmp.UncertainArray.from_tuples(self.ROWS)
+
+    @pytest.mark.parametrize("scalar, soa", [
+        (cmp.conservative_upper_bound, cmp.conservative_upper_bound_soa),
+        (cmp.conservative_lower_bound, cmp.conservative_lower_bound_soa),
+        (cmp.probabilistic_satisfaction, cmp.probabilistic_satisfaction_soa),
+    ])
+    @pytest.mark.parametrize("threshold", [8.5, 10.0, 10.05, 11.5])
+    def test_soa_matches_scalar(self, ua, scalar, soa, threshold):
+        expected = [scalar(r, threshold) for r in self.ROWS]
+
+        assert soa(ua, threshold).tolist() == expected
+
+    def test_optimistic_nominal_soa(self, ua):
+        expected = [
+            cmp.optimistic_nominal(r, 10.0, cmp.greater_than_or_equal) for r in self.ROWS
+        ]
+
+        assert cmp.optimistic_nominal_soa(ua, 10.0, cmp.greater_than_or_equal_vec).tolist() == expected
+
+    def test_rejects_mismatched_columns(self):
+        pytest.importorskip("numpy")
+
+        with pytest.raises(ValueError, match="same shape"):
+            cmp.UncertainArray([1.0, 2.0], [0.5], [1.5, 2.5])
+
+
+# -----------------------------
+# Combinators
+# -----------------------------
+
+class TestCombinators:
+    """Combinator factories are memoized and keep their semantics."""
+
+    @pytest.mark.parametrize("factory", [cmp.all_of, cmp.any_of, cmp.none_of])
+    def test_factory_returns_same_closure(self, factory):
+        first = factory(cmp.greater_than, cmp.less_than_or_equal)
+
+        assert factory(cmp.greater_than, cmp.less_than_or_equal) is first
+        assert factory(cmp.less_than_or_equal, cmp.greater_than) is not first
+
+    @pytest.mark.parametrize("factory", [
+        cmp.all_of, cmp.any_of, cmp.none_of, cmp.all_of_compiled, cmp.null_safe,
+    ])
+    def test_unhashable_comparators_are_combined_uncached(self, factory):
+        class AtMost:
+            __hash__ = None
+
+            def __call__(self, value, threshold):
+                return value <= threshold
+
+        combined = factory(AtMost())
+
+        negated = factory is cmp.none_of
+        assert combined(1.0, 2.0) is not negated
+        assert combined(3.0, 2.0) is negated
+
+    def test_null_safe_returns_same_wrapper_per_default(self):
+        safe = cmp.null_safe(cmp.greater_than, True)
+
+        assert cmp.null_safe(cmp.greater_than, True) is safe
+        assert cmp.null_safe(cmp.greater_than, False) is not safe
+        assert safe(None, 10) is True
+        assert cmp.null_safe(cmp.greater_than, False)(None, 10) is False
+
+    def test_combinator_names(self):
+        assert cmp.all_of(cmp.greater_than, cmp.less_than).__name__ == "all_of(greater_than, less_than)"
+        assert cmp.none_of(cmp.equal_to).__name__ == "none_of(equal_to)"
+        assert cmp.null_safe(cmp.less_than).__name__ == "null_safe(less_than)"
+
+    ARITIES = [
+        (cmp.greater_than,),
+        (cmp.greater_than, cmp.less_than_or_equal),
+        (cmp.greater_than, cmp.less_than_or_equal, cmp.not_equal_to),
+        (cmp.greater_than, cmp.less_than_or_equal, cmp.not_equal_to, cmp.equal_to),
+    ]
+
+    @pytest.mark.parametrize("factory, reduce", [
+        (cmp.all_of, all),
+        (cmp.any_of, any),
+        (cmp.none_of, lambda results: not any(results)),
+    ])
+    @pytest.mark.parametrize("comparators", ARITIES)
+    def test_combinator_matches_reduction(self, factory, reduce, comparators):
+        combined = factory(*comparators)
+
+        for value in (3, 4, 5, 10, 11):
+            expected = reduce([c(value, 4) for c in comparators])
+
+            assert combined(value, 4) is expected
+
+    @pytest.mark.parametrize("comparators", ARITIES + [
+        (),
+        (cmp.greater_than, cmp.approximately_equal_to, cmp.less_than),
+        (cmp.null_safe(cmp.greater_than), cmp.less_than_or_equal),
+    ])
+    def test_all_of_compiled_matches_all_of(self, comparators):
+        compiled = cmp.all_of_compiled(*comparators)
+
+        for value in (3, 4, 4.0 + 1e-12, 5, 10, 11):
+            assert compiled(value, 4) is cmp.all_of(*comparators)(value, 4)
+
+        assert cmp.all_of_compiled(*comparators) is compiled
+
+    def test_all_of_compiled_raises_like_comparators(self):
+        compiled = cmp.all_of_compiled(cmp.greater_than, cmp.less_than)
+
+        with pytest.raises(TypeError):
+            compiled("5", 4)
+
+
+# -----------------------------
+# Scalar kernels
+# -----------------------------
+
+@pytest.mark.parametrize("polymorphic, kernel, threshold", [
+    (cmp.approximately_equal_to, cmp.approximately_equal_to_scalar, (4.0, 0.01)),
+    (cmp.approximately_equal_to, cmp.approximately_equal_to_scalar, 4.0),
+    (cmp.significantly_greater_than, cmp.significantly_greater_than_scalar, (4.0, 0.01)),
+    (cmp.significantly_greater_than, cmp.significantly_greater_than_scalar, 4.0),
+    (cmp.significantly_less_than, cmp.significantly_less_than_scalar, (4.0, 0.01)),
+    (cmp.significantly_less_than, cmp.significantly_less_than_scalar, 4.0),
+    (cmp.ratio_greater_than, cmp.ratio_greater_than_scalar, (4.0, 0.01)),
+    (cmp.ratio_greater_than, cmp.ratio_greater_than_scalar, 4.0),
+    (cmp.ratio_less_than, cmp.ratio_less_than_scalar, (4.0, 0.01)),
+    (cmp.ratio_less_than, cmp.ratio_less_than_scalar, 4.0),
+])
+def test_scalar_kernel_matches_polymorphic(polymorphic, kernel, threshold):
+    args = threshold if isinstance(threshold, tuple) else (threshold,)
+
+    assert _scalar(kernel, VALUES, *args) == _scalar(polymorphic, VALUES, threshold)
+
+
+# -----------------------------
+# Range comparators
+# -----------------------------
+
+class TestRangeComparators:
+    """Bounds are validated at construction, not on every within_range call."""
+
+    def test_within_range_nan_fails(self):
+        assert cmp.within_range(math.nan, (1.0, 10.0)) is False
+        assert cmp.within_range(math.nan, (1.0, 10.0), inclusive=False) is False
+
+    def test_within_range_inverted_bounds_fail_closed(self):
+        assert cmp.within_range(5.0, (10.0, 1.0)) is False
+
+    def test_outside_range_still_rejects_inverted_bounds(self):
+        with pytest.raises(ValueError, match="Invalid bounds"):
+            cmp.outside_range(5.0, (10.0, 1.0))
+
+    def test_validate_bounds(self):
+        bounds = (1.0, 10.0)
+
+        assert cmp.validate_bounds(bounds) is bounds
+        with pytest.raises(ValueError, match="Invalid bounds"):
+            cmp.validate_bounds((10.0, 1.0))
+
+    def test_library_range_factories_validate_bounds(self):
+        from cura_frame.constraints_library import molecular_weight_range
+
+        with pytest.raises(ValueError, match="Invalid bounds"):
+            molecular_weight_range(600.0, 150.0)
+
+
+# -----------------------------
+# Selectivity
+# -----------------------------
+
+class TestSelectivity:
+
+    def test_results_are_cached(self):
+        cmp.selectivity_satisfied.cache_clear()
+
+        assert cmp.selectivity_satisfied(1.0, 200.0, 100.0) is True
+        assert cmp.selectivity_satisfied(1.0, 200.0, 100.0) is True
+        assert cmp.selectivity_satisfied.cache_info().hits == 1
+
+    @pytest.mark.parametrize("Kd_on, Kd_off, min_sel, expected", [
+        (2.0, 200.0, 100.0, True),   # exactly at the boundary
+        (2.0, 199.0, 100.0, False),
+        (1e-9, 50e-9, 100.0, False),
+        # The ratio rounds to 2.9999999999999996: must fail, as the
+        # multiplied form (3.0 * Kd_on) would have let it pass
+        (7.185218312941143e-07, 2.1555654938823426e-06, 3.0, False),
+    ])
+    def test_threshold_boundary(self, Kd_on, Kd_off, min_sel, expected):
+        assert cmp.selectivity_satisfied(Kd_on, Kd_off, min_sel) is expected
+
+    def test_invalid_kd_raises_every_call(self):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="must be positive"):
+                cmp.selectivity_satisfied(0.0, 1e-9, 10.0)
+
+
+@pytest.mark.parametrize("factory, comparator", [
+    (cmp.make_ratio_greater_than, cmp.ratio_greater_than),
+    (cmp.make_ratio_less_than, cmp.ratio_less_than),
+])
+@pytest.mark.parametrize("threshold", [4.0, (4.0, 0.01), (100.0, 0.5)])
+def test_bound_ratio_predicate_matches_comparator(factory, comparator, threshold):
+    predicate = factory(threshold)
+
+    assert [predicate(v) for v in VALUES] == _scalar(comparator, VALUES, threshold)
+
+
+# -----------------------------
+# Validation helpers
+# -----------------------------
+
+@pytest.mark.parametrize("value, finite, positive, non_negative", [
+    (1.0, True, True, True),
+    (0.0, True, False, True),
+    (-1.0, True, False, False),
+    (math.inf, False, False, False),
+    (math.nan, False, False, False),
+])
+def test_validation_helpers(value, finite, positive, non_negative):
+    assert cmp.is_finite(value) is finite
+    assert cmp.is_positive(value) is positive
+    assert cmp.is_non_negative(value) is non_negative
+
+
+@pytest.mark.parametrize("comparator", [
+    cmp.ratio_greater_than,
+    cmp.ratio_less_than,
+    cmp.significantly_greater_than,
+    cmp.significantly_less_than,
+])
+@pytest.mark.parametrize("threshold", [4.0, (4.0, 0.01)])
+def test_prebaked_kernel_matches_comparator(comparator, threshold):
+    kernel, adjusted = cmp.prebake(comparator, threshold)
+
+    assert kernel is not comparator
+    assert _scalar(kernel, VALUES, adjusted) == _scalar(comparator, VALUES, threshold)
+
+
+def test_prebake_passes_through_other_comparators():
+    assert cmp.prebake(cmp.within_range, (1.0, 2.0)) == (cmp.within_range, (1.0, 2.0))
+
+
+def test_within_tolerance_prebaked_matches_relative():
+    finite = [v for v in VALUES if math.isfinite(v)]
+    expected = [cmp.within_tolerance(v, 4.0, 0.25, relative=True) for v in finite]
+
+    assert [cmp.within_tolerance_prebaked(v, 4.0, abs(4.0 * 0.25)) for v in finite] == expected
+
+
+class TestCombinatorResultMemo:
+    """Opt-in result memoization must not change combinator results."""
+
+    @pytest.mark.parametrize("factory", [cmp.all_of, cmp.any_of, cmp.none_of])
+    def test_memoized_matches_plain(self, factory):
+        plain = factory(cmp.greater_than, cmp.less_than_or_equal)
+        memoized = factory(cmp.greater_than, cmp.less_than_or_equal, cache_size=8)
+
+        for value in (3, 4, 5, 3, 4, 5):
+            assert memoized(value, 4) is plain(value, 4)
+        assert memoized.cache_info().hits == 3
+
+    def test_unhashable_inputs_bypass_memo(self):
+        calls = []
+
+        def recording(value, threshold):
+            calls.append(value)
+            return True
+
+        memoized = cmp.all_of(recording, recording, cache_size=8)
+        memoized([1], 0)
+        memoized([1], 0)
+
+        assert len(calls) == 4
+        assert memoized.cache_info().currsize == 0
+
+
+# -----------------------------
+# Bulk evaluation
+# -----------------------------
+
+class TestEvaluateAll:
+    """evaluate_all must agree with per-candidate scalar evaluation."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_matches_scalar_constraints(self):
+        from cura_frame import Constraint, Severity
+
+        constraints = [
+            Constraint("a", 4.0, cmp.less_than_or_equal, "", Severity.CRITICAL),
+            Constraint("b", (1.0, 10.0), cmp.within_range, "", Severity.SEVERE),
+            Constraint("c", (100.0, 0.5), cmp.ratio_greater_than, "", Severity.WARNING),
+            Constraint("d", 4.0, cmp.null_safe(cmp.greater_than), "", Severity.WARNING),
+        ]
+        values = [VALUES] * len(constraints)
+
+        mask = cmp.evaluate_all(values, constraints)
+
+        for i, c in enumerate(constraints):
+            assert mask[i].tolist() == _scalar(c.comparator, VALUES, c.threshold)
+
+    def test_rejects_mismatched_rows(self):
+        from cura_frame import Constraint, Severity
+
+        c = Constraint("a", 4.0, cmp.less_than, "", Severity.WARNING)
+
+        with pytest.raises(ValueError, match=r"\(1, N\)"):
+            cmp.evaluate_all([[1.0], [2.0]], [c])
+
+
+def test_annotations_resolve_at_runtime():
+    import typing
+
+    hints = typing.get_type_hints(cmp.within_range)
+
+    assert hints["bounds"] == typing.Tuple[float, float]
+    assert typing.get_type_hints(cmp.all_of)["return"] is not None
@@ -0,0 +1,51 @@
+"""
+CuraFrame Console Serialization Tests
+
+Tests the JSON export helpers of the Streamlit console
+(apps/console_streamlit/app.py), loaded without a running server.
+
+Tests focus on:
+- Exports matching the standard library output where orjson would differ
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+APP_PATH = Path(__file__).resolve().parents[1] / "apps" / "console_streamlit" / "app.py"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The console module, executed once in Streamlit's bare mode."""
+    spec = importlib.util.spec_from_file_location("console_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# -----------------------------
+# Export serialization
+# -----------------------------
+
+class TestDumps:
+    """_dumps() never loses or rejects values the stdlib encodes."""
+
+    def test_integer_beyond_64_bits(self, app):
+        payload = {"observed": 2 ** 70}
+        assert app._dumps(payload) == json.dumps(payload, indent=2)
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf")])
+    def test_non_finite_float_is_not_nulled(self, app, value):
+        payload = {"violations": [{"observed": value}]}
+        text = app._dumps(payload)
+        assert text == json.dumps(payload, indent=2)
+        assert "null" not in text
+
+    def test_plain_payload_round_trips(self, app):
+        payload = {"status": "rejected", "violations": [{"observed": 6.0}]}
+        assert json.loads(app._dumps(payload)) == payload
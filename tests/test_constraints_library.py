@@ -0,0 +1,198 @@
+"""
+CuraFrame Constraint Library Tests
+
+Tests the canonical constraint factories and bundles in
+cura_frame.constraints_library.
+
+Tests focus on:
+- Factory memoization and instance sharing
+- Bundle composition
+"""
+
+import pytest
+
+from cura_frame import CuraFrame, Constraint
+from cura_frame import constraints_library as lib
+
+
+# -----------------------------
+# Factory memoization
+# -----------------------------
+
+class TestFactoryMemoization:
+    """Identical factory calls share one Constraint instance."""
+
+    def test_default_call_returns_same_instance(self):
+        assert lib.logP_max() is lib.logP_max()
+        assert lib.hERG_ic50_min() is lib.hERG_ic50_min()
+
+    def test_different_thresholds_are_distinct(self):
+        assert lib.logP_max(3.5) is not lib.logP_max()
+        assert lib.logP_max(3.5).threshold == 3.5
+
+    def test_bundles_share_factory_instances(self):
+        core = {c.name: c for c in lib.core_safety_constraints()}
+        cardio = {c.name: c for c in lib.cardiology_oriented_constraints()}
+
+        assert core["logP"] is cardio["logP"]
+
+    def test_modifier_does_not_affect_cached_instance(self):
+        derived = lib.logP_max().with_modifier(lambda c: c.threshold - 1.0)
+
+        assert derived.threshold == 3.0
+        assert lib.logP_max().threshold == 4.0
+
+    def test_constraints_are_hashable(self):
+        assert len({lib.logP_max(), lib.logP_max(), lib.logP_max(3.5)}) == 2
+
+
+# -----------------------------
+# Bundles
+# -----------------------------
+
+@pytest.mark.parametrize("bundle", [
+    lib.core_safety_constraints,
+    lib.lipinski_rule_of_five,
+    lib.cns_drug_constraints,
+    lib.cardiology_oriented_constraints,
+    lib.cardiAnx_dual_domain_constraints,
+])
+def test_bundle_builds_framework(bundle):
+    constraints = bundle()
+
+    assert all(isinstance(c, Constraint) for c in constraints)
+    assert len(CuraFrame(constraints).list_constraints()) == len(constraints)
+
+
+@pytest.mark.parametrize("bundle", [
+    lib.core_safety_constraints,
+    lib.cardiAnx_dual_domain_constraints,
+])
+def test_bundle_is_shared_immutable_tuple(bundle):
+    assert isinstance(bundle(), tuple)
+    assert bundle() is bundle()
+
+
+def test_bbb_penetration_returns_shared_tuple():
+    pair = lib.bbb_penetration_logP_psa()
+
+    assert isinstance(pair, tuple)
+    assert pair is lib.bbb_penetration_logP_psa()
+    assert [c.name for c in pair] == ["logP", "polar_surface_area"]
+
+
+def test_equal_constraints_are_deduplicated_across_call_forms():
+    assert lib.hydrogen_bond_donors_max(2) is lib.hydrogen_bond_donors_max(max_hbd=2)
+
+    cns = {c.name: c for c in lib.cns_drug_constraints()}
+    dual = {c.name: c for c in lib.cardiAnx_dual_domain_constraints()}
+
+    assert cns["hydrogen_bond_donors"] is dual["hydrogen_bond_donors"]
+    assert cns["hydrogen_bond_acceptors"] is dual["hydrogen_bond_acceptors"]
+
+
+def test_int_and_float_thresholds_stay_distinct():
+    assert lib.hydrogen_bond_donors_max(2).threshold == 2
+    assert type(lib.hydrogen_bond_donors_max(2.0).threshold) is float
+    assert type(lib.hydrogen_bond_donors_max(2).threshold) is int
+
+
+def test_factory_cache_distinguishes_int_and_float_arguments():
+    float_bounds = lib.molecular_weight_range(150.0, 500.0)
+    int_bounds = lib.molecular_weight_range(150, 500)
+
+    assert str(float_bounds.threshold) == "(150.0, 500.0)"
+    assert str(int_bounds.threshold) == "(150, 500)"
+
+
+@pytest.mark.parametrize("bundle", [
+    "lipinski_rule_of_five",
+    "cns_drug_constraints",
+    "cardiAnx_dual_domain_constraints",
+])
+def test_soa_table_matches_scalar_comparators(bundle):
+    np = pytest.importorskip("numpy")
+    from cura_frame.comparators import evaluate_soa
+
+    constraints = getattr(lib, bundle)()
+    table = getattr(lib, bundle + "_soa")()
+    assert list(table["names"]) == [c.name for c in constraints]
+
+    # Probe each constraint at, around and beyond its finite bounds
+    probes = [float("nan"), float("inf"), -float("inf"), 0.0, 1e12]
+    for lo, hi in zip(table["lo"], table["hi"]):
+        for b in (lo, hi):
+            if np.isfinite(b):
+                probes += [b, np.nextafter(b, -np.inf), np.nextafter(b, np.inf)]
+    values = np.array([[p] * len(constraints) for p in probes])
+
+    mask = evaluate_soa(values, table)
+    expected = [
+        [c.comparator(v, c.threshold) for v, c in zip(row, constraints)]
+        for row in values.tolist()
+    ]
+    assert mask.tolist() == expected
+
+
+def test_soa_table_is_read_only():
+    np = pytest.importorskip("numpy")
+    table = lib.cns_drug_constraints_soa()
+
+    assert table["opcode"].dtype == np.int8
+    with pytest.raises(ValueError):
+        table["lo"][0] = 0.0
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_reduced_precision_soa_table_is_a_conservative_prefilter(dtype):
+    np = pytest.importorskip("numpy")
+    from cura_frame.comparators import OP_RATIO_GT, evaluate_soa
+
+    exact = lib.cardiAnx_dual_domain_constraints_soa()
+    narrow = lib.cardiAnx_dual_domain_constraints_soa(dtype=dtype)
+    assert narrow["lo"].dtype == np.dtype(dtype)
+
+    rng = np.random.default_rng(0)
+    finite_hi = np.where(np.isfinite(exact["hi"]), exact["hi"], exact["lo"] * 2)
+    values = rng.uniform(0.0, 1.0, (2000, len(exact["opcode"]))) * finite_hi * 1.5
+
+    exact_mask = evaluate_soa(values, exact)
+    narrow_mask = evaluate_soa(values, narrow)
+    assert not (exact_mask & ~narrow_mask).any()
+
+    # Exact boundary values still pass the narrow table
+    bounds = np.where(np.isfinite(exact["lo"]), exact["lo"], exact["hi"])
+    assert evaluate_soa(bounds[None, :], narrow)[0][exact["opcode"] != OP_RATIO_GT].all()
+
+
+def test_soa_table_rejects_integer_dtype():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="floating dtype"):
+        lib.cns_drug_constraints_soa(dtype="int8")
+
+
+def test_all_lists_every_public_factory():
+    public = {
+        name for name, obj in vars(lib).items()
+        if callable(obj) and not name.startswith("_")
+        and getattr(obj, "__module__", None) == lib.__name__
+    }
+    assert set(lib.__all__) == public
+
+
+def test_registry_is_bounded():
+    for i in range(lib._REGISTRY_SIZE + 500):
+        lib.logP_max(float(i) + 0.25)
+
+    assert len(lib._CONSTRAINT_REGISTRY) <= lib._REGISTRY_SIZE
+    # Bundles keep sharing their constraints after eviction
+    assert lib.cns_drug_constraints()[0] is lib.cns_drug_constraints()[0]
+
+
+def test_unhashable_arguments_build_uncached():
+    logp, psa = lib.bbb_penetration_logP_psa([2.0, 4.0])
+
+    assert logp.threshold == [2.0, 4.0]
+    assert logp.evaluate(3.0) and not logp.evaluate(5.0)
+    assert psa.threshold == 90.0
+    assert lib.bbb_penetration_logP_psa([2.0, 4.0])[0] is not logp
@@ -21,10 +21,15 @@ from cura_frame import (
     CuraFrame,
     Constraint,
     Candidate,
+    CandidateTable,
+    EvaluationResult,
     EvaluationStatus,
+    Modifier,
     Severity,
     Provenance,
+    Violation,
 )
+from cura_frame.core import PopulationStratification
 from cura_frame.comparators import (
     less_than_or_equal,
     greater_than_or_equal,
@@ -37,11 +42,14 @@ from cura_frame.comparators import (
 # Fixtures
 # -----------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_constraints() -> List[Constraint]:
     """
     Minimal, safety-critical constraint set inspired by CardiAnx-1.
     
+    Module-scoped: constraints are frozen, so every test can share them
+    (tests that need a different set build a new list).
+    
     Represents:
     - BBB penetration limit (logP)
     - Cardiac safety (hERG)
@@ -141,6 +149,16 @@ class TestBasicEvaluation:
         assert not result.has_critical_violations()
         assert result.candidate_name == "safe_candidate"
 
+    def test_clean_acceptance_matches_accepted_factory(
+        self, framework: CuraFrame, safe_candidate: Candidate
+    ):
+        """A clean pass is the same result EvaluationResult.accepted() builds."""
+        result = framework.evaluate(safe_candidate)
+
+        assert result == EvaluationResult.accepted("safe_candidate")
+        assert result.notes == "All constraints satisfied"
+        assert not result.has_warnings()
+
     def test_rejects_candidate_on_single_critical_violation(self, framework: CuraFrame):
         """REJECTED when any CRITICAL constraint fails."""
         candidate = Candidate(
@@ -217,6 +235,70 @@ class TestBasicEvaluation:
         assert violation.severity == Severity.CRITICAL
         assert 0.0 <= violation.confidence <= 1.0
 
+    def test_severity_mask_is_bitor_of_violations(
+        self, framework: CuraFrame, unsafe_candidate: Candidate, safe_candidate: Candidate
+    ):
+        """The mask records which severities occur among the violations."""
+        from cura_frame.core import _SEVERITY_BITS
+
+        rejected = framework.evaluate(unsafe_candidate)
+        expected = 0
+        for v in rejected.violations:
+            expected |= _SEVERITY_BITS[v.severity]
+
+        assert rejected.severity_mask == expected
+        assert rejected.severity_mask == (
+            _SEVERITY_BITS[Severity.CRITICAL] | _SEVERITY_BITS[Severity.SEVERE]
+        )
+        assert framework.evaluate(safe_candidate).severity_mask == 0
+
+    def test_violation_references_its_constraint(self, framework: CuraFrame):
+        """Violations share the constraint object rather than copying it."""
+        candidate = Candidate(
+            name="lipophilic",
+            properties={"logP": 5.5, "hERG_IC50": 20.0, "beta1_selectivity": 150.0}
+        )
+
+        violation = framework.evaluate(candidate).violations[0]
+
+        assert violation.source is framework.get_constraint("logP")
+        assert violation.confidence == 0.9
+
+    def test_fail_fast_stops_at_first_critical_violation(
+        self, framework: CuraFrame, unsafe_candidate: Candidate
+    ):
+        """fail_fast reports one CRITICAL violation; the default reports all."""
+        full = framework.evaluate(unsafe_candidate)
+        fast = framework.evaluate(unsafe_candidate, fail_fast=True)
+
+        assert len(full.violations) == 3
+        assert fast.status == EvaluationStatus.REJECTED
+        assert [v.constraint for v in fast.violations] == ["logP"]
+
+    def test_fail_fast_keeps_low_confidence_warning(
+        self, framework: CuraFrame, unsafe_candidate: Candidate
+    ):
+        """The reported CRITICAL violation keeps its moderate-confidence warning."""
+        full = framework.evaluate(unsafe_candidate)
+        fast = framework.evaluate(unsafe_candidate, fail_fast=True)
+
+        expected = "Violation of 'logP' based on moderate-confidence constraint (0.90)"
+        assert expected in full.warnings
+        assert list(fast.warnings) == [expected]
+
+    def test_fail_fast_checks_critical_constraints_first(self, basic_constraints):
+        """A CRITICAL violation is found even when listed after others."""
+        framework = CuraFrame(list(reversed(basic_constraints)))
+        candidate = Candidate(
+            name="selectivity_and_herg",
+            properties={"logP": 3.0, "hERG_IC50": 5.0, "beta1_selectivity": 20.0}
+        )
+
+        result = framework.evaluate(candidate, fail_fast=True)
+
+        assert [v.constraint for v in result.violations] == ["hERG_IC50"]
+        assert framework.list_constraints()[0] == "beta1_selectivity"
+
 
 # -----------------------------
 # Missing data handling
@@ -358,6 +440,37 @@ class TestPopulationStratification:
         violated = {v.constraint for v in result.violations}
         assert violated == {"hERG_IC50", "beta1_selectivity"}
 
+        # The same population expressed as data
+        framework.add_population(
+            "asthmatic_elderly_data",
+            {
+                "hERG_IC50": Modifier("scale", 1.5),
+                "beta1_selectivity": Modifier("scale", 2.0),
+            }
+        )
+        data_result = framework.evaluate(candidate, population="asthmatic_elderly_data")
+
+        assert data_result.summary() == result.summary()
+
+    def test_modifier_ops(self):
+        """Modifier scales, offsets or sets a threshold, or one range bound."""
+        import pickle
+
+        scalar = Constraint("hERG_IC50", 10.0, greater_than_or_equal, "QT risk")
+        ranged = Constraint("MW", (150.0, 500.0), within_range, "Drug-like size")
+
+        assert Modifier("scale", 1.5)(scalar) == 15.0
+        assert Modifier("offset", -2.0)(scalar) == 8.0
+        assert Modifier("set", 12.0)(scalar) == 12.0
+        assert Modifier("scale", 2.0)(ranged) == (300.0, 1000.0)
+        assert Modifier("scale", 0.9, bound="upper")(ranged) == (150.0, 450.0)
+        assert Modifier("set", 200.0, bound="lower")(ranged) == (200.0, 500.0)
+        assert pickle.loads(pickle.dumps(Modifier("scale", 1.5))) == Modifier("scale", 1.5)
+        with pytest.raises(ValueError, match="Unknown modifier op"):
+            Modifier("multiply", 2.0)
+        with pytest.raises(ValueError, match="bound"):
+            Modifier("scale", 2.0, bound="middle")
+
     def test_unknown_population_fallback_to_base(self, framework: CuraFrame):
         """Unknown population name falls back to base constraints."""
         candidate = Candidate(
@@ -385,6 +498,57 @@ class TestPopulationStratification:
         assert "pediatric" in populations
         assert len(populations) == 2
 
+    def test_modifier_for_unknown_constraint_warns(self, framework: CuraFrame, caplog):
+        """A modifier naming no registered constraint is flagged, not silent."""
+        with caplog.at_level("WARNING", logger="cura_frame.core"):
+            framework.add_population("elderly", {"hERG_ic50": lambda c: c.threshold})
+
+        assert "unknown constraint(s): ['hERG_ic50']" in caplog.text
+
+    def test_modifiers_applied_once_per_population(
+        self, framework: CuraFrame, safe_candidate: Candidate
+    ):
+        """Repeated evaluations reuse the adjusted constraints."""
+        calls = []
+
+        def modifier(c):
+            calls.append(c.name)
+            return c.threshold * 1.5
+
+        framework.add_population("elderly", {"hERG_IC50": modifier})
+        for _ in range(3):
+            framework.evaluate(safe_candidate, population="elderly")
+
+        assert calls == ["hERG_IC50"]
+
+    def test_population_without_matching_modifiers_reuses_base(
+        self, framework: CuraFrame
+    ):
+        """No applicable modifier: the base constraints are returned as-is."""
+        framework.add_population("healthy_adult", {})
+        base = framework.safety_constraints
+
+        assert framework.population_stratifier.apply("healthy_adult", base) is base
+
+    def test_adjusted_constraints_invalidated(
+        self, framework: CuraFrame, basic_constraints, safe_candidate: Candidate
+    ):
+        """Re-registering a population or replacing constraints recomputes."""
+        calls = []
+
+        def modifier(c):
+            calls.append(c.name)
+            return c.threshold
+
+        framework.add_population("elderly", {"hERG_IC50": modifier})
+        framework.evaluate(safe_candidate, population="elderly")
+        framework.add_population("elderly", {"hERG_IC50": modifier})
+        framework.evaluate(safe_candidate, population="elderly")
+        framework.safety_constraints = basic_constraints
+        framework.evaluate(safe_candidate, population="elderly")
+
+        assert len(calls) == 3
+
 
 # -----------------------------
 # Provenance and confidence
@@ -466,6 +630,21 @@ class TestProvenanceTracking:
         assert logP_constraint["provenance"]["confidence"] == 0.9
         assert "doi:10.x/logp-guideline" in logP_constraint["provenance"]["references"]
 
+    def test_constraint_export_json(self, framework: CuraFrame, basic_constraints):
+        """JSON export round-trips to export_constraints() and tracks changes."""
+        import json
+
+        text = framework.export_constraints_json()
+
+        assert json.loads(text) == framework.export_constraints()
+        assert framework.export_constraints_json() is text
+        assert json.loads(framework.export_constraints_json(indent=True)) == json.loads(text)
+
+        framework.add_population("elderly", {})
+        assert json.loads(framework.export_constraints_json())["populations"] == ["elderly"]
+        framework.safety_constraints = basic_constraints[:1]
+        assert len(json.loads(framework.export_constraints_json())["constraints"]) == 1
+
 
 # -----------------------------
 # Auditability and history
@@ -529,6 +708,42 @@ class TestAuditability:
 
         assert len(all_history) == 2
 
+    def test_history_is_bounded(self, basic_constraints):
+        """Only the most recent history_limit results are kept, per name too."""
+        framework = CuraFrame(basic_constraints, history_limit=3)
+        props = {"logP": 3.0, "hERG_IC50": 20.0, "beta1_selectivity": 150.0}
+        for name in ["A", "B", "A", "C", "A"]:
+            framework.evaluate(Candidate(name, props))
+
+        assert [r.candidate_name for r in framework.get_history()] == ["A", "C", "A"]
+        assert len(framework.get_history(candidate_name="A")) == 2
+        assert framework.get_history(candidate_name="B") == []
+
+    def test_history_lookup_is_constant_time(self, basic_constraints, safe_candidate):
+        """Filtering by name reads the per-name index, never the full history."""
+        from collections import deque
+
+        class NoScan(deque):
+            def __iter__(self):
+                raise AssertionError("get_history(name) scanned the full history")
+
+        framework = CuraFrame(basic_constraints)
+        framework.evaluate_batch([safe_candidate] * 9_999 + [Candidate("needle", {})])
+        framework.evaluation_history = NoScan(
+            deque.__iter__(framework.evaluation_history),
+            maxlen=framework.evaluation_history.maxlen
+        )
+
+        [needle] = framework.get_history(candidate_name="needle")
+        assert needle.is_indeterminate()
+        assert len(framework.get_history(candidate_name="safe_candidate")) == 9_999
+
+    def test_history_can_be_disabled(self, basic_constraints, safe_candidate):
+        framework = CuraFrame(basic_constraints, history_limit=0)
+        framework.evaluate(safe_candidate)
+
+        assert framework.get_history() == []
+
 
 # -----------------------------
 # Result summary and display
@@ -556,6 +771,46 @@ class TestResultSummary:
         assert "6.0" in summary  # observed value
         assert "4.0" in summary  # threshold
 
+    def test_summary_reflects_current_fields(self, framework: CuraFrame, unsafe_candidate: Candidate):
+        """summary() is rebuilt from the result's fields on every call."""
+        result = framework.evaluate(unsafe_candidate)
+        result.summary()
+        result.notes = "reviewed"
+        result.candidate_name = "renamed"
+
+        assert "Notes: reviewed" in result.summary()
+        assert "Candidate: renamed" in result.summary()
+
+    def test_severity_queries_follow_mutated_violations(self, framework: CuraFrame, unsafe_candidate: Candidate):
+        """has_critical_violations() sees violations added after construction."""
+        critical = framework.evaluate(unsafe_candidate).violations[0]
+        assert critical.severity == Severity.CRITICAL
+
+        result = EvaluationResult(status=EvaluationStatus.REJECTED)
+        assert not result.has_critical_violations()
+        result.violations.append(critical)
+        assert result.has_critical_violations()
+
+        result.violations = ()
+        assert not result.has_critical_violations()
+        result.violations = (critical,)
+        assert result.has_critical_violations()
+
+    def test_violation_accepts_flat_fields(self, framework: CuraFrame, unsafe_candidate: Candidate):
+        """The flat Violation(...) form builds the same details and to_dict()."""
+        engine = framework.evaluate(unsafe_candidate).violations[0]
+        flat = engine.to_dict()
+
+        by_keyword = Violation(**flat)
+        by_position = Violation(*flat.values())
+
+        for violation in (by_keyword, by_position):
+            assert violation.to_dict() == flat
+            assert str(violation) == str(engine)
+        assert set(flat) == {
+            "constraint", "observed", "threshold", "rationale", "severity", "confidence"
+        }
+
     def test_summary_for_accepted_candidate(
         self,
         framework: CuraFrame,
@@ -687,6 +942,34 @@ class TestConstraintIntrospection:
 
         assert constraint is None
 
+    def test_constraints_cannot_be_mutated_behind_the_index(self, framework: CuraFrame):
+        """The constraint set is a tuple; in-place appends fail loudly."""
+        with pytest.raises(AttributeError):
+            framework.safety_constraints.append(None)
+
+    def test_reassigning_constraints_rebuilds_index(self, framework: CuraFrame, basic_constraints):
+        extra = Constraint("PSA", 90.0, less_than_or_equal, "BBB penetration")
+        framework.safety_constraints = [*basic_constraints, extra]
+
+        assert framework.get_constraint("PSA") is extra
+        with pytest.raises(ValueError, match="Duplicate constraint name"):
+            framework.safety_constraints = [extra, extra]
+        assert framework.get_constraint("PSA") is extra
+
+    def test_plan_is_frozen(self, framework: CuraFrame, safe_candidate: Candidate):
+        """The compiled plan is built once and reused, not rebuilt per call."""
+        import dataclasses
+
+        plan = framework._plan
+        framework.evaluate(safe_candidate)
+        framework.evaluate(safe_candidate, fail_fast=True)
+
+        assert framework._plan is plan
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.names = ()
+        with pytest.raises(TypeError):
+            plan.by_name["logP"] = None
+
     def test_list_all_constraints(self, framework: CuraFrame):
         """Can list all registered constraint names."""
         names = framework.list_constraints()
@@ -701,3 +984,492 @@ class TestConstraintIntrospection:
         assert "constraints" in exported
         assert "populations" in exported
         assert exported["framework_name"] == "TestCuraFrame"
+
+
+# -----------------------------
+# Batch evaluation
+# -----------------------------
+
+class TestBatchEvaluation:
+    """evaluate_batch() must agree exactly with per-candidate evaluate()."""
+
+    @pytest.fixture
+    def mixed_candidates(self) -> List[Candidate]:
+        return [
+            Candidate("safe", {"logP": 3.0, "hERG_IC50": 20.0, "beta1_selectivity": 150.0}),
+            Candidate("boundary", {"logP": 4.0, "hERG_IC50": 10, "beta1_selectivity": 100.0}),
+            Candidate("unsafe", {"logP": 6.0, "hERG_IC50": 5.0, "beta1_selectivity": 20.0}),
+            Candidate("nan", {"logP": float("nan"), "hERG_IC50": 20.0, "beta1_selectivity": float("inf")}),
+            Candidate("missing", {"logP": 3.0, "beta1_selectivity": 150.0}),
+            Candidate("bad_type", {"logP": "high", "hERG_IC50": 20.0, "beta1_selectivity": 150.0}),
+            Candidate("empty", {}),
+        ]
+
+    @pytest.fixture
+    def all_families(self, basic_constraints) -> List[Constraint]:
+        """One constraint per comparator family (LE, GE, ratio-GT, range)."""
+        return basic_constraints + [
+            Constraint("MW", (150.0, 500.0), within_range, "Drug-like size", Severity.SEVERE)
+        ]
+
+    @pytest.mark.parametrize("population", [None, "elderly"])
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_batch_matches_scalar(self, all_families, mixed_candidates, strict, population):
+        scalar = CuraFrame(all_families)
+        batch = CuraFrame(all_families)
+        for framework in (scalar, batch):
+            framework.add_population("elderly", {
+                "hERG_IC50": lambda c: c.threshold * 1.5,
+                "MW": lambda c: (c.threshold[0], 450.0),
+            })
+        candidates = mixed_candidates + [
+            Candidate("mw_ok", {"logP": 3.0, "hERG_IC50": 20.0, "beta1_selectivity": 150.0, "MW": 320.0}),
+            Candidate("mw_high", {"logP": 3.0, "hERG_IC50": 12.0, "beta1_selectivity": 150.0, "MW": 480}),
+            Candidate("mw_edge", {"logP": 3.0, "hERG_IC50": 15.0, "beta1_selectivity": 150.0, "MW": 150.0}),
+        ]
+
+        expected = [
+            scalar.evaluate(c, population=population, strict=strict) for c in candidates
+        ]
+        results = batch.evaluate_batch(candidates, population=population, strict=strict)
+
+        assert [r.summary() for r in results] == [r.summary() for r in expected]
+        assert [r.summary() for r in batch.get_history()] == [
+            r.summary() for r in scalar.get_history()
+        ]
+
+    def test_batch_applies_population_modifiers(self, framework: CuraFrame, safe_candidate):
+        framework.add_population("elderly", {"hERG_IC50": lambda c: c.threshold * 1.5})
+        borderline = Candidate(
+            "borderline", {"logP": 3.0, "hERG_IC50": 12.0, "beta1_selectivity": 150.0}
+        )
+
+        results = framework.evaluate_batch([safe_candidate, borderline], population="elderly")
+
+        assert [r.status for r in results] == [
+            EvaluationStatus.ACCEPTED,
+            EvaluationStatus.REJECTED,
+        ]
+
+    def test_op_code_identifies_builtin_comparators(self, basic_constraints):
+        from cura_frame.comparators import OP_LE, OP_GE, OP_RATIO_GT
+
+        assert [c.op_code for c in basic_constraints] == [OP_LE, OP_GE, OP_RATIO_GT]
+        custom = Constraint("x", 1.0, lambda v, t: v == t, "custom")
+        assert custom.op_code is None
+
+    def test_numba_fastpath_if_available(self, basic_constraints, mixed_candidates):
+        pytest.importorskip("numba")
+        from cura_frame._kernels import threshold_values
+
+        framework = CuraFrame(basic_constraints)
+        results = framework.evaluate_batch(mixed_candidates)
+
+        assert threshold_values.signatures  # compiled, not the Python fallback
+        assert [r.summary() for r in results] == [
+            CuraFrame(basic_constraints).evaluate(c).summary() for c in mixed_candidates
+        ]
+
+    @pytest.mark.parametrize("use_numba", [False, True])
+    @pytest.mark.parametrize("comparator, threshold", [
+        (less_than_or_equal, (1.0, 20.0)),
+        (greater_than_or_equal, (1.0, 20.0)),
+        (within_range, (1.0, 5.0, 20.0)),
+        (within_range, 20.0),
+        (ratio_greater_than, (1.0, 2.0, 3.0)),
+    ])
+    def test_malformed_thresholds_match_scalar(
+        self, monkeypatch, use_numba, comparator, threshold
+    ):
+        from cura_frame import _jit
+
+        if use_numba and not _jit.HAS_NUMBA:
+            pytest.skip("Numba not installed")
+        monkeypatch.setattr(_jit, "HAS_NUMBA", use_numba)
+        constraints = [Constraint("x", threshold, comparator, "malformed")]
+        candidates = [Candidate("a", {"x": 5.0}), Candidate("b", {"x": 10.0})]
+
+        expected = [CuraFrame(constraints).evaluate(c).summary() for c in candidates]
+        batch = CuraFrame(constraints).evaluate_batch(candidates)
+        table = CuraFrame(constraints).evaluate_table(CandidateTable(candidates))
+
+        assert [r.summary() for r in batch] == expected
+        assert [r.summary() for r in table] == expected
+
+    def test_inverted_range_bounds_reject_in_both_paths(self):
+        constraints = [Constraint("MW", (500.0, 150.0), within_range, "hand-built, inverted")]
+        candidates = [Candidate("a", {"MW": 300.0})]
+
+        assert CuraFrame(constraints).evaluate(candidates[0]).is_rejected()
+        assert CuraFrame(constraints).evaluate_batch(candidates)[0].is_rejected()
+
+    def test_batch_custom_comparators_match_scalar(self, mixed_candidates):
+        """Directly bound custom comparators agree with evaluate(), errors included."""
+        constraints = [
+            Constraint("hERG_IC50", 10.0, lambda v, t: v >= t, "custom"),
+            Constraint("logP", 4.0, lambda v, t: v <= t, "raises on strings"),
+        ]
+
+        expected = [CuraFrame(constraints).evaluate(c) for c in mixed_candidates]
+        results = CuraFrame(constraints).evaluate_batch(mixed_candidates)
+
+        assert [r.summary() for r in results] == [r.summary() for r in expected]
+
+    def test_empty_batch(self, framework: CuraFrame):
+        assert framework.evaluate_batch([]) == []
+        assert framework.get_history() == []
+
+
+class TestCandidateTable:
+    """evaluate_table() must agree with per-candidate evaluate()."""
+
+    @pytest.fixture
+    def numeric_candidates(self) -> List[Candidate]:
+        return [
+            Candidate("safe", {"logP": 3.0, "hERG_IC50": 20.0, "beta1_selectivity": 150.0}),
+            Candidate("boundary", {"logP": 4.0, "hERG_IC50": 10.0, "beta1_selectivity": 100.0}),
+            Candidate("unsafe", {"logP": 6.0, "hERG_IC50": 5.0, "beta1_selectivity": 20.0}),
+            Candidate("missing", {"logP": 3.0, "beta1_selectivity": 150.0}),
+            Candidate("empty", {}),
+        ]
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_table_matches_scalar(self, basic_constraints, numeric_candidates, strict):
+        scalar = CuraFrame(basic_constraints)
+        table = CuraFrame(basic_constraints)
+
+        expected = [scalar.evaluate(c, strict=strict) for c in numeric_candidates]
+        results = table.evaluate_table(CandidateTable(numeric_candidates), strict=strict)
+
+        assert [r.summary() for r in results] == [r.summary() for r in expected]
+        assert [r.summary() for r in table.get_history()] == [
+            r.summary() for r in scalar.get_history()
+        ]
+
+    def test_table_falls_back_for_custom_comparators(self, numeric_candidates):
+        constraints = [Constraint("hERG_IC50", 10.0, lambda v, t: v >= t, "custom")]
+
+        results = CuraFrame(constraints).evaluate_table(CandidateTable(numeric_candidates))
+
+        assert [r.status for r in results] == [
+            CuraFrame(constraints).evaluate(c).status for c in numeric_candidates
+        ]
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_table_from_array_matches_rows(self, basic_constraints, numeric_candidates, order):
+        np = pytest.importorskip("numpy")
+        rows = CandidateTable(numeric_candidates)
+        properties = list(rows.columns)
+        values = np.array(
+            np.column_stack([rows.columns[p] for p in properties]), order=order
+        )
+
+        table = CandidateTable.from_array(values, properties, rows.names)
+
+        assert np.shares_memory(table.columns[properties[0]], values)
+        assert [r.summary() for r in CuraFrame(basic_constraints).evaluate_table(table)] == [
+            r.summary() for r in CuraFrame(basic_constraints).evaluate_table(rows)
+        ]
+        assert table.row(3) == Candidate("missing", {"logP": 3.0, "beta1_selectivity": 150.0})
+
+    def test_table_from_array_checks_shape(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="shape"):
+            CandidateTable.from_array([[1.0, 2.0]], ["logP"], ["a"])
+        with pytest.raises(ValueError, match="Duplicate"):
+            CandidateTable.from_array([[1.0, 2.0]], ["logP", "logP"], ["a"])
+
+    def test_table_rejects_non_numeric_values(self):
+        with pytest.raises(ValueError, match="non-numeric"):
+            CandidateTable([Candidate("bad", {"logP": "high"})])
+
+    def test_table_layout(self, numeric_candidates):
+        table = CandidateTable(numeric_candidates)
+
+        assert len(table) == 5
+        assert table.names[:2] == ["safe", "boundary"]
+        assert table.columns["hERG_IC50"].dtype.name == "float64"
+
+
+class TestConcurrentEvaluation:
+    """evaluate_many() must agree with sequential evaluate()."""
+
+    @staticmethod
+    def candidates(n: int) -> List[Candidate]:
+        return [
+            Candidate(
+                f"c{i}",
+                {"logP": 2.0 + (i % 5) * 0.6, "hERG_IC50": 5.0 + i % 20, "beta1_selectivity": 150.0},
+            )
+            for i in range(n)
+        ]
+
+    @pytest.mark.parametrize("process_pool", [False, True])
+    def test_parallel_matches_sequential(self, basic_constraints, process_pool):
+        candidates = self.candidates(40)
+        sequential = CuraFrame(basic_constraints)
+        parallel = CuraFrame(basic_constraints)
+
+        expected = [sequential.evaluate(c) for c in candidates]
+        results = parallel.evaluate_many(
+            candidates, workers=2, process_pool=process_pool, min_parallel=0
+        )
+
+        assert [r.summary() for r in results] == [r.summary() for r in expected]
+        assert [r.candidate_name for r in parallel.get_history()] == [c.name for c in candidates]
+
+    def test_process_pool_after_batch_kernels(self, basic_constraints):
+        """Worker processes must start cleanly after compiled kernels ran."""
+        candidates = self.candidates(40)
+        framework = CuraFrame(basic_constraints)
+
+        batch = framework.evaluate_batch(candidates)
+        results = framework.evaluate_many(
+            candidates, workers=2, process_pool=True, min_parallel=0
+        )
+
+        assert [r.summary() for r in results] == [r.summary() for r in batch]
+
+    def test_small_batches_run_inline(self, framework: CuraFrame, monkeypatch):
+        import cura_frame.core as core
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool should not start")
+
+        monkeypatch.setattr(core, "ThreadPoolExecutor", no_pool)
+        results = framework.evaluate_many(self.candidates(3), workers=4)
+
+        assert len(results) == 3
+
+
+class TestResultCache:
+    """Opt-in memoization of constraint outcomes."""
+
+    @staticmethod
+    def counting_framework(cache_size: int):
+        calls = []
+
+        def at_most(value, threshold):
+            calls.append(value)
+            return value <= threshold
+
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, at_most, "lipophilicity")],
+            cache_size=cache_size,
+        )
+        return framework, calls
+
+    def test_repeated_values_are_evaluated_once(self):
+        framework, calls = self.counting_framework(cache_size=16)
+        for _ in range(3):
+            framework.evaluate(Candidate("a", {"logP": 3.0}))
+
+        assert calls == [3.0]
+        assert framework._check.cache_info().hits == 2
+
+    def test_cache_is_off_by_default(self):
+        framework, calls = self.counting_framework(cache_size=0)
+        for _ in range(3):
+            framework.evaluate(Candidate("a", {"logP": 3.0}))
+
+        assert calls == [3.0, 3.0, 3.0]
+
+    def test_population_adjusted_constraints_do_not_share_entries(self):
+        framework, calls = self.counting_framework(cache_size=16)
+        framework.add_population("strict", {"logP": lambda c: c.threshold - 2.0})
+        candidate = Candidate("a", {"logP": 3.0})
+
+        assert framework.evaluate(candidate).is_accepted()
+        assert framework.evaluate(candidate, population="strict").is_rejected()
+        assert len(calls) == 2
+
+    def test_builtin_comparators_bypass_cache(self, basic_constraints, safe_candidate):
+        framework = CuraFrame(basic_constraints, cache_size=16)
+        framework.evaluate(safe_candidate)
+
+        assert framework._check.cache_info().currsize == 0
+
+    def test_unhashable_threshold_is_evaluated_uncached(self):
+        framework = CuraFrame(
+            [Constraint("scaffold", ["A", "B"], lambda v, t: v in t, "allowed scaffolds")],
+            cache_size=16,
+        )
+
+        assert framework.evaluate(Candidate("a", {"scaffold": "A"})).is_accepted()
+        assert framework.evaluate(Candidate("b", {"scaffold": "C"})).is_rejected()
+
+    def test_comparator_errors_are_reported_not_cached(self):
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, lambda v, t: v <= t, "lipophilicity")],
+            cache_size=16,
+        )
+        result = framework.evaluate(Candidate("a", {"logP": "high"}))
+
+        assert result.is_indeterminate()
+        assert "Cannot compare str to float" in result.notes
+
+    def test_unhashable_values_bypass_cache(self):
+        framework = CuraFrame(
+            [Constraint("tags", 2, lambda v, t: len(v) <= t, "few tags")],
+            cache_size=16,
+        )
+
+        assert framework.evaluate(Candidate("a", {"tags": ["x"]})).is_accepted()
+        assert framework._check.cache_info().currsize == 0
+
+    def test_cached_evaluate_returns_equivalent_result(self):
+        calls = []
+
+        def at_most(value, threshold):
+            calls.append(value)
+            return value <= threshold
+
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, at_most, "lipophilicity")],
+            result_cache_size=16,
+        )
+        first = framework.evaluate(Candidate("a", {"logP": 5.0}))
+        second = framework.evaluate(Candidate("b", {"logP": 5.0}))
+
+        assert calls == [5.0]
+        assert second.status == first.status
+        assert second.violations == first.violations
+        assert isinstance(second.violations, tuple)
+        assert second.candidate_name == "b"
+        assert framework.get_history("b") == [second]
+
+    def test_result_cache_keys_on_context_and_value_type(self):
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, lambda v, t: v <= t, "lipophilicity")],
+            result_cache_size=16,
+        )
+        framework.add_population("strict", {"logP": lambda c: c.threshold - 2.0})
+
+        assert framework.evaluate(Candidate("a", {"logP": 3.0})).is_accepted()
+        assert framework.evaluate(Candidate("a", {"logP": 3.0}), population="strict").is_rejected()
+        assert framework.evaluate(Candidate("a", {}), strict=False).is_indeterminate()
+        assert framework.evaluate(Candidate("a", {})).is_indeterminate()
+        assert framework.evaluate(Candidate("a", {"logP": 5})).violations[0].observed == 5
+        assert "observed 5.0" in str(framework.evaluate(Candidate("a", {"logP": 5.0})).violations[0])
+
+    def test_result_cache_invalidated_by_configuration_changes(self):
+        constraint = Constraint("logP", 4.0, lambda v, t: v <= t, "lipophilicity")
+        framework = CuraFrame([constraint], result_cache_size=16)
+        candidate = Candidate("a", {"logP": 3.0})
+
+        assert framework.evaluate(candidate, population="p").is_accepted()
+        framework.add_population("p", {"logP": lambda c: c.threshold - 2.0})
+        assert framework.evaluate(candidate, population="p").is_rejected()
+        framework.safety_constraints = [constraint.with_modifier(lambda c: 1.0)]
+        assert framework.evaluate(candidate).is_rejected()
+
+    def test_result_cache_invalidated_through_stratifier(self):
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, lambda v, t: v <= t, "lipophilicity")],
+            result_cache_size=16,
+        )
+        candidate = Candidate("a", {"logP": 3.5})
+
+        assert framework.evaluate(candidate, population="p").is_accepted()
+        framework.population_stratifier.add_population("p", {"logP": Modifier("set", 3.0)})
+        assert framework.evaluate(candidate, population="p").is_rejected()
+
+        framework.population_stratifier = PopulationStratification()
+        assert framework.evaluate(candidate, population="p").is_accepted()
+
+    def test_result_cache_is_bounded(self):
+        framework = CuraFrame(
+            [Constraint("logP", 4.0, lambda v, t: v <= t, "lipophilicity")],
+            result_cache_size=2,
+        )
+        for value in (1.0, 2.0, 3.0, 1.0):
+            framework.evaluate(Candidate("a", {"logP": value}))
+
+        assert len(framework._results) == 2
+
+
+# -----------------------------
+# Immutability
+# -----------------------------
+
+class TestImmutability:
+    """Constraints and provenance are frozen value objects."""
+
+    def test_constraint_is_frozen(self, framework: CuraFrame):
+        """Constraints cannot be modified in place."""
+        import dataclasses
+
+        constraint = framework.get_constraint("logP")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            constraint.threshold = 5.0
+
+    def test_with_modifier_returns_new_constraint(self, framework: CuraFrame):
+        """Modifiers produce a new constraint and leave the original intact."""
+        constraint = framework.get_constraint("logP")
+
+        adjusted = constraint.with_modifier(lambda c: c.threshold * 0.9)
+
+        assert adjusted is not constraint
+        assert adjusted.threshold == pytest.approx(3.6)
+        assert constraint.threshold == 4.0
+
+    def test_apply_modifier_fails_loudly(self, framework: CuraFrame):
+        """The old in-place API must not silently leave thresholds unadjusted."""
+        import dataclasses
+
+        constraint = framework.get_constraint("logP")
+
+        with pytest.raises(dataclasses.FrozenInstanceError, match="with_modifier"):
+            constraint.apply_modifier(lambda c: c.threshold * 0.9)
+        assert constraint.threshold == 4.0
+
+    def test_evaluation_records_are_slotted(self, framework: CuraFrame, unsafe_candidate):
+        """Results, violations and candidates carry no per-instance __dict__."""
+        import sys
+
+        if sys.version_info < (3, 10):
+            pytest.skip("slotted dataclasses need Python 3.10+")
+        result = framework.evaluate(unsafe_candidate)
+
+        for obj in (result, result.violations[0], unsafe_candidate):
+            assert not hasattr(obj, "__dict__")
+
+    def test_constraint_is_slotted(self, framework: CuraFrame):
+        """Constraints and provenance carry no per-instance __dict__."""
+        import sys
+
+        if sys.version_info < (3, 10):
+            pytest.skip("slotted dataclasses need Python 3.10+")
+        constraint = framework.get_constraint("logP")
+
+        assert "__dict__" not in dir(constraint)
+        assert "__dict__" not in dir(constraint.provenance)
+
+    def test_constraint_names_interned(self):
+        """Names built at runtime are interned, so lookups match by identity."""
+        import sys
+
+        name = "".join(["hERG", "_IC50"])
+        constraint = Constraint(name, 10.0, greater_than_or_equal, "QT risk")
+
+        assert constraint.name is sys.intern("hERG_IC50")
+        assert constraint.with_modifier(lambda c: 15.0).name is constraint.name
+
+    def test_candidate_fingerprint(self):
+        """Fingerprints identify property content, independent of name and order."""
+        a = Candidate("a", {"logP": 3.0, "hERG_IC50": 20.0})
+        b = Candidate("b", {"hERG_IC50": 20.0, "logP": 3.0})
+
+        assert a.fingerprint() == b.fingerprint()
+        assert len(a.fingerprint()) == 16
+        assert Candidate("c", {"logP": 3, "hERG_IC50": 20.0}).fingerprint() != a.fingerprint()
+        a.properties["logP"] = 3.5
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_provenance_references_stored_as_tuple(self):
+        """Reference lists are normalized to tuples."""
+        prov = Provenance(source_type="x", confidence=0.5, references=["a", "b"])
+
+        assert prov.references == ("a", "b")
+        assert hash(prov) == hash(Provenance("x", 0.5, ("a", "b")))
@@ -0,0 +1,35 @@
+"""
+CuraFrame Core Benchmarks
+
+Times bulk evaluation so that changes to the batch paths (NumPy,
+Numba kernels) can be judged on measurements.
+
+Requires the optional pytest-benchmark plugin; skipped without it.
+Run only the benchmarks with:
+    pytest tests/test_core_bench.py --benchmark-only
+"""
+
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from test_core import basic_constraints, framework, safe_candidate  # noqa: F401  (fixtures)
+
+from cura_frame import Modifier
+
+
+N_CANDIDATES = 10_000
+
+
+@pytest.mark.benchmark(group="evaluate_batch")
+@pytest.mark.parametrize("population", [None, "elderly"])
+def test_bench_evaluate_batch(benchmark, framework, safe_candidate, population):
+    framework.add_population("elderly", {"hERG_IC50": Modifier("scale", 1.5)})
+    candidates = [replace(safe_candidate, name=f"c{i}") for i in range(N_CANDIDATES)]
+
+    results = benchmark(framework.evaluate_batch, candidates, population=population)
+
+    assert len(results) == N_CANDIDATES
+    assert all(r.is_accepted() for r in results)